@@ -1,5 +1,3 @@
-import json
-
 import streamlit as st
 from annotated_text import annotated_text
 
@@ -28,10 +26,9 @@ with st.expander('The state of peace in Balkans'):
     st.markdown('Out of seven BPI domains, the Western Balkan Region performed excellently in only one – political violence. At the same time, it gained poor scores in domains of environmental sustainability and fighting crime and average scores in regional and international relations, state capacity, political pluralism, and socio-economic development. That is to say that the region can be considered highly peaceful in terms of negative peace or the absence of direct (armed) violence. Nonetheless, the level of positive peace (the absence of structural violence) remains between poor and average, although with an upward trend.')
 
 year = st.selectbox('Please select year:', options=[2022, 2023, 2024], index=2)
-dexi_bpi.__model = dexi_bpi.select_year(year)
 
 # MAP
-df, cat_vals = dexi_bpi.get_alternatives_domain('BPI')
+df, cat_vals = dexi_bpi.cached_alternatives_domain(year, 'BPI')
 df['Color'] = df['Values'].map({1: '#AE0017', 2: '#A35600', 3: 'gray', 4: '#7B8D00', 5: 'lightgreen'})
 color_map = {1: '#AE0017', 2: '#A35600', 3: 'gray', 4: '#7B8D00', 5: 'lightgreen'}
 
@@ -45,8 +42,7 @@ for col in range(num_vals):
         annotated_text((f'{cat_vals[col]}', '', colors[col]))
 st.table(df.drop(['Values', 'Color'], axis=1))
 
-with open('model/custom.geo.json', 'r', encoding='utf-8') as file:
-    geojson_data = json.load(file)
+geojson_data = dexi_bpi.get_geojson()
 
 fig = px.choropleth(df,
                     geojson=geojson_data,
@@ -0,0 +1,48 @@
+"""
+Benchmark of parallel evaluation of large lists of alternatives.
+
+Evaluates randomly generated alternatives of the BPI 2024 model with
+:py:func:`dexipy.eval.evaluate` and with :py:func:`dexipy.parallel.evaluate_parallel`
+using an increasing number of worker processes, and reports speedups relative to
+the single-process evaluation.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_evaluate_parallel [n_alternatives] [chunk_size]
+"""
+
+import os
+import random
+import sys
+import time
+import dexipy.dexi as dxi
+from dexipy.parallel import evaluate_parallel
+
+def random_alternatives(model, count, seed = 0):
+    rnd = random.Random(seed)
+    scales = [(att.id, att.scale.count()) for att in model.basic]
+    return [dict({"name": f"A{i}"}, **{id: rnd.randrange(size) for id, size in scales}) for i in range(count)]
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    chunk_size = int(sys.argv[2]) if len(sys.argv) > 2 else 2_000
+    model = dxi.read_dexi("model/BPI 2024.dxi")
+    alts = random_alternatives(model, count)
+
+    base, expected = timed(lambda: model.evaluate(alts))
+    print(f"{count} alternatives, chunk size {chunk_size}")
+    print(f"{'workers':>8} {'time':>10} {'alts/s':>12} {'speedup':>9}")
+    print(f"{'evaluate':>8} {base:9.2f}s {count / base:12.0f} {1.0:8.2f}x")
+    workers = 1
+    while True:
+        elapsed, result = timed(lambda: list(evaluate_parallel(model, alts, chunk_size = chunk_size, workers = workers)))
+        assert result == expected
+        print(f"{workers:>8} {elapsed:9.2f}s {count / elapsed:12.0f} {base / elapsed:8.2f}x")
+        if workers >= (os.cpu_count() or 1):
+            break
+        workers = min(2 * workers, os.cpu_count() or 1)
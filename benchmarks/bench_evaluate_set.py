@@ -0,0 +1,51 @@
+"""
+Benchmark of set-based evaluation of tabular functions with full-range ("*") inputs.
+
+Compares :py:func:`dexipy.eval.evaluate_as_set`, which uses
+:py:func:`dexipy.eval.evaluate_tabular_as_set` for crisp tables, with the plain enumeration
+of all combinations of input values.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_evaluate_set
+"""
+
+import timeit
+import dexipy.dexi as dxi
+import dexipy.utils as utl
+import dexipy.values as vls
+from dexipy.dexi import DexiTabularFunction
+from dexipy.eval import evaluate_as_set
+
+def enumerate_as_set(funct, inp_values):
+    inp_vals = tuple(vls.dexi_value_as_set(val) for val in inp_values)
+    result = set()
+    for args in utl.cartesian_product(*inp_vals):
+        eval = funct.evaluate(args)
+        if eval is None:
+            return None
+        result.update(vls.dexi_value_as_set(eval))
+    return result
+
+def monotone_table(dim):
+    values = [min(sum(args) // len(dim), 4) for args in utl.cartesian_product(*(range(d) for d in dim))]
+    return DexiTabularFunction(dim = dim, values = values)
+
+def bench(label, funct, inp_values, number):
+    assert evaluate_as_set(funct, inp_values) == enumerate_as_set(funct, inp_values)
+    fast = timeit.timeit(lambda: evaluate_as_set(funct, inp_values), number = number) / number
+    slow = timeit.timeit(lambda: enumerate_as_set(funct, inp_values), number = number) / number
+    print(f"{label:<40} {slow * 1e6:12.1f} us {fast * 1e6:12.1f} us {slow / fast:8.1f}x")
+
+if __name__ == "__main__":
+    print(f"{'function':<40} {'enumeration':>15} {'fast path':>15} {'speedup':>9}")
+    for dim in [(5, 5), (5, 5, 5), (5, 5, 5, 5), (5, 5, 5, 5, 5)]:
+        funct = monotone_table(dim)
+        stars = [set(range(d)) for d in dim]
+        bench("x".join(str(d) for d in dim) + " monotone, all '*'", funct, stars, 20)
+
+    model = dxi.read_dexi("model/BPI 2024.dxi")
+    for att in model.attributes:
+        if isinstance(att.funct, DexiTabularFunction) and att.funct.nvals() >= 50:
+            stars = [set(range(d)) for d in att.funct.dim]
+            bench(f"BPI 2024 {att.id} ({att.funct.funct_str()})", att.funct, stars, 200)
@@ -0,0 +1,89 @@
+import json
+import math
+
+import dexi_bpi
+
+# Builds the compact GeoJSON used by the map on the Home page: only the features named in the
+# models' alternatives, only their 'name' property, and geometry simplified with Douglas-Peucker.
+# At projection_scale=20, a pixel spans roughly 0.02 degrees, so the default tolerance and the
+# rounding of coordinates to three decimals are below what can be seen on the map.
+#
+# The app only reads the target file, so it must be rebuilt and committed whenever the source
+# file or the countries in the models change. Run from the repository root:
+#
+#     python build_geojson.py
+
+SOURCE = 'model/custom.geo.json'
+TARGET = dexi_bpi.geojson_file
+TOLERANCE = 0.01
+DECIMALS = 3
+
+def __distance(point, start, end):
+    dx, dy = end[0] - start[0], end[1] - start[1]
+    if dx == 0 and dy == 0:
+        return math.hypot(point[0] - start[0], point[1] - start[1])
+
+    return abs(dy * point[0] - dx * point[1] + end[0] * start[1] - end[1] * start[0]) / math.hypot(dx, dy)
+
+def simplify_line(points, tolerance):
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        index, dmax = first, 0.0
+        for i in range(first + 1, last):
+            d = __distance(points[i], points[first], points[last])
+            if d > dmax:
+                index, dmax = i, d
+        if dmax > tolerance:
+            keep[index] = True
+            stack.append((first, index))
+            stack.append((index, last))
+
+    return [point for point, kept in zip(points, keep) if kept]
+
+def simplify_ring(ring, tolerance):
+    # A closed ring is split at its point farthest from the first one, so that both halves are
+    # simplified as open lines and the ring keeps at least four points.
+    if len(ring) <= 4:
+        return ring
+    far = max(range(len(ring)), key=lambda i: math.hypot(ring[i][0] - ring[0][0], ring[i][1] - ring[0][1]))
+    ring = simplify_line(ring[:far + 1], tolerance)[:-1] + simplify_line(ring[far:], tolerance)
+
+    return ring if len(ring) >= 4 else None
+
+def simplify_geometry(geometry, tolerance, decimals):
+    def rings(polygon):
+        simplified = [simplify_ring(ring, tolerance) for ring in polygon]
+        return [[[round(x, decimals), round(y, decimals)] for x, y in ring] for ring in simplified if ring is not None]
+
+    if geometry['type'] == 'Polygon':
+        return {'type': 'Polygon', 'coordinates': rings(geometry['coordinates'])}
+    if geometry['type'] == 'MultiPolygon':
+        return {'type': 'MultiPolygon', 'coordinates': [rings(polygon) for polygon in geometry['coordinates']]}
+
+    return geometry
+
+def build_geojson(names, source=SOURCE, target=TARGET, tolerance=TOLERANCE, decimals=DECIMALS):
+    with open(source, 'r', encoding='utf-8') as file:
+        geojson_data = json.load(file)
+
+    features = {}
+    for feature in geojson_data['features']:
+        name = feature['properties'].get('name')
+        if name in names and name not in features:
+            features[name] = {'type': 'Feature',
+                              'properties': {'name': name},
+                              'geometry': simplify_geometry(feature['geometry'], tolerance, decimals)}
+
+    compact = {'type': 'FeatureCollection', 'features': [features[name] for name in names if name in features]}
+    with open(target, 'w', encoding='utf-8') as file:
+        json.dump(compact, file, separators=(',', ':'))
+
+    return compact
+
+if __name__ == '__main__':
+    names = list(dict.fromkeys(alt['name'] for year in dexi_bpi.years for alt in dexi_bpi.get_model(year).alternatives))
+    compact = build_geojson(names)
+    print(f"{TARGET}: {len(compact['features'])} features")
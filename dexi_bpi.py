@@ -1,17 +1,124 @@
+import copy
+import functools
+import json
+import threading
+import weakref
+
 import pandas as pd
 import numpy as np
 
-import dexipy.dexi as dxi
-
-__model = dxi.read_dexi('model/BPI 2023.dxi')
+from dexipy.registry import DexiModelRegistry
+
+# Caching hooks: cache_resource keeps a single shared result per key (models, geometry), while
+# cache_data hands out a copy of the cached result to each caller, so pages may modify it.
+# Under Streamlit they map onto its resource and data caches; otherwise, onto plain dictionaries.
+try:
+    import streamlit as st
+except ImportError:
+    st = None
+
+def __cache_key(args):
+    return tuple(tuple(sorted(arg.items())) if isinstance(arg, dict) else arg for arg in args)
+
+def __cache(func, copy_result):
+    results = {}
+    lock = threading.RLock()
+
+    # the lock makes concurrent first requests compute a result only once
+    @functools.wraps(func)
+    def cached(*args):
+        key = __cache_key(args)
+        with lock:
+            if key not in results:
+                results[key] = func(*args)
+
+        return copy.deepcopy(results[key]) if copy_result else results[key]
+
+    cached.clear = results.clear
+    return cached
+
+def cache_resource(func):
+    if st is not None:
+        return st.cache_resource(func)
+
+    return __cache(func, copy_result=False)
+
+def cache_data(func):
+    if st is not None:
+        return st.cache_data(func)
+
+    return __cache(func, copy_result=True)
+
+# Columnar copy of a model's alternatives, built once per model: for each attribute name,
+# value indices (undefined as 0), scale value names, value names and data table texts of all
+# alternatives. Arrays are read-only and shared by the data frames returned below.
+class AlternativeStore:
+    def __init__(self, model):
+        self.countries = self.__column([alt['name'] for alt in model.alternatives])
+        self.rows = {name: i for i, name in enumerate(self.countries)}
+        self.codes = {}
+        self.categories = {}
+        self.labels = {}
+        self.texts = {}
+
+        for att in model.attributes[1:]:
+            cat_vals = att.scale.scale_str().replace(' (+)', '').replace(' (-)', '').split(';')
+            values = [alt[att.id] for alt in model.alternatives]
+            codes = [0 if val is None else min(val) if isinstance(val, set) else val for val in values]
+            texts = ["" if val is None else list(val)[0] if isinstance(val, set) else cat_vals[val] for val in values]
+
+            self.codes[att.name] = self.__column(codes, int)
+            self.categories[att.name] = cat_vals
+            self.labels[att.name] = self.__column([cat_vals[code] for code in codes])
+            self.texts[att.name] = self.__column(texts)
+
+    @staticmethod
+    def __column(values, dtype=object):
+        column = np.array(values, dtype=dtype)
+        column.setflags(write=False)
+        return column
+
+__stores = weakref.WeakKeyDictionary()
+
+def get_store(model):
+    store = __stores.get(model)
+    if store is None:
+        store = AlternativeStore(model)
+        __stores[model] = store
+
+    return store
+
+# Models are loaded once per process and never modified afterwards, so the same handles are
+# shared by all sessions. Pages obtain a handle with get_model(year) and pass it to the functions
+# below instead of changing module state.
+years = [2022, 2023, 2024]
+default_year = 2023
+geojson_file = 'model/bpi.geo.json'
+
+@cache_resource
+def load_registry():
+    # registered models are frozen, so the registry enables their evaluation caches;
+    # snapshots written next to the model files on the first start make later cold starts skip parsing
+    registry = DexiModelRegistry(eval_cache_size=1024, subtrees=True)
+    for year in years:
+        model = registry.load(year, f'model/BPI {year}.dxi', snapshots=True)
+        get_store(model)
+
+    return registry
+
+registry = load_registry()
+
+def get_model(year=None):
+    if year is None:
+        year = default_year
+
+    return registry[year]
 
 def select_year(year):
-    model = dxi.read_dexi(f'model/BPI {year}.dxi')
+    return get_model(year)
 
-    return model
-
-countries = [__model.alternatives[i]['name'] for i in range(len(__model.alternatives))]
-attributes = [__model.attributes[i].name for i in range(len(__model.attributes))][1:]
+countries = list(get_store(get_model()).countries)
+attributes = [att.name for att in get_model().non_root]
 description_text = {'Political Violence': 'Reduction of violence is a necessary, *negative* condition of peace. Political violence (direct, organised and with mass consequences), in particular, should be eliminated or reduced to consider a situation peaceful. Therefore, this domain covers various acts of political violence, such as internal and regional armed conflicts, violent crises, rebellions, violent protests, and terrorism and violent extremism acts. Regarding local knowledge, the approach of this domain primarily focuses on contextually specific patterns of violence (e.g., violence inspired by ethnoreligious rivalries and grievances, *culture of extremism* as a legacy of 1990s wars). The methodology includes relevant indices and data sets as well as document and discourse analysis (e.g., national security and defence strategies, government and NGO reports, media reports).', 
                     'Armed Conflicts and Conflict Risk': 'Armed conflict is the most destructive form of political violence, while its absence is the minimum condition for peace. Under armed conflicts, we understand “a contested incompatibility that concerns government and/or territory over which the use of armed force between the military forces of two parties, of which at least one is the government of a state, has resulted in at least 25 battle-related deaths each year” (UCDP 2014). This domain also covers the assessment of armed conflict risks or the possibility for an armed conflict to erupt. Furthermore, it includes other violent acts, such as armed rebellions, inter-communal violence, or violent incidents between the states since they can serve as a prelude to an armed conflict. The indicator measures the intensity of existing armed conflicts and the potential for future armed conflicts. It includes relevant indices and their assessments, as well as the assessment based on the analysis of political discourses in the region. It is divided into two sub-indicators: conflict intensity and conflict potential.', 
                     'Political Terror': 'The political terror domain includes all violent acts directed against “the physical integrity of the person by agents of the state” (Haschke 2021), such as torture and cruel treatment, unlawful use of deadly force, political killings, assassinations, etc. This domain covers different violent acts that are not related to armed conflicts, such as violent suppression of political demonstrations or violent repression against the political opposition. This indicator assesses the intensity of state violence against its citizen, primarily political opposition, dissidents, and similar social agents. It is mostly based on existing data sets supplemented by discourse analysis.', 
@@ -42,107 +149,199 @@ description_text = {'Political Violence': 'Reduction of violence is a necessary,
                     'Levels of Corruption': 'This indicator relates to the efficiency of resource allocation. In societies with high levels of corruption, inefficient allocation of resources often leads to a reduction of funds for essential services which can further lead to dissatisfaction and civil unrest.'}
 
 
-def get_alternative(name):
-    idx = countries.index(name)
-    return __model.alternatives[idx]
-
-def get_alternatives_domain(domain):
-    vals = [[__model.alternatives[i]['name'], __model.alternatives[i][domain]] for i in range(len(__model.alternatives))]
-    df_vals = pd.DataFrame(vals, columns=['Country', 'Values'])
-    df_vals = df_vals.fillna(0)
-    df_vals['Values'] = df_vals['Values'].astype(int)
+def get_alternative(model, name):
+    return model.alternatives[get_store(model).rows[name]]
 
-    att_idx = attributes.index(domain)
-    cat_vals = __model.attributes[att_idx + 1].scale.scale_str().replace(' (+)', '').replace(' (-)', '').split(';')
-    df_vals['Category'] = df_vals['Values'].apply(lambda x: cat_vals[x])
+def get_alternatives_domain(model, domain):
+    store = get_store(model)
+    df_vals = pd.DataFrame({'Country': store.countries, 'Values': store.codes[domain], 'Category': store.labels[domain]}, copy=False)
 
-    return df_vals, cat_vals
+    return df_vals, store.categories[domain]
 
-def get_alternative_domain(alternative, domain):
-    vals = [[__model.alternatives[i]['name'], __model.alternatives[i][domain]] for i in range(len(__model.alternatives))]
-    df_vals = pd.DataFrame(vals, columns=['Country', 'Values'])
-    df_vals = df_vals.fillna(0)
-    df_vals['Values'] = df_vals['Values'].astype(int)
+def get_alternative_domain(model, alternative, domain):
+    store = get_store(model)
 
-    att_idx = attributes.index(domain)
-    cat_vals = __model.attributes[att_idx + 1].scale.scale_str().replace(' (+)', '').replace(' (-)', '').split(';')
-    df_vals['Category'] = df_vals['Values'].apply(lambda x: cat_vals[x])
-
-    return df_vals['Category'].loc[df_vals['Country'] == alternative].values[0]
+    return store.labels[domain][store.rows[alternative]]
 
 def get_text_domain(domain):
     return description_text[domain]
 
-def get_decision_table(domain):
-    dom_idx = attributes.index(domain) + 1
+def get_basic_attributes(model, domain):
+    domain_att = model.attrib(domain)
+    atts = [att.name for att in model.basic if att.affects(domain_att)]
 
-    att_idx = np.where([__model.attributes[i].parent.name == domain for i in range(len(__model.attributes))])[0].tolist()
-    atts_child = [__model.attributes[i].name for i in att_idx]
-    atts = str(__model.attributes[dom_idx].funct.values.keys()).replace(' ', '').replace('(', '').replace(')', '').replace('dict_keys[', '').replace(']', '').split(',')
-    atts = np.array(atts).reshape((int(len(atts)/len(atts_child)), len(atts_child))).astype('int')
+    return atts
 
-    atts_values = []
-    for j in range(len(atts_child)):
-        to_append = [__model.attributes[att_idx[j]].scale.values[i] for i in atts[:, j]]
-        atts_values.append(to_append)
-    
-    label = np.array(str(__model.attributes[dom_idx].funct.values.values()).replace('dict_values([', '').replace('])', '').replace(' ', '').split(',')).astype(int)
-    label = [__model.attributes[dom_idx].scale.values[i] for i in label]
+def get_decision_table(model, domain):
+    att = model.attrib(domain)
 
-    df_rules = pd.DataFrame(np.array(atts_values).T.tolist(), columns=atts_child)
-    df_rules[domain] = label
+    df_rules = att.funct.rule_table(as_frame=True)
+    df_rules.columns = [inp.name for inp in att.inputs] + [domain]
 
     return df_rules
 
-def __get_children(domain):
-    att_idx = np.where([__model.attributes[i].parent.name == domain for i in range(len(__model.attributes))])[0].tolist()
-    atts_child = [__model.attributes[i].name for i in att_idx]
-
-    return atts_child, att_idx
+def get_subtree_attributes(model, domain):
+    atts = [att.name for att in model.subtree(domain, include_root=False)]
 
-def __get_children_for_domain(domain):
-    atts_child = []
-
-    children, _ = __get_children(domain)
-
-    if len(children) > 0:
-        atts_child.append(children)
-        for child in children:
-            atts_child.append(__get_children_for_domain(child))
-
-    return atts_child
-
-def __flatten(lst):
-    return [item for sublist in lst for item in (__flatten(sublist) if isinstance(sublist, list) else [sublist])]
-
-def get_data_table(domain):
-    atts = __flatten(__get_children_for_domain(domain))
-    df_data = []
+    return atts
 
-    for att in atts:
-        att_idx = attributes.index(att) + 1
-        for country in __model.alternatives:
-            cat_vals = __model.attributes[att_idx].scale.scale_str().replace(' (+)', '').replace(' (-)', '').split(';')
-            if country[att] is None:
-                df_data.append([country['name'], att, ""])
-            elif isinstance(country[att], set):
-                df_data.append([country['name'], att, list(country[att])[0]])
-            else:
-                df_data.append([country['name'], att, cat_vals[country[att]]])
+def get_data_table(model, domain):
+    atts = sorted(set(get_subtree_attributes(model, domain)))
+    store = get_store(model)
 
-    df_data = pd.DataFrame(df_data, columns=['Country', 'Attribute', 'Value'])
-    df_data = df_data.pivot(index='Country', columns='Attribute', values='Value')
+    df_data = pd.DataFrame({att: store.texts[att] for att in atts}, index=pd.Index(store.countries, name='Country'), copy=False)
+    df_data.columns.name = 'Attribute'
+    df_data = df_data.sort_index()
 
     return df_data
 
-def return_aggregate_attributes(attributes):
+def return_aggregate_attributes(model, attributes):
     atts = []
-    for i in range(len(__model.attributes)):
+    for i in range(len(model.attributes)):
         for a in attributes:
-            if __model.attributes[i].name == a:
-                if __model.attributes[i].is_aggregate():
-                    atts.append(__model.attributes[i].name)
+            if model.attributes[i].name == a:
+                if model.attributes[i].is_aggregate():
+                    atts.append(model.attributes[i].name)
     
     return atts
 
-# __model.attributes[1].scale.scale_str()
\ No newline at end of file
+# get_model().attributes[1].scale.scale_str()
+
+# Country x year x attribute cube of value indices (-1 for undefined), built once per process.
+# Years that share their structure are evaluated as a single batch. Where the crisp evaluation
+# is undefined, the value stored in the .dxi file is kept if it is a single value; the boolean
+# cube returned alongside tells which values were evaluated, so stored ones can be told apart.
+def __evaluate_years():
+    groups = {}
+    for year in years:
+        groups.setdefault(id(registry[year].root), []).append(year)
+
+    evaluated = {}
+    for group in groups.values():
+        model = registry[group[0]]
+        basic_ids = model.eval_plan().basic_ids
+        alts = [alt for year in group for alt in registry[year].alternatives]
+        columns = {att: [alt[att] for alt in alts] for att in basic_ids}
+        result = model.evaluate_crisp(columns)
+
+        start = 0
+        for year in group:
+            end = start + len(registry[year].alternatives)
+            evaluated[year] = {att: column[start:end] for att, column in result.items()}
+            start = end
+
+    return evaluated
+
+@cache_resource
+def get_panel():
+    evaluated = __evaluate_years()
+    panel_countries = list(dict.fromkeys(alt['name'] for year in years for alt in registry[year].alternatives))
+    country_rows = {country: i for i, country in enumerate(panel_countries)}
+    panel_attributes = [att.id for att in registry[years[0]].non_root]
+
+    cube = np.full((len(panel_countries), len(years), len(panel_attributes)), -1, dtype=int)
+    is_evaluated = np.zeros(cube.shape, dtype=bool)
+    for j, year in enumerate(years):
+        alts = registry[year].alternatives
+        rows = [country_rows[alt['name']] for alt in alts]
+        for k, att in enumerate(panel_attributes):
+            stored = np.array([alt.get(att) if isinstance(alt.get(att), int) else -1 for alt in alts], dtype=int)
+            column = evaluated[year].get(att)
+            if column is None:
+                cube[rows, j, k] = stored
+            else:
+                cube[rows, j, k] = np.where(column >= 0, column, stored)
+                is_evaluated[rows, j, k] = column >= 0
+
+    cube.setflags(write=False)
+    is_evaluated.setflags(write=False)
+    return cube, is_evaluated, panel_countries, list(years), panel_attributes
+
+@cache_resource
+def get_panel_frame():
+    cube, is_evaluated, panel_countries, panel_years, panel_attributes = get_panel()
+    country_idx, year_idx, att_idx = [idx.reshape(-1) for idx in np.indices(cube.shape)]
+    codes = cube.reshape(-1)
+
+    labels = np.full(codes.shape, '', dtype=object)
+    for j, year in enumerate(panel_years):
+        for k, att in enumerate(panel_attributes):
+            scale = registry[year].attrib(att).scale
+            selected = (year_idx == j) & (att_idx == k) & (codes >= 0)
+            labels[selected] = np.array(scale.values, dtype=object)[codes[selected]]
+
+    # Source: 'evaluated' by the model, 'stored' in the .dxi file, or '' for undefined values
+    sources = np.where(is_evaluated.reshape(-1), 'evaluated', np.where(codes >= 0, 'stored', '')).astype(object)
+
+    return pd.DataFrame({'Country': np.array(panel_countries, dtype=object)[country_idx],
+                         'Year': np.array(panel_years)[year_idx],
+                         'Attribute': np.array(panel_attributes, dtype=object)[att_idx],
+                         'Code': codes,
+                         'Label': labels,
+                         'Source': sources})
+
+def get_trend(domain):
+    df_panel = get_panel_frame()
+    df_trend = df_panel.loc[df_panel['Attribute'] == domain, ['Country', 'Year', 'Code', 'Label', 'Source']].reset_index(drop=True)
+
+    return df_trend
+
+# Cached query results for the pages, keyed by year and attribute names. Data frames and lists
+# are returned as copies; geometry is shared and must not be modified.
+# The map uses the compact GeoJSON committed to the repository. It is only read here; run
+# build_geojson.py to regenerate it when the source file or the countries change.
+@cache_resource
+def get_geojson():
+    with open(geojson_file, 'r', encoding='utf-8') as file:
+        return json.load(file)
+
+@cache_data
+def cached_alternatives_domain(year, domain):
+    return get_alternatives_domain(get_model(year), domain)
+
+@cache_data
+def cached_alternative_domain(year, alternative, domain):
+    return get_alternative_domain(get_model(year), alternative, domain)
+
+@cache_data
+def cached_basic_attributes(year, domain):
+    return get_basic_attributes(get_model(year), domain)
+
+@cache_data
+def cached_decision_table(year, domain):
+    return get_decision_table(get_model(year), domain)
+
+@cache_data
+def cached_aggregate_attributes(year, domain):
+    model = get_model(year)
+
+    return return_aggregate_attributes(model, get_subtree_attributes(model, domain))
+
+@cache_data
+def cached_data_table(year, domain):
+    return get_data_table(get_model(year), domain)
+
+@cache_data
+def cached_evaluation(year, values):
+    model = get_model(year)
+    evaluated = model.evaluate(model.alternative("New Alternative", values=values))
+    what_if = model.sensitivity(evaluated, 'BPI', steps=1, evaluated=True)
+
+    return evaluated, what_if
+
+@cache_data
+def cached_goal_seek(year, values, value, limit=3):
+    # Cheapest combinations of indicator changes, each costing one step on the indicator's scale,
+    # that bring the Balkan Peace Index to at least the given value.
+    model = get_model(year)
+    alternative = model.alternative("New Alternative", values=values)
+
+    return model.goal_seek(alternative, 'BPI', value, at_least=True, limit=limit)
+
+@cache_data
+def cached_panel_frame():
+    return get_panel_frame()
+
+@cache_data
+def cached_trend(domain):
+    return get_trend(domain)
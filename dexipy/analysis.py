@@ -0,0 +1,465 @@
+"""
+The module ``dexipy.analysis`` implements analyses of evaluated decision alternatives.
+
+The one-at-a-time sensitivity ("what-if") analysis (:py:func:`dexipy.analysis.sensitivity`) replaces
+the value of each basic attribute in an alternative by other values of its scale, and determines the
+resulting values of some target attribute. The analysis requires a single full evaluation of the
+alternative. Afterwards, for each basic attribute, all its replacement values are evaluated in one batch,
+re-evaluating only attributes that lie between the changed attribute and the target
+(see :py:meth:`dexipy.eval.DexiEvalPlan.affected_steps`).
+
+The goal-seeking analysis (:py:func:`dexipy.analysis.goal_seek`) finds the least costly changes of basic
+attributes' values that make some attribute take the desired value. The minimal cost of each value of each
+attribute is determined bottom-up, using decision tables, and serves as an exact bound for a best-first
+branch-and-bound search over decision rules, which yields solutions in the order of increasing cost.
+
+The outcome analysis (:py:func:`dexipy.analysis.outcome_counts`) determines, for each attribute, how many
+combinations of basic attributes' values lead to each of its values, without enumerating the combinations.
+Value counts of inputs are propagated bottom-up through decision tables, so that the number of operations
+is proportional to the total size of decision tables rather than to the size of the input space.
+"""
+
+import heapq
+import itertools
+import math
+from functools import reduce
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Union
+from copy import copy
+import numpy as np
+from dexipy.types import DexiValue, DexiAlternative
+from dexipy.dexi import DexiModel, DexiAttribute, DexiScale, DexiTabularFunction
+import dexipy.values as vls
+import dexipy.eval as eval
+
+def sensitivity_values(value: DexiValue, scl: Optional[DexiScale], steps: Optional[int] = None) -> List[int]:
+    """Determines replacement values of a basic attribute considered by :py:func:`dexipy.analysis.sensitivity`.
+
+    Args:
+        value (DexiValue): Current value of the attribute.
+        scl (Optional[DexiScale]): Attribute's scale.
+        steps (Optional[int], optional): Maximum distance of replacement values from ``value``.
+            Defaults to None, which selects all scale values. Ignored when ``value``
+            is not a single value index.
+
+    Returns:
+        List[int]: Ordered indices of replacement values, excluding ``value``.
+        Empty for undefined and continuous scales.
+    """
+    if scl is None or not scl.is_discrete():
+        return []
+    count = scl.count()
+    if not isinstance(value, int) or steps is None:
+        return [val for val in range(count) if val != value]
+    return [val for val in range(max(0, value - steps), min(count, value + steps + 1)) if val != value]
+
+def sensitivity(model: DexiModel,
+                alternative: DexiAlternative,
+                target: Union[DexiAttribute, str],
+                steps: Optional[int] = None,
+                method: str = "set",
+                root: Optional[DexiAttribute] = None,
+                prune: List[str] = [],
+                bounding: bool = False,
+                evaluated: bool = False,
+                eval_param: Optional[eval.DexiEvalParameters] = None
+                ) -> Dict[str, Dict[int, DexiValue]]:
+    """One-at-a-time sensitivity analysis of ``alternative`` with respect to the ``target`` attribute.
+
+    For each basic attribute of the evaluation, its value in ``alternative`` is replaced,
+    one at a time, by each of the values determined by :py:func:`dexipy.analysis.sensitivity_values`,
+    and the resulting value of ``target`` is determined. Results are equal to evaluating each modified
+    alternative with :py:func:`dexipy.eval.evaluate`.
+
+    Args:
+        model (DexiModel): A DexiModel. Required.
+        alternative (DexiAlternative): An alternative. Not modified.
+        target (Union[DexiAttribute, str]): The attribute whose values are observed,
+            given as a DexiAttribute or attribute ID.
+        steps (Optional[int], optional): Maximum distance of replacement values from the current value,
+            for instance 1 to consider only the preceding and the next value of each attribute.
+            Defaults to None, which considers all scale values.
+        method (str, optional): Evaluation method. Defaults to "set".
+        root (Optional[DexiAttribute], optional): The topmost (root) attribute of the evaluation.
+            Defaults to None, which selects ``model.root``.
+        prune (List[str], optional): List of attribute IDs at which the evaluation is "pruned".
+            Defaults to [].
+        bounding (bool, optional): Whether or not the evaluation keeps calculated values within
+            bounds prescribed by the corresponding scales. Defaults to False.
+        evaluated (bool, optional): Whether ``alternative`` has already been evaluated using the
+            same remaining arguments. If False, it is evaluated first. Defaults to False.
+        eval_param (Optional[eval.DexiEvalParameters], optional): Optional evaluation parameters.
+            Defaults to None.
+
+    Raises:
+        ValueError: When the model root is undefined or ``target`` is not evaluated by this evaluation.
+
+    Returns:
+        Dict[str, Dict[int, DexiValue]]: For each basic attribute ID, in the evaluation order,
+        a dictionary that maps replacement value indices to the corresponding values of ``target``.
+    """
+    if eval_param is None:
+        eval_param = eval.EvalMethods.get_method(method)
+    if root is None:
+        root = model.root
+    if root is None:
+        raise ValueError("Undefined model root")
+    target_att = model.attrib(target)
+    plan = model.eval_plan(root, prune)
+    target_id = None if target_att is None else target_att.id
+    if target_id not in [step[0] for step in plan.steps]:
+        raise ValueError(f"Attribute is not evaluated: {target}")
+
+    if not evaluated:
+        alternative = eval.evaluate(model, alternative, method, root, prune,
+                                    bounding = bounding, eval_param = eval_param)
+    base = eval.get_alt_value(alternative, target_id)
+
+    result: Dict[str, Dict[int, DexiValue]] = {}
+    for id, scl in zip(plan.order, plan.scales):
+        if id not in plan.basic_ids:
+            continue
+        values = sensitivity_values(eval.get_alt_value(alternative, id), scl, steps)
+        steps_to_target = []
+        for step in plan.affected_steps([id]):
+            steps_to_target.append(step)
+            if step[0] == target_id:
+                break
+        else:
+            result[id] = {val: base for val in values}
+            continue
+        alts = []
+        for val in values:
+            alt = copy(alternative)
+            alt[id] = val
+            alts.append(alt)
+        eval.evaluate_steps(steps_to_target, alts, eval_param, bounding)
+        result[id] = {val: alt[target_id] for val, alt in zip(values, alts)}
+    return result
+
+def link_conditions(plan: eval.DexiEvalPlan) -> Tuple[List[str], Dict[str, Set[str]]]:
+    """Determines attributes of an evaluation plan whose values are used more than once, because
+    other attributes are linked to them, and the attributes that depend on them.
+
+    Analyses that assume independent inputs of aggregate attributes condition upon values of these attributes.
+
+    Args:
+        plan (eval.DexiEvalPlan): An evaluation plan.
+
+    Returns:
+        Tuple[List[str], Dict[str, Set[str]]]: IDs of attributes that are linked to, in the evaluation order,
+        and, for each evaluated attribute ID, the set of those attributes (other than itself) that affect it.
+    """
+    step_ids = set(step[0] for step in plan.steps)
+    targets = list(dict.fromkeys(link for id, kind, att, scl, link, inp_ids in plan.steps
+                                 if kind == eval.DexiEvalPlan.LINK and link in step_ids))
+    deps: Dict[str, Set[str]] = {}
+    deps_out: Dict[str, Set[str]] = {}
+    for id, kind, att, scl, link, inp_ids in plan.steps:
+        if kind == eval.DexiEvalPlan.LINK and link in step_ids:
+            deps[id] = set(deps_out[link])
+        elif kind == eval.DexiEvalPlan.AGGREGATE:
+            deps[id] = set().union(*(deps_out.get(inp, set()) for inp in inp_ids))
+        else:
+            deps[id] = set()
+        deps_out[id] = deps[id] | {id} if id in targets else deps[id]
+    return targets, deps
+
+def outcome_counts(model: DexiModel,
+                   root: Optional[DexiAttribute] = None,
+                   prune: List[str] = [],
+                   weights: Optional[Dict[str, Sequence[float]]] = None,
+                   normalize: bool = False
+                   ) -> Dict[str, List[Any]]:
+    """Determines, for each evaluated attribute, the number of combinations of basic attributes' values
+    that lead to each of its values.
+
+    For an attribute ``X``, combinations consist of values of all basic attributes that affect ``X``,
+    either through its subtree or through linked attributes. Values of attributes that are linked to
+    are conditioned upon, so that each combination is counted exactly once.
+
+    Combinations are propagated through decision tables as in :py:func:`dexipy.batch.evaluate_crisp`:
+    decision rules that do not map to a single value, as well as any undefined inputs, lead to
+    an "undefined" outcome. For models whose decision tables map to single values, the counts are
+    equal to counts obtained by evaluating all combinations.
+
+    Args:
+        model (DexiModel): A DexiModel. Required.
+        root (Optional[DexiAttribute], optional): The topmost (root) attribute of the evaluation.
+            Defaults to None, which selects ``model.root``.
+        prune (List[str], optional): List of attribute IDs at which the evaluation is "pruned".
+            Pruned attributes are treated as basic. Defaults to [].
+        weights (Optional[Dict[str, Sequence[float]]], optional): Weights of values of basic attributes,
+            keyed by attribute IDs; for instance, probabilities of values under independent input distributions.
+            Attributes not included have weight 1 for each value. Defaults to None, which
+            counts combinations exactly, using integers.
+        normalize (bool, optional): Whether to divide the results of each attribute by their sum,
+            giving the share of combinations that lead to each value. Defaults to False.
+
+    Raises:
+        ValueError: When the model root is undefined, some evaluated attribute is continuous
+            or some aggregate attribute has no tabular function.
+
+    Returns:
+        Dict[str, List[Any]]: For each attribute ID, in the evaluation order, a list of counts (or
+        weights) of its values, followed by the count of combinations that lead to an undefined value.
+    """
+    if root is None:
+        root = model.root
+    if root is None:
+        raise ValueError("Undefined model root")
+    plan = model.eval_plan(root, prune)
+    if weights is None:
+        weights = {}
+    dtype = object if len(weights) == 0 else float
+    zero = 0 if dtype is object else 0.0
+
+    step_ids = set(step[0] for step in plan.steps)
+    sizes: Dict[str, int] = {}
+    tables: Dict[str, List[int]] = {}
+    for id, kind, att, scl, link, inp_ids in plan.steps:
+        if scl is None or not scl.is_discrete():
+            raise ValueError(f"Outcome counts require discrete attributes: {id}")
+        size = scl.count()
+        sizes[id] = size
+        if kind == eval.DexiEvalPlan.AGGREGATE:
+            funct = att.funct
+            if not isinstance(funct, DexiTabularFunction):
+                raise ValueError(f"Outcome counts require tabular functions: {id}")
+            codes = np.where((funct.codes >= 0) & (funct.codes < size), funct.codes, size)
+            padded = np.full(tuple(d + 1 for d in funct.dim), size, dtype = np.int64)
+            padded[tuple(slice(0, d) for d in funct.dim)] = codes
+            tables[id] = padded.reshape(-1).tolist()
+
+    # Attributes that are linked to are conditioned upon. Within each condition, they (and links to
+    # them) are represented by an indicator of the condition's value, and the weight of that value
+    # ("mass") is accounted for once for each attribute that depends on them.
+    targets, deps = link_conditions(plan)
+
+    def base_vector(id):
+        vector = np.zeros(sizes[id] + 1, dtype = dtype)
+        vector[:sizes[id]] = weights.get(id, [1] * sizes[id])
+        return vector
+
+    def indicator(id, value):
+        vector = np.zeros(sizes[id] + 1, dtype = dtype)
+        vector[value] = 1
+        return vector
+
+    result: Dict[str, np.ndarray] = {id: np.zeros(sizes[id] + 1, dtype = dtype) for id in sizes}
+    for condition in itertools.product(*(range(sizes[target] + 1) for target in targets)):
+        cond = dict(zip(targets, condition))
+        vectors: Dict[str, np.ndarray] = {}
+        masses: Dict[str, Any] = {}
+        for id, kind, att, scl, link, inp_ids in plan.steps:
+            if kind == eval.DexiEvalPlan.LINK and link in step_ids:
+                vector = vectors[link]
+            elif kind == eval.DexiEvalPlan.AGGREGATE:
+                joint = reduce(np.multiply.outer, [vectors[inp] for inp in inp_ids]).reshape(-1)
+                vector = np.zeros(sizes[id] + 1, dtype = dtype)
+                np.add.at(vector, tables[id], joint)
+            else:
+                vector = base_vector(id)
+            mass = reduce(lambda x, y: x * y, (masses[dep] for dep in deps[id]), 1)
+            result[id] += vector * mass
+            if id in cond:
+                masses[id] = vector[cond[id]]
+                vector = indicator(id, cond[id])
+            vectors[id] = vector
+
+    counts: Dict[str, List[Any]] = {}
+    for id in sizes:
+        # conditions on attributes that do not affect ``id`` repeat the same counts
+        repeats = reduce(lambda x, y: x * y, (sizes[target] + 1 for target in targets if target not in deps[id]), 1)
+        vector = result[id] // repeats if dtype is object else result[id] / repeats
+        if normalize:
+            total = sum(vector.tolist())
+            counts[id] = [val / total if total else zero for val in vector.tolist()]
+        else:
+            counts[id] = vector.tolist()
+    return counts
+
+def goal_seek(model: DexiModel,
+              alternative: DexiAlternative,
+              target: Union[DexiAttribute, str],
+              value: Union[int, Set[int]],
+              at_least: bool = False,
+              costs: Optional[Dict[str, float]] = None,
+              limit: int = 1,
+              method: str = "set",
+              root: Optional[DexiAttribute] = None,
+              prune: List[str] = [],
+              evaluated: bool = False
+              ) -> List[Tuple[float, Dict[str, int]]]:
+    """Finds the least costly changes of basic attributes' values in ``alternative`` that make
+    the ``target`` attribute take the desired ``value``.
+
+    Changing a basic attribute from value index ``i`` to ``j`` costs ``costs[id] * abs(i - j)``; assigning
+    a value to an attribute whose current value is not a single value index costs ``costs[id]``.
+    Aggregate attributes are evaluated by decision rules that map to single values; attributes that
+    are continuous, or whose functions are not tabular, keep their current values. Linked attributes
+    are handled by conditioning on the values of attributes they are linked to.
+
+    Args:
+        model (DexiModel): A DexiModel. Required.
+        alternative (DexiAlternative): An alternative. Not modified.
+        target (Union[DexiAttribute, str]): The attribute whose value is sought,
+            given as a DexiAttribute or attribute ID.
+        value (Union[int, Set[int]]): The desired value index of ``target``, or a set of admissible value indices.
+        at_least (bool, optional): Whether all value indices from ``value`` upwards are admissible.
+            When ``value`` is a set, all value indices from its smallest element upwards are admissible.
+            Defaults to False.
+        costs (Optional[Dict[str, float]], optional): Costs of changing basic attributes by one value,
+            keyed by attribute IDs. Attributes not included cost 1.0; attributes that cost ``math.inf``
+            are not changed. Defaults to None.
+        limit (int, optional): Maximum number of returned solutions. Defaults to 1.
+        method (str, optional): Evaluation method used to evaluate ``alternative``. Defaults to "set".
+        root (Optional[DexiAttribute], optional): The topmost (root) attribute of the evaluation.
+            Defaults to None, which selects ``model.root``.
+        prune (List[str], optional): List of attribute IDs at which the evaluation is "pruned".
+            Defaults to [].
+        evaluated (bool, optional): Whether ``alternative`` has already been evaluated using the
+            same ``method``, ``root`` and ``prune``. Defaults to False.
+
+    Raises:
+        ValueError: When the model root is undefined, ``target`` is not evaluated by this evaluation,
+            or it is not discrete.
+
+    Returns:
+        List[Tuple[float, Dict[str, int]]]: Up to ``limit`` solutions, ordered by increasing cost.
+        Each solution consists of its cost and a dictionary of new values of changed basic attributes.
+        Solutions that make all changes of another returned solution, and some more, are omitted.
+        The list is empty when the desired value cannot be reached.
+    """
+    if root is None:
+        root = model.root
+    if root is None:
+        raise ValueError("Undefined model root")
+    target_att = model.attrib(target)
+    plan = model.eval_plan(root, prune)
+    target_id = None if target_att is None else target_att.id
+    steps = {step[0]: step for step in plan.steps}
+    if target_id not in steps:
+        raise ValueError(f"Attribute is not evaluated: {target}")
+    scl = steps[target_id][3]
+    if scl is None or not scl.is_discrete():
+        raise ValueError(f"Attribute is not discrete: {target}")
+    if not evaluated:
+        alternative = eval.evaluate(model, alternative, method, root, prune)
+    current = {id: vls.reduce_dexi_value(eval.get_alt_value(alternative, id)) for id in steps}
+    if costs is None:
+        costs = {}
+    goals = {value} if isinstance(value, int) else set(value)
+    if at_least and goals:
+        goals = set(range(min(goals), scl.count()))
+
+    # Attributes that affect the target, in the evaluation order, and subtrees of originals (without links).
+    needed = {target_id}
+    for id, kind, att, scl, link, inp_ids in reversed(plan.steps):
+        if id in needed:
+            needed.update(inp_ids if kind == eval.DexiEvalPlan.AGGREGATE else (link,) if kind == eval.DexiEvalPlan.LINK else ())
+    order = [step for step in plan.steps if step[0] in needed]
+    subtree: Dict[str, Set[str]] = {}
+    for id, kind, att, scl, link, inp_ids in order:
+        subtree[id] = set().union({id}, *(subtree.get(inp, set()) for inp in inp_ids)) if kind == eval.DexiEvalPlan.AGGREGATE else {id}
+
+    sizes: Dict[str, int] = {}
+    rules: Dict[str, Tuple[np.ndarray, List[np.ndarray]]] = {}
+    for id, kind, att, scl, link, inp_ids in order:
+        sizes[id] = scl.count() if scl is not None and scl.is_discrete() else 0
+        if kind == eval.DexiEvalPlan.AGGREGATE and isinstance(att.funct, DexiTabularFunction) and sizes[id] > 0 \
+           and all(sizes.get(inp, 0) > 0 for inp in inp_ids):
+            codes = att.funct.codes.reshape(-1)
+            rules[id] = (codes, [np.flatnonzero(codes == val) for val in range(sizes[id])])
+
+    def basic_cost(id, val):
+        cur = current[id]
+        if val == cur:
+            return 0.0
+        unit = costs.get(id, 1.0)
+        if math.isinf(unit):
+            return math.inf
+        return unit * abs(val - cur) if isinstance(cur, int) else unit
+
+    def fixed_cost(id, val):
+        return 0.0 if val == current[id] else math.inf
+
+    # Conditions on linked-to attributes that affect the target. Each such attribute is "owned" by (its
+    # cost is accounted for in) the target's subtree, or otherwise by the search's initial state.
+    # Attributes below those that keep their current values cannot be changed either.
+    targets, deps = link_conditions(plan)
+    targets = [t for t in targets if t in deps[target_id] and sizes.get(t, 0) > 0]
+    kept = set().union(*(subtree[id] for id, kind, *_ in order if kind == eval.DexiEvalPlan.AGGREGATE and id not in rules))
+    ranges = [list(range(sizes[t])) if t not in kept else [current[t]] if isinstance(current[t], int) else [] for t in targets]
+    external = [t for t in targets if t not in subtree[target_id]]
+    external = [t for t in external if not any(t in subtree[other] for other in external if other != t)]
+
+    def minimal_costs(cond):
+        best: Dict[str, np.ndarray] = {}
+        for id, kind, att, scl, link, inp_ids in order:
+            size = sizes[id]
+            if kind == eval.DexiEvalPlan.LINK and link in cond:
+                vector = np.array([0.0 if val == cond[link] else math.inf for val in range(size)])
+            elif kind == eval.DexiEvalPlan.BASIC:
+                vector = np.array([basic_cost(id, val) for val in range(size)])
+            elif id in rules:
+                codes = rules[id][0]
+                joint = reduce(np.add.outer, [best[inp] for inp in inp_ids]).reshape(-1)
+                valid = (codes >= 0) & (codes < size)
+                vector = np.full(size, math.inf)
+                np.minimum.at(vector, codes[valid], joint[valid])
+            else:
+                vector = np.array([fixed_cost(id, val) for val in range(size)])
+            if id in cond:
+                vector = np.where(np.arange(size) == cond[id], vector, math.inf)
+            best[id] = vector
+        return best
+
+    # Search states: (bound, tie-breaker, condition, cost so far, pending (id, value) pairs, changes so far).
+    heap: List[Tuple[float, int, int, float, Tuple[Tuple[str, int], ...], Tuple[Tuple[str, int], ...]]] = []
+    conditions: List[Dict[str, np.ndarray]] = []
+    counter = itertools.count()
+    for condition in itertools.product(*ranges):
+        cond = dict(zip(targets, condition))
+        best = minimal_costs(cond)
+        conditions.append(best)
+        for goal in sorted(goals):
+            if not 0 <= goal < sizes[target_id]:
+                continue
+            pending = ((target_id, goal),) + tuple((t, cond[t]) for t in external)
+            bound = sum(best[id][val] for id, val in pending)
+            if not math.isinf(bound):
+                heapq.heappush(heap, (bound, next(counter), len(conditions) - 1, 0.0, pending, ()))
+
+    # Solutions are found in the order of increasing cost; those that include all changes of
+    # an already found solution are dominated by it and skipped.
+    solutions: List[Tuple[float, Dict[str, int]]] = []
+    found: List[Set[Tuple[str, int]]] = []
+    while heap and len(solutions) < limit:
+        bound, _, cond_idx, cost, pending, changes = heapq.heappop(heap)
+        if len(pending) == 0:
+            items = set(changes)
+            if not any(prev <= items for prev in found):
+                # with zero costs, a smaller solution may come after its equally costly supersets
+                kept = [i for i, prev in enumerate(found) if not items < prev]
+                solutions = [solutions[i] for i in kept] + [(cost, dict(changes))]
+                found = [found[i] for i in kept] + [items]
+            continue
+        best = conditions[cond_idx]
+        (id, val), rest = pending[0], pending[1:]
+        kind, att, inp_ids = steps[id][1], steps[id][2], steps[id][5]
+        if kind == eval.DexiEvalPlan.BASIC:
+            step_cost = basic_cost(id, val)
+            new_changes = changes + ((id, val),) if val != current[id] else changes
+            heapq.heappush(heap, (bound, next(counter), cond_idx, cost + step_cost, rest, new_changes))
+        elif id in rules:
+            rest_bound = bound - best[id][val]
+            dim = att.funct.dim
+            for flat in rules[id][1][val].tolist():
+                args = np.unravel_index(flat, dim)
+                children = tuple((inp, int(arg)) for inp, arg in zip(inp_ids, args))
+                child_bound = rest_bound + sum(best[inp][arg] for inp, arg in children)
+                if not math.isinf(child_bound):
+                    heapq.heappush(heap, (child_bound, next(counter), cond_idx, cost, children + rest, changes))
+        else:
+            heapq.heappush(heap, (bound, next(counter), cond_idx, cost, rest, changes))
+    return solutions
@@ -0,0 +1,380 @@
+"""
+The module ``dexipy.batch`` implements a vectorized evaluation of large batches of *crisp*
+decision alternatives using NumPy.
+
+A crisp alternative is an alternative whose discrete values are all single integers
+(value indices). A batch of such alternatives is represented by an integer matrix of shape
+``(n_alternatives, n_basic)``, where columns correspond to basic attributes of the model.
+Decision tables are represented by dense integer arrays, so that each aggregate attribute
+is evaluated for the whole batch by a single gather operation.
+
+Undefined values are represented by :py:data:`dexipy.batch.UNDEFINED`.
+Decision rules that do not map to a single integer value (i.e., undefined rules and rules
+that map to value sets or distributions) evaluate to :py:data:`dexipy.batch.UNDEFINED`, too;
+alternatives affected by such rules should be evaluated using :py:func:`dexipy.eval.evaluate`.
+
+:py:func:`dexipy.batch.evaluate_sets` extends the batch evaluation to alternatives whose discrete
+values are value sets, using the bitmasks of :py:class:`dexipy.values.DexiPackedValues`. Its results
+are equal to those of :py:func:`dexipy.eval.evaluate` using the "set" method, except that decision rules
+whose values are not within the output scale are considered undefined.
+"""
+
+from typing import Any, List, Dict, Optional, Sequence
+import numpy as np
+from dexipy.dexi import DexiModel, DexiAttribute, DexiTabularFunction, DexiDiscretizeFunction
+from dexipy.eval import DexiEvalPlan
+import dexipy.values as vls
+
+UNDEFINED = -1
+"""Integer code representing undefined values in crisp batch evaluation."""
+
+def crisp_table(funct: DexiTabularFunction) -> np.ndarray:
+    """Converts the decision table of ``funct`` to a dense integer array.
+
+    Args:
+        funct (DexiTabularFunction): A tabular function.
+
+    Returns:
+        np.ndarray: An integer array of shape ``funct.dim``. Each element contains the integer
+        function value of the corresponding decision rule, or ``UNDEFINED`` if the rule value
+        is not a single integer.
+    """
+    return np.maximum(funct.codes, UNDEFINED).astype(np.int64)
+
+def padded_table(table: np.ndarray) -> np.ndarray:
+    """Pads each dimension of a dense decision table with an extra trailing element, containing ``UNDEFINED``.
+
+    Since ``UNDEFINED == -1``, indexing a padded table with undefined arguments selects the padding
+    and therefore yields ``UNDEFINED`` without any explicit masking.
+
+    Args:
+        table (np.ndarray): A dense decision table, as returned by :py:func:`dexipy.batch.crisp_table`.
+
+    Returns:
+        np.ndarray: Padded table, whose shape is larger by one in each dimension.
+    """
+    padded = np.full(tuple(d + 1 for d in table.shape), UNDEFINED, dtype = table.dtype)
+    padded[tuple(slice(0, d) for d in table.shape)] = table
+    return padded
+
+def evaluation_table(funct: DexiTabularFunction, size: int) -> np.ndarray:
+    """Returns the padded dense decision table of ``funct`` used by :py:func:`dexipy.batch.evaluate_crisp`.
+
+    The result is cached on ``funct`` (see :py:meth:`dexipy.dexi.DexiTabularFunction.derived`)
+    and must not be modified.
+
+    Args:
+        funct (DexiTabularFunction): A tabular function.
+        size (int): Output scale size. Function values outside ``range(size)`` are replaced by ``UNDEFINED``.
+
+    Returns:
+        np.ndarray: A read-only padded table (see :py:func:`dexipy.batch.padded_table`).
+    """
+    def compute(funct: DexiTabularFunction) -> np.ndarray:
+        table = padded_table(valid_column(crisp_table(funct), size).reshape(funct.dim))
+        table.flags.writeable = False
+        return table
+
+    return funct.derived(("evaluation_table", size), compute)
+
+def set_table(funct: DexiTabularFunction, size: int) -> np.ndarray:
+    """Returns the decision table of ``funct`` as an array of value set bitmasks, used by
+    :py:func:`dexipy.batch.evaluate_sets`.
+
+    The result is cached on ``funct`` (see :py:meth:`dexipy.dexi.DexiTabularFunction.derived`)
+    and must not be modified.
+
+    Args:
+        funct (DexiTabularFunction): A tabular function.
+        size (int): Output scale size, at most :py:data:`dexipy.values.PACKED_LIMIT`.
+
+    Returns:
+        np.ndarray: A read-only unsigned 64-bit array of shape ``funct.dim``. Each element contains
+        the bitmask of the set of function values of the corresponding decision rule (see
+        :py:class:`dexipy.values.DexiPackedValues`), or 0 if the rule is undefined or its value
+        is not within ``range(size)``.
+    """
+    def compute(funct: DexiTabularFunction) -> np.ndarray:
+        codes = funct.codes.reshape(-1)
+        masks = np.zeros(len(codes), dtype = np.uint64)
+        crisp = (codes >= 0) & (codes < size)
+        masks[crisp] = np.left_shift(np.uint64(1), codes[crisp].astype(np.uint64))
+        for idx in np.flatnonzero(codes < UNDEFINED).tolist():
+            value = vls.dexi_value_as_set(funct.value(np.unravel_index(idx, funct.dim)))
+            if value is not None and all(0 <= val < size for val in value):
+                masks[idx] = sum(1 << val for val in value)
+        table = masks.reshape(funct.dim)
+        table.flags.writeable = False
+        return table
+
+    if size > vls.PACKED_LIMIT:
+        raise ValueError(f"Set evaluation supports scales of at most {vls.PACKED_LIMIT} values")
+    return funct.derived(("set_table", size), compute)
+
+def aggregate_sets(table: np.ndarray, masks: Sequence[np.ndarray]) -> np.ndarray:
+    """Evaluates a decision table of value set bitmasks for a batch of argument value sets.
+
+    Rows whose arguments are all single values are evaluated by a single gather operation. For the
+    remaining rows, the result is the union of rule values over all combinations of argument values,
+    or 0 (undefined) if any of these rules is undefined.
+
+    Args:
+        table (np.ndarray): A table of bitmasks, as returned by :py:func:`dexipy.batch.set_table`.
+        masks (Sequence[np.ndarray]): A sequence of bitmask columns, one for each table dimension.
+
+    Returns:
+        np.ndarray: A column of bitmasks of function values. Rows containing undefined or
+        out-of-range arguments evaluate to 0.
+    """
+    packed = [vls.DexiPackedValues.from_masks(mask, size) for mask, size in zip(masks, table.shape)]
+    valid = np.ones(len(masks[0]), dtype = bool)
+    for mask, size in zip(masks, table.shape):
+        valid &= (mask != 0) & (mask >> np.uint64(size) == 0)
+    single = valid & np.logical_and.reduce([values.crisp() for values in packed])
+    result = np.zeros(len(masks[0]), dtype = np.uint64)
+    result[single] = table[tuple(values.codes[single] for values in packed)]
+    rows = np.flatnonzero(valid & ~single)
+    if len(rows) > 0:
+        members = [[values.member(val)[rows] for val in range(size)] for values, size in zip(packed, table.shape)]
+        undefined = np.zeros(len(rows), dtype = bool)
+        union = np.zeros(len(rows), dtype = np.uint64)
+        for args in np.ndindex(*table.shape):
+            selected = np.logical_and.reduce([members[i][arg] for i, arg in enumerate(args)])
+            if table[args] == 0:
+                undefined |= selected
+            else:
+                union[selected] |= table[args]
+        union[undefined] = 0
+        result[rows] = union
+    return result
+
+def valid_column(column: np.ndarray, size: int) -> np.ndarray:
+    """Converts a column of discrete values to integers, replacing values outside ``range(size)`` by ``UNDEFINED``.
+
+    Args:
+        column (np.ndarray): A one-dimensional array of value indices.
+        size (int): Scale size.
+
+    Returns:
+        np.ndarray: A contiguous integer column.
+    """
+    column = np.ascontiguousarray(column, dtype = np.int64)
+    return np.where((column >= 0) & (column < size), column, UNDEFINED)
+
+def discretize_column(funct: DexiDiscretizeFunction, column: np.ndarray) -> np.ndarray:
+    """Discretizes a column of numeric values using ``funct``.
+
+    The function is evaluated only once for each distinct value in ``column``.
+
+    Args:
+        funct (DexiDiscretizeFunction): A discretization function.
+        column (np.ndarray): A one-dimensional array of numbers; NaN denotes undefined values.
+
+    Returns:
+        np.ndarray: An integer array of discretized values, of the same length as ``column``.
+    """
+    column = np.asarray(column, dtype = float)
+    uniques, inverse = np.unique(column, return_inverse = True)
+    mapped = [UNDEFINED if np.isnan(val) else funct.evaluate(float(val)) for val in uniques]
+    mapped = [val if isinstance(val, int) else UNDEFINED for val in mapped]
+    return np.array(mapped, dtype = np.int64)[inverse.reshape(-1)]
+
+def aggregate_columns(table: np.ndarray, columns: Sequence[np.ndarray]) -> np.ndarray:
+    """Evaluates a dense decision table for a batch of integer argument columns.
+
+    Args:
+        table (np.ndarray): A dense decision table, as returned by :py:func:`dexipy.batch.crisp_table`.
+        columns (Sequence[np.ndarray]): A sequence of integer columns, one for each table dimension.
+
+    Returns:
+        np.ndarray: An integer column of function values. Rows containing undefined or
+        out-of-range arguments evaluate to ``UNDEFINED``.
+    """
+    dim = table.shape
+    valid = np.ones(len(columns[0]), dtype = bool)
+    flat_idx = np.zeros(len(columns[0]), dtype = np.int64)
+    for col, size in zip(columns, dim):
+        valid &= (col >= 0) & (col < size)
+        flat_idx = flat_idx * size + col
+    result = table.reshape(-1)[np.where(valid, flat_idx, 0)]
+    result[~valid] = UNDEFINED
+    return result
+
+def value_column(values: Any) -> np.ndarray:
+    """Converts a sequence of values to a one-dimensional array.
+
+    Sequences that contain strings, or that cannot be converted to a one-dimensional array
+    because they contain value distributions, are converted to object arrays.
+
+    Args:
+        values (Any): A sequence of values.
+
+    Returns:
+        np.ndarray: A one-dimensional array.
+    """
+    try:
+        column = np.asarray(values)
+    except ValueError:
+        column = None
+    if column is not None and column.ndim == 1 and column.dtype.kind not in "US":
+        return column
+    column = np.empty(len(values), dtype = object)
+    for i, val in enumerate(values):
+        column[i] = val
+    return column
+
+def batch_input_columns(plan: DexiEvalPlan, data: Any, columns: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+    """Extracts input columns of basic attributes from ``data``.
+
+    Args:
+        plan (DexiEvalPlan): An evaluation plan.
+        data (Any): Either a mapping (for instance, a ``dict`` or ``pandas.DataFrame``) from
+            attribute IDs to columns, or a matrix-like object of shape ``(n_alternatives, n_basic)``.
+        columns (Optional[Sequence[str]], optional): Attribute IDs of matrix columns.
+            Defaults to None, which selects ``plan.basic_ids``.
+
+    Raises:
+        ValueError: When data of some basic attribute is missing or has a wrong shape.
+
+    Returns:
+        Dict[str, np.ndarray]: A dictionary of one-dimensional columns, keyed by basic attribute IDs.
+    """
+    if hasattr(data, "keys"):
+        missing = [id for id in plan.basic_ids if id not in data.keys()]
+        if missing:
+            raise ValueError(f"Missing data of basic attributes: {missing}")
+        return {id: value_column(data[id]) for id in plan.basic_ids}
+    matrix = np.asarray(data)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    if columns is None:
+        columns = plan.basic_ids
+    if matrix.ndim != 2 or matrix.shape[1] != len(columns):
+        raise ValueError(f"Expected a matrix with {len(columns)} columns, got shape {matrix.shape}")
+    missing = [id for id in plan.basic_ids if id not in columns]
+    if missing:
+        raise ValueError(f"Missing data of basic attributes: {missing}")
+    col_idx = {id: i for i, id in enumerate(columns)}
+    by_column = np.ascontiguousarray(matrix.T)
+    return {id: by_column[col_idx[id]] for id in plan.basic_ids}
+
+def evaluate_crisp(model: DexiModel,
+                   data: Any,
+                   root: Optional[DexiAttribute] = None,
+                   prune: List[str] = [],
+                   columns: Optional[Sequence[str]] = None,
+                   as_frame: bool = False) -> Any:
+    """Evaluates a batch of crisp alternatives.
+
+    Args:
+        model (DexiModel): A DexiModel.
+        data (Any): Values of basic attributes, given either as a mapping from attribute IDs
+            to columns (for instance, a ``dict`` or ``pandas.DataFrame``), or as a matrix-like object
+            of shape ``(n_alternatives, n_basic)``. Discrete values are given as integer value indices,
+            using ``UNDEFINED`` for undefined values. Columns of other DEXi values (object arrays)
+            are packed using :py:func:`dexipy.values.pack_dexi_values`; their values that are not
+            single value indices are considered undefined. Continuous values are given as numbers,
+            using NaN for undefined values.
+        root (Optional[DexiAttribute], optional): The topmost (root) attribute of the evaluation.
+            Defaults to None, which selects ``model.root``.
+        prune (List[str], optional): List of attribute IDs at which the evaluation is "pruned".
+            Defaults to [].
+        columns (Optional[Sequence[str]], optional): Attribute IDs of matrix ``data`` columns.
+            Defaults to None, which assumes the order of ``model.eval_plan(root, prune).basic_ids``.
+        as_frame (bool, optional): Whether to return a ``pandas.DataFrame`` rather than a dictionary.
+            Defaults to False.
+
+    Returns:
+        Any: A dictionary of integer columns, keyed by IDs of all evaluated discrete attributes
+        in the evaluation order, or an equivalent ``pandas.DataFrame`` if ``as_frame``.
+        Columns of continuous attributes are not included.
+    """
+    plan = model.eval_plan(root, prune)
+    inputs = batch_input_columns(plan, data, columns)
+    nalt = len(next(iter(inputs.values()))) if len(inputs) > 0 else 0
+    result: Dict[str, np.ndarray] = {}
+    for id, kind, att, scl, link, inp_ids in plan.steps:
+        if kind == DexiEvalPlan.BASIC:
+            if scl.is_continuous():
+                result[id] = np.asarray(inputs[id], dtype = float)
+            elif inputs[id].dtype == object:
+                result[id] = vls.pack_dexi_values(inputs[id], scl).codes
+            else:
+                result[id] = valid_column(inputs[id], scl.count())
+        elif kind == DexiEvalPlan.LINK:
+            result[id] = result[link]
+        elif kind == DexiEvalPlan.AGGREGATE:
+            funct = att.funct
+            if isinstance(funct, DexiTabularFunction):
+                table = evaluation_table(funct, scl.count())
+                result[id] = table[tuple(result[inp] for inp in inp_ids)]
+            elif isinstance(funct, DexiDiscretizeFunction):
+                result[id] = discretize_column(funct, result[inp_ids[0]])
+            else:
+                result[id] = np.full(nalt, UNDEFINED, dtype = np.int64)
+        else:
+            result[id] = np.full(nalt, UNDEFINED, dtype = np.int64)
+    output = {id: col for id, col in result.items() if col.dtype.kind == "i"}
+    if not as_frame:
+        return output
+    import pandas as pd
+    index = data.index if hasattr(data, "index") and hasattr(data, "columns") else None
+    return pd.DataFrame(output, index = index)
+
+def evaluate_sets(model: DexiModel,
+                  data: Any,
+                  root: Optional[DexiAttribute] = None,
+                  prune: List[str] = [],
+                  columns: Optional[Sequence[str]] = None) -> Dict[str, vls.DexiPackedValues]:
+    """Evaluates a batch of alternatives whose discrete values are single values or value sets.
+
+    Args:
+        model (DexiModel): A DexiModel.
+        data (Any): Values of basic attributes, given as in :py:func:`dexipy.batch.evaluate_crisp`.
+            Columns of discrete attributes are packed using :py:func:`dexipy.values.pack_dexi_values`,
+            so they may contain any DEXi values; distributions are interpreted as sets of their
+            non-zero members, like in the "set" evaluation method.
+        root (Optional[DexiAttribute], optional): The topmost (root) attribute of the evaluation.
+            Defaults to None, which selects ``model.root``.
+        prune (List[str], optional): List of attribute IDs at which the evaluation is "pruned".
+            Defaults to [].
+        columns (Optional[Sequence[str]], optional): Attribute IDs of matrix ``data`` columns.
+            Defaults to None, which assumes the order of ``model.eval_plan(root, prune).basic_ids``.
+
+    Raises:
+        ValueError: When some discrete scale has more than :py:data:`dexipy.values.PACKED_LIMIT` values.
+
+    Returns:
+        Dict[str, vls.DexiPackedValues]: Packed values of all evaluated discrete attributes,
+        keyed by their IDs in the evaluation order. Use :py:meth:`dexipy.values.DexiPackedValues.values`
+        to convert them to DEXi values. Continuous attributes are not included.
+    """
+    plan = model.eval_plan(root, prune)
+    inputs = batch_input_columns(plan, data, columns)
+    nalt = len(next(iter(inputs.values()))) if len(inputs) > 0 else 0
+    result: Dict[str, np.ndarray] = {}
+    sizes: Dict[str, int] = {}
+    for id, kind, att, scl, link, inp_ids in plan.steps:
+        if scl is not None and scl.is_discrete():
+            sizes[id] = scl.count()
+        if kind == DexiEvalPlan.BASIC:
+            if scl.is_continuous():
+                result[id] = np.asarray(inputs[id], dtype = float)
+            elif inputs[id].dtype == object:
+                result[id] = vls.pack_dexi_values(inputs[id], scl).masks
+            else:
+                result[id] = vls.pack_dexi_values(valid_column(inputs[id], scl.count()), scl).masks
+        elif kind == DexiEvalPlan.LINK:
+            result[id] = result[link]
+        elif kind == DexiEvalPlan.AGGREGATE and id in sizes:
+            funct = att.funct
+            if isinstance(funct, DexiTabularFunction):
+                result[id] = aggregate_sets(set_table(funct, sizes[id]), [result[inp] for inp in inp_ids])
+            elif isinstance(funct, DexiDiscretizeFunction):
+                codes = valid_column(discretize_column(funct, result[inp_ids[0]]), sizes[id])
+                result[id] = vls.pack_dexi_values(codes, scl).masks
+            else:
+                result[id] = np.zeros(nalt, dtype = np.uint64)
+        else:
+            result[id] = np.zeros(nalt, dtype = np.uint64)
+    return {id: vls.DexiPackedValues.from_masks(col, sizes[id]) for id, col in result.items() if id in sizes}
@@ -0,0 +1,392 @@
+"""
+The module ``dexipy.cache`` implements caches of DEXi models and evaluation results.
+
+:py:class:`dexipy.cache.DexiModelCache` is a process-wide cache of DEXi models read from ``.dxi`` files.
+
+Models are cached by absolute file name and validated against the file's modification time
+and size, so that a modified file is read again on the next request. Files are read outside
+the cache's lock, so reading one file does not delay requests for other files, while concurrent
+requests for the same file wait for a single read.
+
+Cached models are shared between all callers. They are frozen (see :py:meth:`dexipy.dexi.DexiModel.freeze`),
+so callers that need to modify a model, or to enable its evaluation cache, must use ``copy.deepcopy()``
+to obtain a private copy.
+
+Optionally, models are read using :py:func:`dexipy.snapshot.read_dexi`, which loads an up-to-date
+snapshot (``.dxs`` file) when one exists next to the ``.dxi`` file and writes one otherwise, so that
+only the first read of a file after it has changed needs to parse it. Snapshots are pickles,
+so this is enabled only on request and only for directories that are as trusted as the models.
+
+The default cache is :py:data:`dexipy.cache.model_cache`, which is used by
+:py:func:`dexipy.dexi.read_dexi_cached`.
+
+:py:class:`dexipy.cache.DexiEvalCache` is an optional cache of evaluation results of a single model,
+assigned to :py:attr:`dexipy.dexi.DexiModel.eval_cache` (see :py:meth:`dexipy.dexi.DexiModel.enable_eval_cache`).
+Results are keyed by the values of basic attributes and by evaluation settings, so that alternatives
+with the same input values are evaluated only once. Optionally, values of each aggregate attribute's
+subtree are cached, too, keyed by the values of basic attributes that affect them, so that
+alternatives that share only some input values reuse the corresponding parts of evaluation.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Tuple
+from dexipy.types import DexiValue, DexiAlternatives
+from dexipy.dexi import DexiModel
+import dexipy.eval as eval
+import dexipy.parse as parse
+import dexipy.snapshot as snapshot
+
+class DexiModelCache:
+    """A thread-safe least-recently-used (LRU) cache of DEXi models.
+
+    Args:
+        maxsize (int, optional): Maximum number of cached models. Defaults to 16.
+        snapshots (bool, optional): Whether to load models from up-to-date snapshots when available
+            and to write snapshots of parsed models (see :py:func:`dexipy.snapshot.read_dexi`).
+            Defaults to False.
+
+    Raises:
+        ValueError: When ``maxsize`` is less than 1.
+    """
+
+    def __init__(self, maxsize: int = 16, snapshots: bool = False):
+        self.snapshots = snapshots
+        self._models: OrderedDict[str, Tuple[Tuple[int, int], DexiModel]] = OrderedDict()
+        self._loading: Dict[str, Tuple[Tuple[int, int], Future]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.maxsize = maxsize
+
+    @property
+    def maxsize(self) -> int:
+        """Maximum number of cached models. Setting a smaller size evicts least recently used models."""
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: int) -> None:
+        if maxsize < 1:
+            raise ValueError(f"Cache size must be at least 1, got {maxsize}")
+        with self._lock:
+            self._maxsize = maxsize
+            while len(self._models) > maxsize:
+                self._models.popitem(last = False)
+
+    @staticmethod
+    def file_key(filename: str) -> Tuple[str, Tuple[int, int]]:
+        """Determines the cache key and file signature of ``filename``.
+
+        Args:
+            filename (str): File name.
+
+        Raises:
+            OSError: When the file cannot be accessed.
+
+        Returns:
+            Tuple[str, Tuple[int, int]]: Absolute file name and a tuple ``(mtime_ns, size)``.
+        """
+        path = os.path.abspath(filename)
+        stat = os.stat(path)
+        return path, (stat.st_mtime_ns, stat.st_size)
+
+    def read_dexi(self, filename: str) -> DexiModel:
+        """Returns the cached model read from ``filename``, reading the file if it has not been
+        cached yet or has been modified since.
+
+        The file is read without holding the cache's lock. Concurrent requests for the same
+        file and signature wait for the first one to read it.
+
+        Args:
+            filename (str): File name.
+
+        Returns:
+            DexiModel: A frozen DEXi model, shared between all callers
+            (see :py:meth:`dexipy.dexi.DexiModel.freeze`).
+        """
+        path, signature = self.file_key(filename)
+        with self._lock:
+            entry = self._models.get(path)
+            if entry is not None and entry[0] == signature:
+                self._models.move_to_end(path)
+                self.hits += 1
+                return entry[1]
+            loading = self._loading.get(path)
+            if loading is not None and loading[0] == signature:
+                self.hits += 1
+                future = loading[1]
+                owner = False
+            else:
+                self.misses += 1
+                future = Future()
+                self._loading[path] = (signature, future)
+                owner = True
+        if not owner:
+            return future.result()
+
+        try:
+            model = snapshot.read_dexi(path, write = True) if self.snapshots else parse.read_dexi(path)
+            model.freeze()
+        except BaseException as error:
+            with self._lock:
+                if self._loading.get(path, (None, None))[1] is future:
+                    del self._loading[path]
+            future.set_exception(error)
+            raise
+        with self._lock:
+            if self._loading.get(path, (None, None))[1] is future:
+                del self._loading[path]
+                self._models[path] = (signature, model)
+                self._models.move_to_end(path)
+                while len(self._models) > self._maxsize:
+                    self._models.popitem(last = False)
+        future.set_result(model)
+        return model
+
+    def invalidate(self, filename: str) -> None:
+        """Removes the model read from ``filename`` from the cache.
+
+        Args:
+            filename (str): File name.
+        """
+        path = os.path.abspath(filename)
+        with self._lock:
+            self._models.pop(path, None)
+            self._loading.pop(path, None)
+
+    def clear(self) -> None:
+        """Removes all models from the cache and resets statistics."""
+        with self._lock:
+            self._models.clear()
+            self._loading.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> Dict[str, Any]:
+        """Returns cache statistics.
+
+        Returns:
+            Dict[str, Any]: A dictionary with elements ``"hits"``, ``"misses"``,
+            ``"size"`` (the number of currently cached models) and ``"maxsize"``.
+        """
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._models), "maxsize": self._maxsize}
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+model_cache = DexiModelCache()
+"""The default process-wide model cache."""
+
+def value_key(value: DexiValue) -> Any:
+    """Converts a DEXi value to a hashable key. Values that are interpreted equally during
+    evaluation, such as sets and tuples of the same elements, have equal keys.
+
+    Numbers are keyed together with their types, since values such as ``True``, ``1`` and ``1.0``
+    are equal in Python, but are not interpreted equally during evaluation.
+
+    Args:
+        value (DexiValue): A DEXi value.
+
+    Returns:
+        Any: A hashable key.
+    """
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)):
+        return (type(value), value)
+    if isinstance(value, (set, tuple)):
+        return ("set", tuple(sorted(set(value_key(el) for el in value), key = repr)))
+    if isinstance(value, list):
+        return ("list", tuple(value_key(el) for el in value))
+    if isinstance(value, dict):
+        return ("dict", tuple(sorted(((value_key(k), value_key(v)) for k, v in value.items()), key = repr)))
+    return ("repr", type(value), repr(value))
+
+def copy_record(record: Dict[str, DexiValue]) -> Dict[str, DexiValue]:
+    """Copies a record of evaluated values, so that the copy can be modified independently of ``record``.
+
+    DEXi values are numbers, strings, None, or value sets and distributions whose elements are numbers.
+    Therefore, only sets, lists and dictionaries are copied, and shallow copies of them suffice.
+
+    Args:
+        record (Dict[str, DexiValue]): Values keyed by attribute IDs.
+
+    Returns:
+        Dict[str, DexiValue]: A copy of ``record``.
+    """
+    return {id: value.copy() if isinstance(value, (set, list, dict)) else value for id, value in record.items()}
+
+class DexiEvalCache:
+    """A thread-safe least-recently-used (LRU) cache of evaluation results of a single DEXi model.
+
+    The cache assumes that the model is not modified while the cache is in use; it is cleared
+    by :py:meth:`dexipy.dexi.DexiModel.setup` and :py:meth:`dexipy.dexi.DexiModel.propagate_ids`.
+    Frozen models (see :py:meth:`dexipy.dexi.DexiModel.freeze`) are best suited for caching.
+
+    Args:
+        maxsize (int, optional): Maximum number of cached results. When ``subtrees`` is True,
+            the same limit applies separately to cached subtree values. Defaults to 1024.
+        subtrees (bool, optional): Whether to cache values of aggregate attributes' subtrees, too.
+            Defaults to False.
+
+    Raises:
+        ValueError: When ``maxsize`` is less than 1.
+
+    Attributes:
+        hits (int): Number of alternatives whose results were taken from the cache.
+        misses (int): Number of alternatives that had to be evaluated.
+        evictions (int): Number of results and subtree values removed to keep the cache within ``maxsize``.
+        subtree_hits (int): Number of subtree values taken from the cache.
+    """
+
+    def __init__(self, maxsize: int = 1024, subtrees: bool = False):
+        if maxsize < 1:
+            raise ValueError(f"Cache size must be at least 1, got {maxsize}")
+        self.maxsize = maxsize
+        self.subtrees = subtrees
+        self._results: OrderedDict[Any, Dict[str, DexiValue]] = OrderedDict()
+        self._subtree_values: OrderedDict[Any, Dict[str, DexiValue]] = OrderedDict()
+        self._plans: Dict[eval.DexiEvalPlan, Tuple[Dict[str, List[str]], Dict[str, List[str]]]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.subtree_hits = 0
+
+    @staticmethod
+    def _context(plan: eval.DexiEvalPlan, eval_param: eval.DexiEvalParameters, bounding: bool) -> Tuple[Any, ...]:
+        return (plan.root.id, plan.prune, eval_param.method, eval_param.and_op, eval_param.or_op, eval_param.norm, bounding)
+
+    def _subtree_info(self, plan: eval.DexiEvalPlan) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
+        # For each aggregate attribute: IDs of evaluation steps in its subtree, and IDs of alternative
+        # values that determine them (basic attributes, including those reached through links).
+        entry = self._plans.get(plan)
+        if entry is None:
+            members: Dict[str, List[str]] = {}
+            inputs: Dict[str, List[str]] = {}
+            step_ids = set(step[0] for step in plan.steps)
+            for id, kind, att, scl, link, inp_ids in plan.steps:
+                if kind == eval.DexiEvalPlan.BASIC:
+                    members[id], inputs[id] = [id], [id]
+                elif kind == eval.DexiEvalPlan.LINK:
+                    members[id] = [id]
+                    inputs[id] = list(inputs[link]) if link in inputs else [link]
+                elif kind == eval.DexiEvalPlan.AGGREGATE:
+                    members[id] = [m for inp in inp_ids if inp in step_ids for m in members[inp]] + [id]
+                    inputs[id] = sorted(set(i for inp in inp_ids for i in inputs.get(inp, [inp])))
+                else:
+                    members[id], inputs[id] = [id], []
+            entry = (members, inputs)
+            self._plans[plan] = entry
+        return entry
+
+    def _store(self, table: OrderedDict, key: Any, record: Dict[str, DexiValue]) -> None:
+        table[key] = record
+        table.move_to_end(key)
+        while len(table) > self.maxsize:
+            table.popitem(last = False)
+            self.evictions += 1
+
+    def _evaluate_subtrees(self, plan: eval.DexiEvalPlan, alt: Dict[str, Any], context: Tuple[Any, ...],
+                           eval_param: eval.DexiEvalParameters, bounding: bool) -> None:
+        members, inputs = self._subtree_info(plan)
+        raw = {id: value_key(eval.get_alt_value(alt, id)) for id in set(i for ids in inputs.values() for i in ids)}
+        keys = {}
+        known: Dict[str, DexiValue] = {}
+        for step in reversed(plan.steps):
+            id = step[0]
+            if step[1] != eval.DexiEvalPlan.AGGREGATE or id in known:
+                continue
+            keys[id] = (context, id, tuple(raw[i] for i in inputs[id]))
+            with self._lock:
+                record = self._subtree_values.get(keys[id])
+                if record is not None:
+                    self._subtree_values.move_to_end(keys[id])
+                    self.subtree_hits += 1
+            if record is not None:
+                known.update(record)
+        alt.update(copy_record(known))
+        remaining = [step for step in plan.steps if step[0] not in known]
+        eval.evaluate_steps(remaining, [alt], eval_param, bounding)
+        with self._lock:
+            for step in remaining:
+                if step[1] == eval.DexiEvalPlan.AGGREGATE:
+                    self._store(self._subtree_values, keys[step[0]], copy_record({m: alt[m] for m in members[step[0]]}))
+
+    def evaluate_steps(self, plan: eval.DexiEvalPlan, alts: DexiAlternatives,
+                       eval_param: eval.DexiEvalParameters, bounding: bool = False) -> None:
+        """Evaluates alternatives according to ``plan``, modifying them in place, like
+        :py:func:`dexipy.eval.evaluate_steps` does for ``plan.steps``, but using and updating cached results.
+
+        Alternatives with equal values of ``plan.basic_ids`` (including duplicates within ``alts``) are
+        evaluated only once. The remaining alternatives are evaluated in a batch or, when ``self.subtrees``
+        is True, one by one, reusing cached values of subtrees.
+
+        Args:
+            plan (eval.DexiEvalPlan): An evaluation plan of the model.
+            alts (DexiAlternatives): A list of alternatives.
+            eval_param (eval.DexiEvalParameters): Evaluation parameters.
+            bounding (bool, optional): Whether or not the evaluation keeps calculated values within
+                bounds prescribed by the corresponding scales. Defaults to False.
+        """
+        context = self._context(plan, eval_param, bounding)
+        step_ids = [step[0] for step in plan.steps]
+        pending: Dict[Any, List[Dict[str, Any]]] = {}
+        with self._lock:
+            for alt in alts:
+                key = (context, tuple(value_key(eval.get_alt_value(alt, id)) for id in plan.basic_ids))
+                record = self._results.get(key)
+                if record is not None:
+                    self._results.move_to_end(key)
+                    self.hits += 1
+                    alt.update(copy_record(record))
+                elif key in pending:
+                    self.hits += 1
+                    pending[key].append(alt)
+                else:
+                    self.misses += 1
+                    pending[key] = [alt]
+        if len(pending) == 0:
+            return
+        first = [group[0] for group in pending.values()]
+        if self.subtrees:
+            for alt in first:
+                self._evaluate_subtrees(plan, alt, context, eval_param, bounding)
+        else:
+            eval.evaluate_steps(plan.steps, first, eval_param, bounding)
+        with self._lock:
+            for key, group in pending.items():
+                record = {id: group[0][id] for id in step_ids}
+                for alt in group[1:]:
+                    alt.update(copy_record(record))
+                self._store(self._results, key, copy_record(record))
+
+    def clear(self) -> None:
+        """Removes all results from the cache and resets statistics."""
+        with self._lock:
+            self._results.clear()
+            self._subtree_values.clear()
+            self._plans.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.subtree_hits = 0
+
+    def info(self) -> Dict[str, Any]:
+        """Returns cache statistics.
+
+        Returns:
+            Dict[str, Any]: A dictionary with elements ``"hits"``, ``"misses"``, ``"evictions"``,
+            ``"subtree_hits"``, ``"size"`` (the number of currently cached results),
+            ``"subtree_size"`` (the number of currently cached subtree values) and ``"maxsize"``.
+        """
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                    "subtree_hits": self.subtree_hits, "size": len(self._results),
+                    "subtree_size": len(self._subtree_values), "maxsize": self.maxsize}
+
+    def __len__(self) -> int:
+        return len(self._results)
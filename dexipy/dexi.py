@@ -4,16 +4,41 @@ and exposes all functions that are usually used to read DEXi models and evaluate
 """
 
 from __future__ import annotations
-from typing import Any, Sequence, Union, Tuple, Set, List, Dict, Optional, Iterable
+from typing import Any, Sequence, Union, Tuple, Set, List, Dict, Optional, Iterable, Iterator, Callable
 import math
 import keyword as kwd
+import numpy as np
 from copy import deepcopy
 from dexipy.types import BoundAssoc, DexiOrder, DexiQuality, DexiValue
 from dexipy.types import DexiAlternative, DexiAlternatives, DexiAltData
 import dexipy.utils as utl
 import dexipy.values as vls
 
-class DexiScale:
+class _Freezable:
+    # Base of classes whose instances can be frozen by DexiModel.freeze(): assigning their attributes
+    # then raises ValueError. Copies made using copy, deepcopy or pickle are not frozen.
+
+    _frozen = False
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self._frozen:
+            raise ValueError(f'Cannot modify "{name}" of a frozen {type(self).__name__}')
+        object.__setattr__(self, name, value)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state.pop("_frozen", None)
+        return state
+
+    def _freeze(self) -> None:
+        object.__setattr__(self, "_frozen", True)
+
+    @property
+    def frozen(self) -> bool:
+        """Whether this object has been frozen (see :py:meth:`dexipy.dexi.DexiModel.freeze`)."""
+        return self._frozen
+
+class DexiScale(_Freezable):
     """``DexiScale`` is a base class for representing DEXi value scales.
 
     A value scale defines the type and set of values that can be assigned to some
@@ -417,6 +442,34 @@ def value_text(value: DexiValue, scale: Any, none: Optional[str] = None,
             result = {value_text(key, scale, none): utl.round_float(val, decimals) for key, val in value.items()}
     return str(result)
 
+def range_text(value: DexiValue, scale: Any, none: Optional[str] = None) -> Optional[str]:
+    """Represents ``value`` by a compact string, as in the decision tables of DEXi.
+
+    Single values are represented by value names, value sets by ranges of the form
+    ``"low:high"`` when they are intervals of consecutive values, and by comma-separated
+    value names otherwise. Other values are represented using :py:func:`dexipy.dexi.value_text`.
+
+    Args:
+        value (DexiValue): A DEXi value.
+        scale (Any): Expected a :py:class:`dexipy.dexi.DexiScale` object.
+        none (Optional[str], optional): An optional string that is returned
+            when the value cannot be interpreted. Defaults to None.
+
+    Returns:
+        Optional[str]: A string representation of ``value``.
+    """
+    scale = scale_of(scale)
+    if not isinstance(value, (set, tuple)) or scale is None or not scale.is_discrete():
+        return value_text(value, scale, none)
+    if len(value) == 0 or not all(isinstance(val, int) and 0 <= val < scale.count() for val in value):
+        return value_text(value, scale, none)
+    vals = sorted(set(value))
+    if len(vals) == 1:
+        return scale.values[vals[0]]
+    if vals[-1] - vals[0] == len(vals) - 1:
+        return scale.values[vals[0]] + ":" + scale.values[vals[-1]]
+    return ", ".join(scale.values[val] for val in vals)
+
 class DexiFunction:
     """``DexiFunction`` is a base class for representing DEXi aggregation and discretization functions.
 
@@ -496,11 +549,20 @@ class DexiTabularFunction(DexiFunction):
     is equal to :math:`3 * 4 = 12`. Each rule defines the value of the attribute for one
     of the possible combinations of values of the attribute's inputs.
     For example, a decision rule ``(0, 1): 2`` maps the zeroth and first value of the first and
-    second input attribute to value 2 of the output attribute. A decision table is
-    represented as a dictionary of such rules. Thus, it can be interpreted as a lookup table
-    that, given a vector of values of ``attribute.inputs``, (i.e., function arguments)
-    returns the corresponding output attribute value. In general, the output value can be any
-    :ref:`DEXi value <dexivalues>`.
+    second input attribute to value 2 of the output attribute. A decision table can be
+    interpreted as a lookup table that, given a vector of values of ``attribute.inputs``,
+    (i.e., function arguments) returns the corresponding output attribute value. In general,
+    the output value can be any :ref:`DEXi value <dexivalues>`.
+
+    Internally, the decision table is stored compactly in ``self.codes``, a C-ordered integer
+    ``numpy.ndarray`` of shape ``self.dim``. Non-negative codes are function values themselves,
+    ``DexiTabularFunction.UNDEFINED`` denotes undefined (None) values, and codes below
+    ``UNDEFINED`` refer to other values (such as value sets and distributions), which are
+    kept in a side table. Using mixed-radix strides, each rule is found by a single
+    multiply-add over function arguments. For compatibility, the decision table is also
+    available as a dictionary ``self.values`` that maps function arguments (integer tuples)
+    to function values. The dictionary is materialized only when first accessed, and
+    assignments to its elements are propagated to ``self.codes``.
 
     Notes:
         * In order to properly define the context in which the newly created function operates,
@@ -514,9 +576,9 @@ class DexiTabularFunction(DexiFunction):
            discrete (i.e., associated with :py:class:`dexipy.dexi.DexiDiscreteScale`. Defaults to None.
         dim (Any, optional): A list of integers, representing the size of the corresponding
            input attribute dimensions. Defaults to None.
-        values (Optional[List[DexiValue]], optional): A decision table. Represented in the form
-            of a dictionary that maps function arguments (represented as integer tuples) to function values
-            (represented as :ref:`dexivalues`). Defaults to None.
+        values (Optional[List[DexiValue]], optional): A decision table, represented by a list of
+            function values (represented as :ref:`dexivalues`) in the order determined by
+            :py:func:`dexipy.utils.cartesian_product`. Defaults to None.
         low (Optional[str], optional): A DEXi string representing lower bounds of function values
             in ``.dxi`` files. Defaults to None.
         high (Optional[str], optional): A DEXi string representing upper bounds of function values
@@ -529,6 +591,10 @@ class DexiTabularFunction(DexiFunction):
         ValueError: When ``low`` and/or ``high`` are of length different than the expected number
            of decision rules.
     """
+
+    UNDEFINED = -1
+    """Code of undefined (None) function values in ``self.codes``."""
+
     def __init__(self,
                  attribute: Optional[DexiAttribute] = None,
                  dim: Any = None, # expected Sequence[int], checked in the code
@@ -564,10 +630,214 @@ class DexiTabularFunction(DexiFunction):
             values = [lvals[i] if lvals[i] == hvals[i] else set(range(lvals[i], hvals[i] + 1)) for i in range(nvals)]
         else:
             values = [None] * nvals
-        ranges = tuple(set(range(dim[i])) for i in range(nargs))
-        indices = utl.cartesian_product(*ranges)
-        assert len(indices) == utl.objlen(values)
-        self.values: Dict[Tuple[int, ...], DexiValue] = {indices[i]: values[i] for i in range(nvals)}
+        strides: List[int] = []
+        stride = 1
+        for d in reversed(dim):
+            strides.insert(0, stride)
+            stride *= d
+        self.strides: Tuple[int, ...] = tuple(strides)
+        self.set_value_vector(values)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_values"] = None
+        state["_derived"] = {}
+        del state["_flat"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._flat = self.codes.reshape(-1)
+
+    def _encode(self, value: DexiValue) -> int:
+        if type(value) is int and value >= 0:
+            return value
+        if value is None:
+            return self.UNDEFINED
+        self._extra.append(value)
+        return self.UNDEFINED - len(self._extra)
+
+    def _decode(self, code: int) -> DexiValue:
+        if code >= 0:
+            return code
+        if code == self.UNDEFINED:
+            return None
+        return self._extra[self.UNDEFINED - code - 1]
+
+    def set_value_vector(self, values: List[DexiValue]) -> None:
+        """Sets all decision rules of this function.
+
+        Args:
+            values (List[DexiValue]): A list of function values, of length ``self.nvals()``, in the order
+               determined by :py:func:`dexipy.utils.cartesian_product`.
+
+        Raises:
+            ValueError: When ``values`` is of a wrong length or the function is read-only.
+        """
+        if hasattr(self, "codes") and self.read_only:
+            raise ValueError("Cannot modify a read-only decision table")
+        nvals = utl.prod(self.dim)
+        if utl.objlen(values) != nvals:
+            raise ValueError(f"Length of 'values' is {utl.objlen(values)}, expected {nvals}")
+        self._extra: List[DexiValue] = []
+        codes = [self._encode(val) for val in values]
+        dtype = np.result_type(np.min_scalar_type(min(codes + [self.UNDEFINED])), np.min_scalar_type(-max(codes) - 1))
+        self.codes: np.ndarray = np.array(codes, dtype = dtype).reshape(self.dim)
+        self._flat: np.ndarray = self.codes.reshape(-1)
+        self._values: Optional[Dict[Tuple[int, ...], DexiValue]] = None
+        self._derived: Dict[Any, Any] = {}
+
+    def offset(self, args: Iterable[int]) -> int:
+        """Returns the position of the decision rule for ``args`` in the flattened decision table.
+
+        Args:
+            args (Iterable[int]): A vector of integer arguments passed to the function.
+
+        Raises:
+            KeyError: When ``args`` do not correspond to any decision rule.
+
+        Returns:
+            int: Rule position, i.e., :math:`\\sum_i args_i * strides_i`.
+        """
+        args = tuple(args)
+        if len(args) != len(self.strides):
+            raise KeyError(args)
+        offset = 0
+        for arg, size, stride in zip(args, self.dim, self.strides):
+            if not 0 <= arg < size:
+                raise KeyError(args)
+            offset += arg * stride
+        return offset
+
+    def set_value(self, args: Iterable[int], value: DexiValue) -> None:
+        """Sets the function value for given arguments.
+
+        Args:
+            args (Iterable[int]): A vector of integer arguments.
+            value (DexiValue): Function value for the given ``args``.
+
+        Raises:
+            KeyError: When ``args`` do not correspond to any decision rule.
+            ValueError: When the function is read-only.
+        """
+        if self.read_only:
+            raise ValueError("Cannot modify a read-only decision table")
+        args = tuple(args)
+        offset = self.offset(args)
+        code = self._encode(value)
+        if not np.can_cast(np.min_scalar_type(-abs(code) - 1), self.codes.dtype):
+            self.codes = self.codes.astype(np.result_type(np.min_scalar_type(-abs(code) - 1), self.codes.dtype))
+            self._flat = self.codes.reshape(-1)
+        self._flat[offset] = code
+        if len(self._extra) > 2 * np.count_nonzero(self._flat < self.UNDEFINED) + 8:
+            self._compact_extra()
+        self._derived = {}
+        if self._values is not None:
+            dict.__setitem__(self._values, args, value)
+
+    def _compact_extra(self) -> None:
+        # drop side-table values that are no longer referenced by any rule, keeping their order
+        other = self._flat < self.UNDEFINED
+        used = np.unique(self.UNDEFINED - self._flat[other] - 1)
+        remap = np.full(len(self._extra), 0, dtype = np.int64)
+        remap[used] = np.arange(len(used))
+        self._flat[other] = self.UNDEFINED - remap[self.UNDEFINED - self._flat[other] - 1] - 1
+        self._extra = [self._extra[i] for i in used.tolist()]
+
+    @property
+    def read_only(self) -> bool:
+        """Whether the decision table has been frozen (see :py:meth:`dexipy.dexi.DexiTabularFunction.freeze`)."""
+        return not self.codes.flags.writeable
+
+    def freeze(self) -> None:
+        """Makes the decision table read-only, so that it can be safely shared.
+        Any subsequent attempt to change decision rules raises ValueError.
+        Copies of the function, made using ``copy.deepcopy()`` or ``pickle``, are not read-only.
+        """
+        self.codes.flags.writeable = False
+        self._flat.flags.writeable = False
+
+    def is_crisp(self) -> bool:
+        """Checks whether all decision rules map to single integer values.
+
+        Returns:
+            bool: True if no rule is undefined or maps to a value set or distribution.
+        """
+        return bool(self.codes.size > 0 and self.codes.min() >= 0)
+
+    def derived(self, key: Any, compute: Callable[[DexiTabularFunction], Any]) -> Any:
+        """Returns some data derived from the decision table of this function, such as
+        its monotonicity or an array representation used in evaluation.
+
+        The data is computed by ``compute(self)`` on first request and cached
+        until some decision rule is changed.
+
+        Args:
+            key (Any): A hashable key identifying the derived data.
+            compute (Callable[[DexiTabularFunction], Any]): Function that computes the data.
+
+        Returns:
+            Any: Derived data.
+        """
+        if key not in self._derived:
+            self._derived[key] = compute(self)
+        return self._derived[key]
+
+    def directions(self) -> Optional[Tuple[int, ...]]:
+        """Determines the direction of monotonicity of this function with respect to each argument.
+
+        The result is computed once and cached until some decision rule is changed.
+
+        Returns:
+            Optional[Tuple[int, ...]]: A tuple containing, for each argument, +1 if function values
+            are non-decreasing and -1 if they are non-increasing along the corresponding dimension
+            (+1 is used for arguments that do not affect the function value).
+            None if the function is not crisp (see :py:meth:`dexipy.dexi.DexiTabularFunction.is_crisp`)
+            or not monotone in some argument.
+        """
+        def monotone_directions(funct: DexiTabularFunction) -> Optional[Tuple[int, ...]]:
+            if not funct.is_crisp():
+                return None
+            codes = funct.codes.astype(np.int64)
+            directions: Tuple[int, ...] = ()
+            for axis in range(codes.ndim):
+                diff = np.diff(codes, axis = axis)
+                if np.all(diff >= 0):
+                    directions += (+1,)
+                elif np.all(diff <= 0):
+                    directions += (-1,)
+                else:
+                    return None
+            return directions
+
+        return self.derived("directions", monotone_directions)
+
+    def is_monotone(self) -> bool:
+        """Checks whether this function is crisp and monotone in each argument.
+        See :py:meth:`dexipy.dexi.DexiTabularFunction.directions`.
+
+        Returns:
+            bool: Whether the function is monotone.
+        """
+        return self.directions() is not None
+
+    @property
+    def values(self) -> Dict[Tuple[int, ...], DexiValue]:
+        """The decision table represented as a dictionary that maps function arguments
+        (represented as integer tuples) to function values (represented as :ref:`dexivalues`).
+
+        The dictionary is created on first access. Assigning to its elements
+        updates the function (see :py:meth:`dexipy.dexi.DexiTabularFunction.set_value`).
+        """
+        if self._values is None:
+            ranges = tuple(range(d) for d in self.dim)
+            self._values = _DexiRuleDict(self, zip(utl.cartesian_product(*ranges), self.value_vector()))
+        return self._values
+
+    @values.setter
+    def values(self, values: Dict[Tuple[int, ...], DexiValue]) -> None:
+        ranges = tuple(range(d) for d in self.dim)
+        self.set_value_vector([values.get(args) for args in utl.cartesian_product(*ranges)])
 
     def funct_str(self) -> str:
         return str(self.nvals()) + " " + "x".join(str(d) for d in self.dim)
@@ -581,18 +851,16 @@ class DexiTabularFunction(DexiFunction):
         Returns:
             int: Size of the space defined by this function's input attributes.
         """
-        return len(self.values)
+        return self.codes.size
 
     def value_vector(self) -> List[DexiValue]:
         """Returns the vector of this function's values.
 
         Returns:
-            List[DexiValue]: A list of DEXi values, extracted from ``self.values``, in the order
+            List[DexiValue]: A list of DEXi values in the order
             determined using :py:func:`dexipy.utils.cartesian_product`.
         """
-        ranges = tuple(set(range(self.dim[i])) for i in range(self.nargs()))
-        indices = utl.cartesian_product(*ranges)
-        return [self.values[idx] for idx in indices]
+        return [self._decode(code) for code in self._flat.tolist()]
 
     def value(self, args: Iterable[int]) -> DexiValue:
         """Returns the function value for given arguments.
@@ -601,14 +869,94 @@ class DexiTabularFunction(DexiFunction):
             args (Iterable[int]): A vector of integer arguments passed to the function.
 
         Raises:
-            ValueError: When function value cannot be determined for the given ``args``.
+            KeyError: When function value cannot be determined for the given ``args``.
 
         Returns:
             DexiValue: Function value for the given ``args``.
         """
-        return self.values[tuple(args)]
+        return self._decode(self._flat.item(self.offset(args)))
+
+    def rule_table(self, as_frame: bool = False) -> Any:
+        """Returns the decision table as a table of decision rules, one row per rule.
 
-class DexiDiscretizeFunction(DexiFunction):
+        The table is built directly from ``self.codes``. It contains one column for each function
+        argument, named by the IDs of ``self.attribute.inputs`` (or ``"arg1"``, ``"arg2"``, ...
+        when ``self.attribute`` is undefined), followed by a column of function values, named by
+        ``self.attribute.id`` (or ``"value"``). Each column is represented by integer codes that
+        refer to a list of categories. Categories of arguments are names of the corresponding scale values.
+        Categories of function values are the output scale value names, followed by texts of
+        other function values that occur in the table, such as value ranges
+        (see :py:func:`dexipy.dexi.range_text`). Code -1 denotes undefined values.
+
+        Args:
+            as_frame (bool, optional): Whether to return a ``pandas.DataFrame`` of categorical columns
+                rather than a dictionary. Defaults to False.
+
+        Returns:
+            Any: A dictionary that maps column names to tuples ``(codes, categories)``, where ``codes``
+            is an integer ``numpy.ndarray`` and ``categories`` a list of strings,
+            or an equivalent ``pandas.DataFrame`` if ``as_frame``.
+        """
+        def categories(scale: Optional[DexiScale], count: int) -> List[str]:
+            if scale is None or not scale.is_discrete():
+                return [str(val) for val in range(count)]
+            return list(scale.values) + [str(val) for val in range(scale.count(), count)]
+
+        att = self.attribute
+        names = ["arg" + str(i + 1) for i in range(self.nargs())] if att is None else att_names(att.inputs)
+        scales = [None] * self.nargs() if att is None else [inp.scale for inp in att.inputs]
+        args = np.indices(self.dim).reshape(self.nargs(), -1)
+        table: Dict[str, Tuple[np.ndarray, List[str]]] = {}
+        for name, scl, d, codes in zip(names, scales, self.dim, args):
+            table[name] = (codes, categories(scl, d))
+
+        flat = self._flat.astype(np.int64)
+        scale = None if att is None else att.scale
+        labels = categories(scale, int(flat.max(initial = -1)) + 1)
+        positions = {label: i for i, label in enumerate(labels)}
+        text_scale = scale if scale is not None and scale.is_discrete() else DexiDiscreteScale(list(labels))
+        extra: List[int] = []
+        for value in self._extra:
+            text = str(range_text(value, text_scale, str(value)))
+            if text not in positions:
+                positions[text] = len(labels)
+                labels.append(text)
+            extra.append(positions[text])
+        codes = np.where(flat >= 0, flat, -1)
+        if extra:
+            other = flat < self.UNDEFINED
+            codes[other] = np.array(extra)[self.UNDEFINED - flat[other] - 1]
+        table["value" if att is None else att.id] = (codes, labels)
+
+        if not as_frame:
+            return table
+        import pandas as pd
+        return pd.DataFrame({name: pd.Categorical.from_codes(codes, categories = cats) for name, (codes, cats) in table.items()})
+
+class _DexiRuleDict(dict):
+    """A dictionary view of :py:attr:`dexipy.dexi.DexiTabularFunction.values` that
+    propagates assignments to the owning function."""
+
+    def __init__(self, funct: DexiTabularFunction, items: Iterable[Tuple[Tuple[int, ...], DexiValue]]):
+        super().__init__(items)
+        self._funct = funct
+
+    def __setitem__(self, args: Tuple[int, ...], value: DexiValue) -> None:
+        self._funct.set_value(args, value)
+
+    def update(self, *args, **kwargs) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def setdefault(self, args: Tuple[int, ...], value: DexiValue = None) -> DexiValue:
+        return self[args]
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError("Decision rules cannot be removed")
+
+    __delitem__ = pop = popitem = clear = _immutable
+
+class DexiDiscretizeFunction(_Freezable, DexiFunction):
     """``DexiDiscretizeFunction`` represents DEXi functions that discretize numerical values of
     continuous attributes to qualitative values of discrete attributes. A ``DexiDiscretizeFunction``
     can be associated only with a discrete attribute that has exactly one continuous input.
@@ -709,7 +1057,7 @@ class DexiDiscretizeFunction(DexiFunction):
                 lb, la = hb, ha
         return None
 
-class DexiAttribute:
+class DexiAttribute(_Freezable):
     """``DexiAttribute`` is a class representing DEXi attributes.
 
     In a DEXi model, attributes are variables that represent observed properties of decision alternatives.
@@ -954,7 +1302,7 @@ def att_names(atts: Iterable[DexiAttribute], use_id: bool = True) -> List[str]:
     """
     return [None if not isinstance(att, DexiAttribute) else att.id if use_id else att.name for att in atts]
 
-class DexiModel:
+class DexiModel(_Freezable):
     """``DexiModel`` is the class that represents a DEXi model in Python.
 
     In DEXiPy, DexiModel objects are normally created by reading from a ``.dxi`` file,
@@ -992,6 +1340,9 @@ class DexiModel:
         links_ids (List[str]): List of all linked attributes' IDs.
         non_root_ids (List[str]): List of all ``self.non_root`` attributes' IDs.
         alternatives (DexiAlternatives): A list of DEXi decision alternatives defined as part of the model.
+        eval_cache (Optional[dexipy.cache.DexiEvalCache]): An optional cache of evaluation results,
+            used by :py:meth:`dexipy.dexi.DexiModel.evaluate`. Defaults to None, which disables caching.
+            See :py:meth:`dexipy.dexi.DexiModel.enable_eval_cache`. The cache is not pickled.
     """
 
     def __init__(self, name: str = "", description: str = "", root: Optional[DexiAttribute] = None, linking: bool = False):
@@ -1001,8 +1352,16 @@ class DexiModel:
         self.linking = linking
         self.alternatives: DexiAlternatives = []
         self.att_ids: List[str] = []
+        self._eval_plans: Dict[Tuple[str, Tuple[str, ...]], eval.DexiEvalPlan] = {}
+        self.eval_cache: Optional[cache.DexiEvalCache] = None
         self.setup()
 
+    def __getstate__(self) -> Dict[str, Any]:
+        state = super().__getstate__()
+        state["_eval_plans"] = {}
+        state["eval_cache"] = None
+        return state
+
     def propagate_ids(self) -> None:
         """Propagates ``self.att_ids`` to other ``self.*_ids`` lists and to IDs of
         individual attributes in the model.
@@ -1014,6 +1373,40 @@ class DexiModel:
         self.link_ids = [att.id for att in self.links]
         for i, id in enumerate(self.att_ids):
             self.attributes[i].id = id
+        self._index_ids()
+        self._eval_plans = {}
+        if self.eval_cache is not None:
+            self.eval_cache.clear()
+
+    def _index_ids(self) -> None:
+        self._id_index: Dict[str, int] = {}
+        for i, id in enumerate(self.att_ids):
+            self._id_index.setdefault(id, i)
+
+    def freeze(self) -> DexiModel:
+        """Makes the model read-only, so that it can be safely shared, for instance between sessions
+        of an application.
+
+        Decision tables of all model functions are made read-only (see
+        :py:meth:`dexipy.dexi.DexiTabularFunction.freeze`). Assigning any field of the model, its attributes,
+        their scales and discretization functions raises ValueError; this includes ``self.eval_cache``,
+        which must therefore be enabled before freezing. Lists and dictionaries held by a frozen model,
+        such as ``self.alternatives``, are not copied and must not be modified in place.
+        Use ``copy.deepcopy()`` to obtain a private, modifiable copy of a frozen model.
+
+        Returns:
+            DexiModel: The model itself.
+        """
+        for att in self.attributes:
+            if isinstance(att.funct, DexiTabularFunction):
+                att.funct.freeze()
+            elif isinstance(att.funct, DexiDiscretizeFunction):
+                att.funct._freeze()
+            if att.scale is not None:
+                att.scale._freeze()
+            att._freeze()
+        self._freeze()
+        return self
 
     def make_ids(self, max_len: Optional[int] = None, var_names: bool = False) -> None:
         """A helper method for creating attribute IDs from attribute names.
@@ -1051,12 +1444,16 @@ class DexiModel:
         """
         if not isinstance(self.root, DexiAttribute):
             raise ValueError(f'Undefined or non-attribute root attribute in model "{self.name}"')
+        self._eval_plans = {}
+        if self.eval_cache is not None:
+            self.eval_cache.clear()
         self.root.parent = self
         self.parent_attributes(self.root)
         self.attributes = self.collect_attributes(self.root)
         self.non_root = self.attributes[1:]
         self.natt: int = len(self.attributes)
         self.att_names = [att.name for att in self.attributes]
+        self.index_attributes()
         if self.linking:
             self.link_attributes()
         self.basic = [att for att in self.non_root if att.is_basic()]
@@ -1102,6 +1499,24 @@ class DexiModel:
         lines = lines + utl.table_lines(columns, align = "rlllll")
         return "\n".join(lines)
 
+    def index_attributes(self) -> None:
+        """Creates indexes of ``self.attributes`` by attribute name and by parent.
+        Also determines the ranges of ``self.attributes`` occupied by attribute subtrees
+        (see :py:meth:`dexipy.dexi.DexiModel.subtree_range`).
+        Called by :py:meth:`dexipy.dexi.DexiModel.setup`; the index by attribute ID is
+        maintained by :py:meth:`dexipy.dexi.DexiModel.propagate_ids`.
+        """
+        self._name_index: Dict[str, List[int]] = {}
+        for i, name in enumerate(self.att_names):
+            self._name_index.setdefault(name, []).append(i)
+        position = {id(att): i for i, att in enumerate(self.attributes)}
+        self._children: List[List[int]] = [[position[id(inp)] for inp in att.inputs] for att in self.attributes]
+        # self.attributes is in pre-order, so each subtree occupies a contiguous range of indices
+        self._subtree_end: List[int] = list(range(1, self.natt + 1))
+        for i in reversed(range(self.natt)):
+            if self._children[i]:
+                self._subtree_end[i] = self._subtree_end[self._children[i][-1]]
+
     def collect_attributes(self, att: DexiAttribute) -> List[DexiAttribute]:
         """Returns a list of attributes, obtained by a recursive depth-first travesal
         of the subtree rooted at ``att``.
@@ -1138,7 +1553,8 @@ class DexiModel:
         set_parent(att, att.parent)
 
     def _link_candidates(self, name: str) -> List[DexiAttribute]:
-        return [att for att in self.attributes if att.name == name and not att.is_link()]
+        candidates = [self.attributes[i] for i in self._name_index.get(name, [])]
+        return [att for att in candidates if not att.is_link()]
 
     def _link_attribute_by_name(self, name: str) -> Optional[DexiAttribute]:
         bas: Optional[DexiAttribute] = None
@@ -1200,11 +1616,10 @@ class DexiModel:
             searching by name, attribute names may not be unique and only the first index
             is returned in this case.
         """
-        try:
-            atts = self.att_ids if use_id else self.att_names
-            return atts.index(attname)
-        except:
-            return None
+        if use_id:
+            return self._id_index.get(attname)
+        indices = self._name_index.get(attname)
+        return None if indices is None else indices[0]
 
     def att_indices(self, attname: str) -> List[int]:
         """Returns the index of attribute named ``attname`` in ``self.attributes``.
@@ -1217,7 +1632,63 @@ class DexiModel:
             Notice that attribute names may not be unique, resulting in a list containing
             more that one attribute.
         """
-        return [i for i, att in enumerate(self.attributes) if att.name == attname]
+        return list(self._name_index.get(attname, []))
+
+    def children_indices(self, find: Union[DexiAttribute, str, int]) -> List[int]:
+        """Returns indices of input attributes (children) of an attribute.
+
+        Args:
+            find (Union[DexiAttribute, str, int]): An attribute object, ID or index
+                (see :py:meth:`dexipy.dexi.DexiModel.attrib`).
+
+        Returns:
+            List[int]: Indices of the attribute's inputs in ``self.attributes``,
+            or an empty list if the attribute is not found.
+        """
+        att = self.attrib(find)
+        idx = None if att is None else self.att_index(att.id)
+        if idx is None or self.attributes[idx] is not att:
+            return []
+        return list(self._children[idx])
+
+    def subtree_range(self, find: Union[DexiAttribute, str, int]) -> Optional[Tuple[int, int]]:
+        """Returns the range of indices of ``self.attributes`` occupied by the subtree of an attribute.
+
+        Since ``self.attributes`` are ordered depth-first, the subtree rooted at some attribute,
+        consisting of the attribute and all its descendants (through ``inputs``, not links),
+        is the contiguous slice ``self.attributes[start:end]``.
+
+        Args:
+            find (Union[DexiAttribute, str, int]): An attribute object, ID or index
+                (see :py:meth:`dexipy.dexi.DexiModel.attrib`).
+
+        Returns:
+            Optional[Tuple[int, int]]: A tuple ``(start, end)``, where ``start`` is the index of the attribute,
+            or None if the attribute is not found.
+        """
+        att = self.attrib(find)
+        idx = None if att is None else self.att_index(att.id)
+        if idx is None or self.attributes[idx] is not att:
+            return None
+        return idx, self._subtree_end[idx]
+
+    def subtree(self, find: Union[DexiAttribute, str, int], include_root: bool = True) -> List[DexiAttribute]:
+        """Returns attributes of the subtree rooted at an attribute, in the depth-first order.
+
+        Args:
+            find (Union[DexiAttribute, str, int]): An attribute object, ID or index
+                (see :py:meth:`dexipy.dexi.DexiModel.attrib`).
+            include_root (bool, optional): Whether to include the attribute itself. Defaults to True.
+
+        Returns:
+            List[DexiAttribute]: Attributes of the subtree (see :py:meth:`dexipy.dexi.DexiModel.subtree_range`),
+            or an empty list if the attribute is not found.
+        """
+        rng = self.subtree_range(find)
+        if rng is None:
+            return []
+        start, end = rng
+        return self.attributes[start if include_root else start + 1:end]
 
     def attrib(self, find: Union[DexiAttribute, str, int]) -> Optional[DexiAttribute]:
         """A general method for finding an attribute in the model.
@@ -1256,6 +1727,36 @@ class DexiModel:
         """
         return [self.attrib(sel) for sel in select]
 
+    def eval_plan(self, root: Optional[DexiAttribute] = None, prune: List[str] = []) -> eval.DexiEvalPlan:
+        """Returns a compiled evaluation plan for the given ``root`` and ``prune`` combination.
+
+        Plans are created on first request and cached in the model, so that subsequent
+        evaluations skip all attribute lookups. The cache is cleared by
+        :py:meth:`dexipy.dexi.DexiModel.setup` and :py:meth:`dexipy.dexi.DexiModel.propagate_ids`.
+
+        Args:
+            root (Optional[DexiAttribute], optional): The topmost (root) attribute of the evaluation.
+                Defaults to None, which selects ``self.root``.
+            prune (List[str], optional): List of attribute IDs at which the evaluation is "pruned".
+                Defaults to [].
+
+        Raises:
+            ValueError: When ``root`` is undefined.
+
+        Returns:
+            eval.DexiEvalPlan: A (possibly cached) evaluation plan.
+        """
+        if root is None:
+            root = self.root
+        if root is None:
+            raise ValueError("Undefined model root")
+        key = (root.id, tuple(prune))
+        plan = self._eval_plans.get(key)
+        if plan is None or plan.root is not root:
+            plan = eval.DexiEvalPlan(self, root, prune)
+            self._eval_plans[key] = plan
+        return plan
+
     def evaluate(self,
             alternatives: Optional[DexiAltData] = None,
             method: str = "set",
@@ -1299,6 +1800,235 @@ class DexiModel:
         """
         return eval.evaluate(self, alternatives, method, root, prune, pre_check, bounding, in_place, eval_param)
 
+    def evaluate_parallel(self,
+            alternatives: Optional[Iterable[DexiAlternative]] = None,
+            method: str = "set",
+            root: Optional[DexiAttribute] = None,
+            prune: List[str] = [],
+            bounding: bool = False,
+            chunk_size: int = 1000,
+            workers: Optional[int] = None
+            ) -> Iterator[DexiAlternative]:
+        """Evaluates alternatives in parallel, using a pool of worker processes.
+        See :py:func:`dexipy.parallel.evaluate_parallel` for details.
+
+        Args:
+            alternatives (Optional[Iterable[DexiAlternative]], optional): A list or another iterable of
+                alternatives. Defaults to None, which selects ``self.alternatives``.
+            method (str, optional): Evaluation method. Defaults to "set".
+            root (Optional[DexiAttribute], optional): The topmost (root) attribute of the evaluation.
+                Defaults to None, which selects ``self.root``.
+            prune (List[str], optional): List of attribute IDs at which the evaluation is "pruned".
+                Defaults to [].
+            bounding (bool, optional): Whether or not the evaluation keeps calculated values within
+               bounds prescribed by the corresponding scales. Defaults to False.
+            chunk_size (int, optional): The number of alternatives evaluated by a worker at once.
+                Defaults to 1000.
+            workers (Optional[int], optional): The number of worker processes.
+                Defaults to None, which selects ``os.cpu_count()``.
+
+        Returns:
+            Iterator[DexiAlternative]: Evaluated alternatives, in the order of ``alternatives``.
+        """
+        return parallel.evaluate_parallel(self, alternatives, method, root, prune, bounding, chunk_size, workers)
+
+    def enable_eval_cache(self, maxsize: int = 1024, subtrees: bool = False) -> cache.DexiEvalCache:
+        """Assigns a new :py:class:`dexipy.cache.DexiEvalCache` to ``self.eval_cache``.
+
+        Afterwards, :py:meth:`dexipy.dexi.DexiModel.evaluate` takes results of alternatives whose
+        basic attributes' values have already been evaluated with the same settings from the cache.
+        To disable caching, assign None to ``self.eval_cache``.
+
+        Args:
+            maxsize (int, optional): Maximum number of cached results. Defaults to 1024.
+            subtrees (bool, optional): Whether to cache values of aggregate attributes' subtrees, too,
+                so that alternatives that share only some basic values reuse parts of evaluation.
+                Defaults to False.
+
+        Returns:
+            cache.DexiEvalCache: The assigned cache, which also provides cache statistics.
+
+        Raises:
+            ValueError: When the model is frozen (see :py:meth:`dexipy.dexi.DexiModel.freeze`).
+        """
+        self.eval_cache = cache.DexiEvalCache(maxsize, subtrees)
+        return self.eval_cache
+
+    def reevaluate(self,
+            alternative: DexiAlternative,
+            changes: Dict[str, DexiValue],
+            method: str = "set",
+            root: Optional[DexiAttribute] = None,
+            prune: List[str] = [],
+            bounding: bool = False,
+            in_place: bool = False,
+            eval_param: Optional[eval.DexiEvalParameters] = None
+            ) -> DexiAlternative:
+        """Incrementally re-evaluates an evaluated alternative after changing values of some basic attributes.
+
+        Only attributes affected by ``changes`` are evaluated again, which makes this method suitable for
+        "what-if" analyses that explore many small modifications of a single alternative.
+        See :py:func:`dexipy.eval.reevaluate` for details.
+
+        Args:
+            alternative (DexiAlternative): An alternative evaluated by :py:meth:`dexipy.dexi.DexiModel.evaluate`
+                using the same remaining arguments.
+            changes (Dict[str, DexiValue]): A dictionary of new values of basic attributes, keyed by attribute IDs.
+            method (str, optional): Evaluation method. Defaults to "set".
+            root (Optional[DexiAttribute], optional): The topmost (root) attribute of the evaluation.
+                Defaults to None, which selects ``self.root``.
+            prune (List[str], optional): List of attribute IDs at which the evaluation is "pruned".
+                Defaults to [].
+            bounding (bool, optional): Whether or not the evaluation keeps calculated values within
+               bounds prescribed by the corresponding scales. Defaults to False.
+            in_place (bool, optional): If True, ``alternative`` is modified in place,
+               otherwise a copy is made and returned by the method. Defaults to False.
+            eval_param (Optional[eval.DexiEvalParameters], optional): Optional evaluation parameters.
+               Defaults to None.
+
+        Returns:
+            DexiAlternative: The re-evaluated alternative.
+        """
+        return eval.reevaluate(self, alternative, changes, method, root, prune, bounding, in_place, eval_param)
+
+    def sensitivity(self,
+            alternative: DexiAlternative,
+            target: Union[DexiAttribute, str],
+            steps: Optional[int] = None,
+            method: str = "set",
+            evaluated: bool = False,
+            eval_param: Optional[eval.DexiEvalParameters] = None
+            ) -> Dict[str, Dict[int, DexiValue]]:
+        """One-at-a-time sensitivity ("what-if") analysis of ``alternative``.
+
+        For each basic attribute, determines the values of ``target`` obtained by replacing the attribute's
+        value with other values of its scale. See :py:func:`dexipy.analysis.sensitivity` for details.
+
+        Args:
+            alternative (DexiAlternative): An alternative.
+            target (Union[DexiAttribute, str]): The observed attribute or its ID.
+            steps (Optional[int], optional): Maximum distance of replacement values from the current value.
+               Defaults to None, which considers all scale values.
+            method (str, optional): Evaluation method. Defaults to "set".
+            evaluated (bool, optional): Whether ``alternative`` has already been evaluated by
+               :py:meth:`dexipy.dexi.DexiModel.evaluate` using the same ``method``. Defaults to False.
+            eval_param (Optional[eval.DexiEvalParameters], optional): Optional evaluation parameters.
+               Defaults to None.
+
+        Returns:
+            Dict[str, Dict[int, DexiValue]]: For each basic attribute ID, a dictionary that maps
+            replacement value indices to the corresponding values of ``target``.
+        """
+        return analysis.sensitivity(self, alternative, target, steps, method,
+                                    evaluated = evaluated, eval_param = eval_param)
+
+    def outcome_counts(self,
+            root: Optional[DexiAttribute] = None,
+            prune: List[str] = [],
+            weights: Optional[Dict[str, Sequence[float]]] = None,
+            normalize: bool = False
+            ) -> Dict[str, List[Any]]:
+        """Determines, for each attribute, the number of combinations of basic attributes' values
+        that lead to each of its values. See :py:func:`dexipy.analysis.outcome_counts` for details.
+
+        Args:
+            root (Optional[DexiAttribute], optional): The topmost (root) attribute of the evaluation.
+                Defaults to None, which selects ``self.root``.
+            prune (List[str], optional): List of attribute IDs at which the evaluation is "pruned".
+                Defaults to [].
+            weights (Optional[Dict[str, Sequence[float]]], optional): Weights (for instance, probabilities)
+                of values of basic attributes, keyed by attribute IDs. Defaults to None, which counts
+                combinations exactly.
+            normalize (bool, optional): Whether to return shares rather than counts. Defaults to False.
+
+        Returns:
+            Dict[str, List[Any]]: For each attribute ID, counts of its values, followed by the count
+            of combinations that lead to an undefined value.
+        """
+        return analysis.outcome_counts(self, root, prune, weights, normalize)
+
+    def goal_seek(self,
+            alternative: DexiAlternative,
+            target: Union[DexiAttribute, str],
+            value: Union[int, Set[int]],
+            at_least: bool = False,
+            costs: Optional[Dict[str, float]] = None,
+            limit: int = 1,
+            method: str = "set",
+            root: Optional[DexiAttribute] = None,
+            prune: List[str] = []
+            ) -> List[Tuple[float, Dict[str, int]]]:
+        """Finds the least costly changes of basic attributes' values in ``alternative`` that make
+        the ``target`` attribute take the desired ``value``. See :py:func:`dexipy.analysis.goal_seek` for details.
+
+        Args:
+            alternative (DexiAlternative): An alternative. Not modified.
+            target (Union[DexiAttribute, str]): The attribute whose value is sought, given as a DexiAttribute or ID.
+            value (Union[int, Set[int]]): The desired value index of ``target``, or a set of admissible value indices.
+            at_least (bool, optional): Whether all value indices from ``value`` (or from its smallest element,
+                when ``value`` is a set) upwards are admissible. Defaults to False.
+            costs (Optional[Dict[str, float]], optional): Costs of changing basic attributes by one value,
+                keyed by attribute IDs. Defaults to None, which assigns the cost 1.0 to all attributes.
+            limit (int, optional): Maximum number of returned solutions. Defaults to 1.
+            method (str, optional): Evaluation method. Defaults to "set".
+            root (Optional[DexiAttribute], optional): The topmost (root) attribute of the evaluation.
+                Defaults to None, which selects ``self.root``.
+            prune (List[str], optional): List of attribute IDs at which the evaluation is "pruned".
+                Defaults to [].
+
+        Returns:
+            List[Tuple[float, Dict[str, int]]]: Up to ``limit`` pairs of costs and changed values of
+            basic attributes, ordered by increasing cost.
+        """
+        return analysis.goal_seek(self, alternative, target, value, at_least, costs, limit, method, root, prune)
+
+    def evaluate_crisp(self, data: Any,
+            root: Optional[DexiAttribute] = None,
+            prune: List[str] = [],
+            columns: Optional[Sequence[str]] = None,
+            as_frame: bool = False) -> Any:
+        """Evaluates a batch of crisp alternatives using NumPy.
+        See :py:func:`dexipy.batch.evaluate_crisp` for details.
+
+        Args:
+            data (Any): Values of basic attributes, given either as a mapping from attribute IDs
+                to columns, or as a matrix of shape ``(n_alternatives, n_basic)``.
+            root (Optional[DexiAttribute], optional): The topmost (root) attribute of the evaluation.
+                Defaults to None, which selects ``self.root``.
+            prune (List[str], optional): List of attribute IDs at which the evaluation is "pruned".
+                Defaults to [].
+            columns (Optional[Sequence[str]], optional): Attribute IDs of matrix ``data`` columns.
+                Defaults to None.
+            as_frame (bool, optional): Whether to return a ``pandas.DataFrame`` rather than a dictionary.
+                Defaults to False.
+
+        Returns:
+            Any: A dictionary of integer columns keyed by attribute IDs, or a ``pandas.DataFrame``.
+        """
+        return batch.evaluate_crisp(self, data, root, prune, columns, as_frame)
+
+    def evaluate_sets(self, data: Any,
+            root: Optional[DexiAttribute] = None,
+            prune: List[str] = [],
+            columns: Optional[Sequence[str]] = None) -> Dict[str, vls.DexiPackedValues]:
+        """Evaluates a batch of alternatives, whose discrete values may be value sets, using NumPy.
+        See :py:func:`dexipy.batch.evaluate_sets` for details.
+
+        Args:
+            data (Any): Values of basic attributes, given either as a mapping from attribute IDs
+                to columns, or as a matrix of shape ``(n_alternatives, n_basic)``.
+            root (Optional[DexiAttribute], optional): The topmost (root) attribute of the evaluation.
+                Defaults to None, which selects ``self.root``.
+            prune (List[str], optional): List of attribute IDs at which the evaluation is "pruned".
+                Defaults to [].
+            columns (Optional[Sequence[str]], optional): Attribute IDs of matrix ``data`` columns.
+                Defaults to None.
+
+        Returns:
+            Dict[str, vls.DexiPackedValues]: Packed values keyed by attribute IDs.
+        """
+        return batch.evaluate_sets(self, data, root, prune, columns)
+
     def check_alternative(self, alt: DexiAlternative, aggregate: bool = False) -> Dict[str, List[str]]:
         """Checks the data representing alternative ``alt``,
         and reports found errors and warnings.
@@ -1316,7 +2046,7 @@ class DexiModel:
         errors: List[str] = []
         warnings: List[str] = []
         for key, val in alt.items():
-            if key in self.att_ids:
+            if key in self._id_index:
                 att = self.attrib(key)
                 if att is None:
                     errors.append(f"Attribute {key} not found")
@@ -1659,16 +2389,39 @@ def alt_lines(alternatives: DexiAltData, alt_head: str = "alternative", sel_att:
 
 import dexipy.parse as parse
 
-def read_dexi(filename: str) -> DexiModel:
+def read_dexi(filename: str, alternatives: bool = True) -> DexiModel:
     """Reads a DEXi model from a ``.dxi`` file.
 
+    The file is read incrementally, so that memory use does not depend on the number of
+    alternatives when ``alternatives`` is False.
+
     Args:
         filename (str): File name.
+        alternatives (bool, optional): Whether to read alternatives. When False, only the model
+            structure is read and ``model.alternatives`` is empty. Alternatives can then be read one by one
+            using :py:func:`dexipy.dexi.iter_dexi_alternatives`. Defaults to True.
 
     Returns:
         DexiModel: DEXi model read from the file.
     """
-    return parse.read_dexi(filename)
+    return parse.read_dexi(filename, alternatives)
+
+def iter_dexi_alternatives(filename: str, model: Optional[DexiModel] = None, chunk_size: Optional[int] = 1000) -> Iterator[DexiAlternative]:
+    """Reads alternatives from a ``.dxi`` file one by one.
+
+    Args:
+        filename (str): File name.
+        model (Optional[DexiModel], optional): The model contained in ``filename``, for instance, read
+            using ``read_dexi(filename, alternatives = False)``. Defaults to None, which reads the model
+            structure from ``filename``.
+        chunk_size (Optional[int], optional): The file is read once for each chunk of ``chunk_size``
+            alternatives, keeping only the values of that chunk in memory. None reads the file once,
+            keeping all values. Defaults to 1000.
+
+    Yields:
+        DexiAlternative: Alternatives in the order of their appearance in the file.
+    """
+    return parse.iter_dexi_alternatives(filename, model, chunk_size)
 
 def read_dexi_from_string(xml: str) -> DexiModel:
     """Reads a DEXi model from a ``xml`` string.
@@ -1682,7 +2435,24 @@ def read_dexi_from_string(xml: str) -> DexiModel:
     """
     return parse.read_dexi_from_string(xml)
 
+def read_dexi_cached(filename: str) -> DexiModel:
+    """Reads a DEXi model from a ``.dxi`` file, using the process-wide cache
+    :py:data:`dexipy.cache.model_cache`.
+
+    Args:
+        filename (str): File name.
+
+    Returns:
+        DexiModel: A shared, frozen DEXi model (see :py:meth:`dexipy.dexi.DexiModel.freeze`).
+        Subsequent calls return the same object until the file is modified.
+    """
+    return cache.model_cache.read_dexi(filename)
+
 import dexipy.eval as eval
+import dexipy.batch as batch
+import dexipy.cache as cache
+import dexipy.analysis as analysis
+import dexipy.parallel as parallel
 
 def evaluate(model: DexiModel,
             alternatives: Optional[DexiAltData] = None,
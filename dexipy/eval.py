@@ -2,12 +2,16 @@
 The module ``dexipy.eval`` implements classess and functions for the evaluation of decision alternatives.
 """
 
-from typing import Any, List, Dict, Optional
+from typing import Any, List, Dict, Iterable, Iterator, Optional, Sequence, Set, Tuple
+from collections.abc import Mapping, KeysView, ValuesView, ItemsView
+import itertools
+import numpy as np
 from copy import copy, deepcopy
 from dexipy.types import CallableOperator, CallableNorm, DexiValue, DexiAlternative, DexiAlternatives, DexiAltData, DexiValueType
 import dexipy.utils as utl
 import dexipy.values as vls
-from dexipy.dexi import  DexiModel, DexiAttribute, DexiScale, DexiFunction, DexiDiscretizeFunction
+import dexipy.tensor as tensor
+from dexipy.dexi import  DexiModel, DexiAttribute, DexiScale, DexiFunction, DexiTabularFunction, DexiDiscretizeFunction
 from dexipy.dexi import  scale_value, bounded_scale_value, att_names
 
 def evaluation_order(att: DexiAttribute, prune: List[str] = []) -> List[str]:
@@ -40,6 +44,129 @@ def evaluation_order(att: DexiAttribute, prune: List[str] = []) -> List[str]:
     add_to_order(att)
     return result
 
+class DexiEvalPlan:
+    """A compiled evaluation plan of a :py:class:`dexipy.dexi.DexiModel`.
+
+    The plan is built once for some ``root`` and ``prune`` combination and contains everything
+    :py:func:`dexipy.eval.evaluate` needs to know about the model, so that evaluating
+    alternatives does not involve any further attribute lookups. All information is stored
+    in flat lists that follow the evaluation order, i.e., the ``i``-th element of each list
+    corresponds to the attribute ``self.order[i]``.
+
+    Normally, plans are not created directly, but obtained through
+    :py:meth:`dexipy.dexi.DexiModel.eval_plan`, which caches them on the model.
+
+    Args:
+        model (DexiModel): A DexiModel.
+        root (DexiAttribute): The topmost (root) attribute of the evaluation.
+        prune (List[str], optional): A list of attribute IDs at which to prune the evaluation.
+            Defaults to [].
+
+    Attributes:
+        order (List[str]): Attribute IDs in the evaluation order (see :py:func:`dexipy.eval.evaluation_order`).
+        pruned_ids (List[str]): IDs of non-root attributes that are excluded from evaluation due to pruning.
+        atts (List[DexiAttribute]): Attributes in the evaluation order.
+        kinds (List[int]): Evaluation step kinds, one of ``DexiEvalPlan.SKIP``, ``NONE``,
+            ``LINK``, ``BASIC`` or ``AGGREGATE``.
+        scales (List[Optional[DexiScale]]): Attributes' scales.
+        sizes (List[int]): Attributes' scale sizes, i.e., the number of discrete scale values
+            (0 for undefined and continuous scales).
+        functs (List[Optional[DexiFunction]]): Attributes' aggregation or discretization functions.
+        links (List[Optional[str]]): IDs of linked attributes, or None.
+        inp_ids (List[Tuple[str, ...]]): IDs of input attributes.
+        inp_pos (List[Tuple[int, ...]]): Positions of input attributes in ``self.order``.
+        basic_ids (List[str]): IDs of attributes whose values are taken from alternatives
+            (basic and pruned attributes), in the evaluation order.
+        consumers (Dict[str, List[str]]): For each attribute ID, IDs of attributes whose evaluation
+            directly uses its value, i.e., its parent and attributes linked to it.
+    """
+
+    SKIP = 0
+    NONE = 1
+    LINK = 2
+    BASIC = 3
+    AGGREGATE = 4
+
+    def __init__(self, model: DexiModel, root: DexiAttribute, prune: List[str] = []):
+        self.model = model
+        self.root = root
+        self.prune = tuple(prune)
+        full_order = evaluation_order(root)
+        self.order = evaluation_order(root, prune) if len(prune) > 0 else full_order
+        diff = set(full_order).difference(set(self.order))
+        self.pruned_ids = [id for id in model.non_root_ids if id in diff]
+        position = {id: i for i, id in enumerate(self.order)}
+        self.atts: List[Optional[DexiAttribute]] = []
+        self.kinds: List[int] = []
+        self.scales: List[Optional[DexiScale]] = []
+        self.sizes: List[int] = []
+        self.functs: List[Optional[DexiFunction]] = []
+        self.links: List[Optional[str]] = []
+        self.inp_ids: List[Tuple[str, ...]] = []
+        self.inp_pos: List[Tuple[int, ...]] = []
+        for id in self.order:
+            att = model.attrib(id)
+            scl = None if att is None else att.scale
+            if att is None or id == root.id:
+                kind = self.SKIP
+            elif scl is None:
+                kind = self.NONE
+            elif att.link is not None:
+                kind = self.LINK
+            elif att.is_basic() or id in prune:
+                kind = self.BASIC
+            elif att.is_aggregate():
+                kind = self.AGGREGATE
+            else:
+                kind = self.NONE
+            inp_ids = tuple(att_names(att.inputs)) if kind == self.AGGREGATE else ()
+            self.atts.append(att)
+            self.kinds.append(kind)
+            self.scales.append(scl)
+            self.sizes.append(0 if scl is None else scl.count())
+            self.functs.append(None if att is None else att.funct)
+            self.links.append(att.link.id if kind == self.LINK else None)
+            self.inp_ids.append(inp_ids)
+            self.inp_pos.append(tuple(position.get(inp, -1) for inp in inp_ids))
+        self.basic_ids = [id for id, kind in zip(self.order, self.kinds) if kind == self.BASIC]
+        self.steps = [step for step in zip(self.order, self.kinds, self.atts, self.scales, self.links, self.inp_ids)
+                      if step[1] != self.SKIP]
+        self.consumers: Dict[str, List[str]] = {id: [] for id in self.order}
+        for id, kind, att, scl, link, inp_ids in self.steps:
+            for inp in inp_ids if kind == self.AGGREGATE else (link,) if kind == self.LINK else ():
+                if inp in self.consumers:
+                    self.consumers[inp].append(id)
+        self._affected: Dict[frozenset, List[Tuple[Any, ...]]] = {}
+
+    def affected_steps(self, ids: Iterable[str]) -> List[Tuple[Any, ...]]:
+        """Determines evaluation steps affected by a change of values of attributes ``ids``.
+
+        The result is cached for each distinct set of ``ids``.
+
+        Args:
+            ids (Iterable[str]): IDs of changed attributes.
+
+        Returns:
+            List[Tuple[Any, ...]]: Elements of ``self.steps``, in the evaluation order, that correspond to
+            attributes ``ids`` and all attributes that depend on them through parent and link relations.
+        """
+        key = frozenset(ids)
+        steps = self._affected.get(key)
+        if steps is None:
+            affected = set()
+            pending = list(key)
+            while pending:
+                id = pending.pop()
+                if id not in affected:
+                    affected.add(id)
+                    pending.extend(self.consumers.get(id, []))
+            steps = [step for step in self.steps if step[0] in affected]
+            self._affected[key] = steps
+        return steps
+
+    def __len__(self) -> int:
+        return len(self.order)
+
 class DexiEvalParameters:
     """A class defining evaluation parameters.
 
@@ -153,10 +280,49 @@ def get_alt_value(alt: Any, id: str) -> DexiValue:
     except:
         return None
 
+SET_ENUMERATION_LIMIT = 32
+"""Maximum number of input value combinations for which :py:func:`dexipy.eval.evaluate_as_set`
+enumerates combinations directly, rather than using :py:func:`dexipy.eval.evaluate_tabular_as_set`."""
+
+def evaluate_tabular_as_set(funct: DexiTabularFunction, inp_vals: Sequence[Set[int]]) -> Optional[Set[int]]:
+    """Evaluates a crisp tabular function for a combination of input value sets,
+    without enumerating all combinations of input values.
+
+    When ``funct`` is monotone, the output bounds are determined from the two corner points
+    of the input space; if they differ by at most one, they determine the result exactly.
+    Otherwise, output values are collected from the sub-table selected by ``inp_vals``.
+
+    Args:
+        funct (DexiTabularFunction): A tabular function.
+        inp_vals (Sequence[Set[int]]): Non-empty sets of input values, one for each function argument.
+
+    Returns:
+        Optional[Set[int]]: The set of all function values obtained for ``inp_vals``.
+        None if this shortcut is not applicable, that is, when ``funct`` is not crisp or
+        some input value is out of range.
+    """
+    if len(inp_vals) != funct.nargs() or not funct.is_crisp():
+        return None
+    for vals, size in zip(inp_vals, funct.dim):
+        if min(vals) < 0 or max(vals) >= size:
+            return None
+    directions = funct.directions()
+    if directions is not None:
+        low = funct.codes.item(*(min(vals) if dir > 0 else max(vals) for vals, dir in zip(inp_vals, directions)))
+        high = funct.codes.item(*(max(vals) if dir > 0 else min(vals) for vals, dir in zip(inp_vals, directions)))
+        if high - low <= 1:
+            return {low, high}
+    table = funct.codes[np.ix_(*(sorted(vals) for vals in inp_vals))]
+    return set(np.unique(table).tolist())
+
 def evaluate_as_set(funct: DexiFunction, inp_values: List[DexiValue]) -> DexiValue:
     inp_vals = tuple(vls.dexi_value_as_set(val) for val in inp_values)
     if None in inp_vals or set() in inp_vals:
         return None
+    if isinstance(funct, DexiTabularFunction) and utl.prod(len(vals) for vals in inp_vals) > SET_ENUMERATION_LIMIT:
+        result = evaluate_tabular_as_set(funct, inp_vals)
+        if result is not None:
+            return result
     inp_args = utl.cartesian_product(*inp_vals)
     result = set()
     for args in inp_args:
@@ -171,10 +337,37 @@ def evaluate_as_set(funct: DexiFunction, inp_values: List[DexiValue]) -> DexiVal
         return None
     return result
 
+def tensor_engine(funct: DexiFunction, eval_param: DexiEvalParameters) -> Optional[str]:
+    """Determines whether ``funct`` can be evaluated by :py:mod:`dexipy.tensor`.
+
+    Args:
+        funct (DexiFunction): A function.
+        eval_param (DexiEvalParameters): Evaluation parameters.
+
+    Returns:
+        Optional[str]: Tensor engine (:py:data:`dexipy.tensor.PROB` or :py:data:`dexipy.tensor.FUZZY`),
+        or None if ``funct`` is not a :py:class:`dexipy.dexi.DexiTabularFunction`, or ``eval_param``
+        does not define a distribution-based method with default operators.
+    """
+    if eval_param.method == "set" or not isinstance(funct, DexiTabularFunction):
+        return None
+    return tensor.engine(eval_param.and_op, eval_param.or_op)
+
+def evaluate_tensor(funct: DexiTabularFunction, inp_distrs: Sequence[Sequence[List[float]]],
+                    engine: str, eval_param: DexiEvalParameters) -> List[DexiValue]:
+    size = 0
+    if funct.attribute is not None and funct.attribute.scale is not None:
+        size = funct.attribute.scale.count()
+    inputs = [tensor.distribution_matrix([distrs[i] for distrs in inp_distrs]) for i in range(funct.nargs())]
+    return tensor.evaluate_distributions(funct, inputs, engine, eval_param.norm, size)
+
 def evaluate_as_distribution(funct: DexiFunction, inp_values: List[DexiValue], eval_param: DexiEvalParameters) -> DexiValue:
     inp_distrs = tuple(vls.dexi_value_as_distr(val) for val in inp_values)
     if None in inp_distrs or [] in inp_distrs:
         return None
+    engine = tensor_engine(funct, eval_param)
+    if engine is not None and len(inp_distrs) == funct.nargs():
+        return evaluate_tensor(funct, [inp_distrs], engine, eval_param)[0] # type: ignore
     args_mem = utl.cartesian_product(*inp_distrs)
     args_idx = utl.cartesian_product(*(tuple(range(utl.objlen(distr))) for distr in inp_distrs))
     ands = [eval_param.and_op(mem) for mem in args_mem]
@@ -201,18 +394,25 @@ def evaluate_as_distribution(funct: DexiFunction, inp_values: List[DexiValue], e
             result[i] = eval_param.or_op([result[i], eval_param.and_op([ands[idx], el])])
     return result
 
-def evaluate_aggregate(att: DexiAttribute, scl: DexiScale, alt: DexiAlternative, eval_param: DexiEvalParameters) -> DexiValue:
+def aggregate_input_types(inp_values: List[DexiValue]) -> Optional[List[DexiValueType]]:
+    if None in inp_values:
+        return None
+    inp_types = [vls.dexi_value_type(val) for val in inp_values]
+    if DexiValueType.none in inp_types or None in inp_types:
+        return None
+    return inp_types # type: ignore
+
+def evaluate_aggregate(att: DexiAttribute, scl: DexiScale, alt: DexiAlternative, eval_param: DexiEvalParameters,
+                       inp_ids: Optional[Sequence[str]] = None) -> DexiValue:
     funct = att.funct
     if funct is None:
         return None
-    inputs = att.inputs
-    inp_ids = att_names(inputs)
+    if inp_ids is None:
+        inp_ids = att_names(att.inputs)
 
     inp_values = [get_alt_value(alt, id) for id in inp_ids]
-    if None in inp_values:
-        return None
-    inp_types = [vls.dexi_value_type(val) for val in inp_values]
-    if DexiValueType.none in inp_types or None in inp_types:
+    inp_types = aggregate_input_types(inp_values)
+    if inp_types is None:
         return None
 
     if isinstance(funct, DexiDiscretizeFunction):
@@ -227,6 +427,236 @@ def evaluate_aggregate(att: DexiAttribute, scl: DexiScale, alt: DexiAlternative,
         value = evaluate_as_distribution(funct, inp_values, eval_param)
     return value
 
+def evaluate_aggregates(att: DexiAttribute, scl: DexiScale, alts: DexiAlternatives, eval_param: DexiEvalParameters,
+                        inp_ids: Optional[Sequence[str]] = None) -> List[DexiValue]:
+    """Evaluates an aggregate attribute for a list of alternatives.
+
+    Equivalent to calling :py:func:`dexipy.eval.evaluate_aggregate` for each alternative. However,
+    when :py:func:`dexipy.eval.tensor_engine` applies, all alternatives are evaluated at once
+    using :py:func:`dexipy.tensor.evaluate_distributions`.
+
+    Args:
+        att (DexiAttribute): An aggregate attribute.
+        scl (DexiScale): Scale of ``att``.
+        alts (DexiAlternatives): A list of alternatives, containing values of ``att.inputs``.
+        eval_param (DexiEvalParameters): Evaluation parameters.
+        inp_ids (Optional[Sequence[str]], optional): IDs of ``att.inputs``. Defaults to None.
+
+    Returns:
+        List[DexiValue]: A list of ``att`` values, one for each alternative.
+    """
+    funct = att.funct
+    engine = tensor_engine(funct, eval_param) if funct is not None else None
+    if inp_ids is None:
+        inp_ids = att_names(att.inputs)
+    if engine is None or len(inp_ids) != funct.nargs(): # type: ignore
+        return [evaluate_aggregate(att, scl, alt, eval_param, inp_ids) for alt in alts]
+
+    result: List[DexiValue] = [None] * len(alts)
+    batch_idx: List[int] = []
+    batch_distrs: List[List[List[float]]] = []
+    for idx, alt in enumerate(alts):
+        inp_values = [get_alt_value(alt, id) for id in inp_ids]
+        if aggregate_input_types(inp_values) is None:
+            continue
+        inp_distrs = [vls.dexi_value_as_distr(val) for val in inp_values]
+        if None in inp_distrs or [] in inp_distrs:
+            continue
+        batch_idx.append(idx)
+        batch_distrs.append(inp_distrs) # type: ignore
+    if batch_idx:
+        values = evaluate_tensor(funct, batch_distrs, engine, eval_param) # type: ignore
+        for idx, value in zip(batch_idx, values):
+            result[idx] = value
+    return result
+
+def evaluation_result(value: DexiValue, scl: Optional[DexiScale], eval_param: DexiEvalParameters, bounding: bool = False) -> DexiValue:
+    """Converts a value, obtained in some evaluation step, to the form stored in evaluated alternatives.
+
+    Args:
+        value (DexiValue): Value of some attribute.
+        scl (Optional[DexiScale]): Attribute scale.
+        eval_param (DexiEvalParameters): Evaluation parameters.
+        bounding (bool, optional): Whether to bound ``value`` to ``scl``. Defaults to False.
+
+    Returns:
+        DexiValue: Bounded (optional), normalized (for distribution-based methods) and reduced value.
+    """
+    if bounding:
+        value = bounded_scale_value(value, scl)
+    if eval_param.method != "set" and isinstance(value, list):
+        value = eval_param.norm(value)
+    return vls.reduce_dexi_value(value)
+
+class DexiResult(dict):
+    """An evaluated alternative that refers to the original alternative instead of copying it.
+
+    Values written to the result, including all values determined by the evaluation, are stored
+    in the result itself, while all other values are looked up in the original alternative ``base``,
+    which is never modified. To all other code, the result behaves as a dictionary that contains
+    the values of both. Removing a value from ``base`` (using ``del``, ``pop()``, ``popitem()``
+    or ``clear()``) first copies the references to all its values into the result.
+
+    Values in ``base`` are shared rather than copied, so ``base`` and its values should
+    not be modified while the result is in use. Results copied by ``copy.copy()`` are
+    :py:class:`DexiResult` objects referring to the same ``base``, while copies made by
+    ``copy.deepcopy()`` or ``pickle`` are ordinary dictionaries.
+
+    Args:
+        base (DexiAlternative): The original alternative. When ``base`` is itself a :py:class:`DexiResult`,
+            the new result refers to its original alternative and starts with a copy of its values.
+    """
+
+    __slots__ = ("_base",)
+
+    def __init__(self, base: DexiAlternative):
+        super().__init__()
+        if isinstance(base, DexiResult):
+            dict.update(self, dict.items(base))
+            base = base._base
+        self._base = base
+
+    def _detach(self) -> None:
+        if self._base:
+            values = dict(self.items())
+            dict.clear(self)
+            dict.update(self, values)
+            self._base = {}
+
+    def __missing__(self, key: Any) -> DexiValue:
+        return self._base[key]
+
+    def __contains__(self, key: Any) -> bool:
+        return dict.__contains__(self, key) or key in self._base
+
+    def __iter__(self) -> Iterator[Any]:
+        base = self._base
+        return itertools.chain(base, (key for key in dict.__iter__(self) if key not in base))
+
+    def __reversed__(self) -> Iterator[Any]:
+        return reversed(list(self))
+
+    def __len__(self) -> int:
+        base = self._base
+        return len(base) + sum(1 for key in dict.__iter__(self) if key not in base)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        return dict(self.items()) == dict(other.items())
+
+    def __ne__(self, other: Any) -> bool:
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        return not self == other
+
+    __hash__ = None # type: ignore
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+    def __or__(self, other: Any) -> Dict[Any, DexiValue]:
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        return {**self, **other}
+
+    def __ror__(self, other: Any) -> Dict[Any, DexiValue]:
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        return {**other, **self}
+
+    def __copy__(self) -> "DexiResult":
+        return DexiResult(self)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (dict, (dict(self.items()),))
+
+    def __delitem__(self, key: Any) -> None:
+        self._detach()
+        dict.__delitem__(self, key)
+
+    def keys(self) -> KeysView: # type: ignore
+        return KeysView(self)
+
+    def values(self) -> ValuesView: # type: ignore
+        return ValuesView(self)
+
+    def items(self) -> ItemsView: # type: ignore
+        return ItemsView(self)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key in self:
+            return self[key]
+        self[key] = default
+        return default
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        self._detach()
+        return dict.pop(self, key, *default)
+
+    def popitem(self) -> Tuple[Any, DexiValue]:
+        self._detach()
+        return dict.popitem(self)
+
+    def clear(self) -> None:
+        dict.clear(self)
+        self._base = {}
+
+    def copy(self) -> "DexiResult": # type: ignore
+        return DexiResult(self)
+
+def copy_for_evaluation(alt: Any) -> Any:
+    """Makes a copy of an alternative for evaluation: a :py:class:`dexipy.eval.DexiResult` for
+    dictionaries and a deep copy of anything else.
+
+    Args:
+        alt (Any): Normally, a DexiAlternative.
+
+    Returns:
+        Any: A copy of ``alt``, which can be evaluated without affecting ``alt``.
+    """
+    return DexiResult(alt) if isinstance(alt, dict) else deepcopy(alt)
+
+def evaluate_steps(steps: Iterable[Tuple[Any, ...]], alts: DexiAlternatives,
+                   eval_param: DexiEvalParameters, bounding: bool = False) -> None:
+    """Carries out evaluation steps for a list of alternatives, modifying them in place.
+
+    Each step is evaluated for all alternatives at once, so that aggregate attributes
+    can be evaluated in batches (see :py:func:`dexipy.eval.evaluate_aggregates`).
+
+    Args:
+        steps (Iterable[Tuple[Any, ...]]): Evaluation steps, normally ``DexiEvalPlan.steps`` or
+            a result of :py:meth:`dexipy.eval.DexiEvalPlan.affected_steps`.
+        alts (DexiAlternatives): A list of alternatives.
+        eval_param (DexiEvalParameters): Evaluation parameters.
+        bounding (bool, optional): Whether or not the evaluation keeps calculated values within
+            bounds prescribed by the corresponding scales. Defaults to False.
+    """
+    for id, kind, att, scl, link, inp_ids in steps:
+        if kind == DexiEvalPlan.BASIC:
+            # Values that need no conversion are not written again, so that they stay in the base
+            # alternatives of DexiResult objects.
+            for alt in alts:
+                value = get_alt_value(alt, id)
+                result = evaluation_result(scale_value(value, scl), scl, eval_param, bounding)
+                if result is not value or (value is None and id not in alt):
+                    alt[id] = result
+            continue
+        if kind == DexiEvalPlan.AGGREGATE:
+            values = evaluate_aggregates(att, scl, alts, eval_param, inp_ids)
+        elif kind == DexiEvalPlan.LINK:
+            values = [get_alt_value(alt, link) for alt in alts]
+        else:
+            values = [None] * len(alts)
+        for alt, value in zip(alts, values):
+            alt[id] = evaluation_result(value, scl, eval_param, bounding)
+
 def evaluate(model: DexiModel,
             alternatives: Optional[DexiAltData] = None,
             method: str = "set",
@@ -247,6 +677,9 @@ def evaluate(model: DexiModel,
     Please see :ref:`evaluation` for more information about the evaluation process
     and evaluation methods used in DEXiPy.
 
+    When ``model.eval_cache`` is set (see :py:meth:`dexipy.dexi.DexiModel.enable_eval_cache`),
+    results are taken from and stored in the cache.
+
     Args:
         model (DexiModel): A DexiModel. Required.
         alternatives (Optional[DexiAltData], optional): A single DexiAlternative or a list
@@ -265,7 +698,8 @@ def evaluate(model: DexiModel,
         bounding (bool, optional): Whether or not the evaluation keeps calculated values within
             bounds prescribed by the corresponding scales. Defaults to False.
         in_place (bool, optional): If True, evaluation modifies ``alternatives`` in place,
-            otherwise a deep copy is made and returned by the method. Defaults to False.
+            otherwise it returns :py:class:`dexipy.eval.DexiResult` objects, which store evaluated values
+            and refer to ``alternatives`` for everything else. Defaults to False.
         eval_param (Optional[eval.DexiEvalParameters], optional): Optional
             :py:class:`dexipy.eval.DexiEvalParameters`, which may customize the normalization
             and aggregation methods used in the evaluation. Defaults to None.
@@ -279,7 +713,10 @@ def evaluate(model: DexiModel,
     if alternatives is None:
         alternatives = model.alternatives
     if not in_place:
-        alternatives = deepcopy(alternatives)
+        if isinstance(alternatives, list):
+            alternatives = [copy_for_evaluation(alt) for alt in alternatives]
+        else:
+            alternatives = copy_for_evaluation(alternatives)
     listargs = isinstance(alternatives, list)
     alts: DexiAlternatives = alternatives if listargs else [alternatives] # type: ignore
 
@@ -288,48 +725,87 @@ def evaluate(model: DexiModel,
     if root is None:
         raise ValueError("Undefined model root")
 
-    pruning = len(prune) > 0
-    full_order = evaluation_order(root)
-    eval_order = full_order
-    if pruning:
-        eval_order = evaluation_order(root, prune)
-        diff = set(full_order).difference(set(eval_order))
-        for id in model.non_root_ids:
-            if id in diff:
-                for alt in alts:
-                    alt[id] = None
+    plan = model.eval_plan(root, prune)
+    for id in plan.pruned_ids:
+        for alt in alts:
+            alt[id] = None
 
     if pre_check:
         check = model.check_alternatives(alts)
         if check["errors"] != []:
             raise ValueError(utl.check_str(check, warnings = True))
 
-    for alt in alts:
-        for id in eval_order:
-            if id == root.id:
-                continue
-            att = model.attrib(id)
-            if att is None:
-                continue
-            scl = att.scale
-            if scl is None:
-                value = None
-            elif att.link is not None:
-                value = get_alt_value(alt, att.link.id)
-            elif att.is_basic() or id in prune:
-                value = scale_value(get_alt_value(alt, id), scl)
-            elif att.is_aggregate():
-                value = evaluate_aggregate(att, scl, alt, eval_param)
-            else:
-                value = None
-            if bounding:
-                value = bounded_scale_value(value, scl)
-            if eval_param.method != "set" and isinstance(value, list):
-                value = eval_param.norm(value)
-            value = vls.reduce_dexi_value(value)
-            alt[id] = value
+    if model.eval_cache is not None:
+        model.eval_cache.evaluate_steps(plan, alts, eval_param, bounding)
+    else:
+        evaluate_steps(plan.steps, alts, eval_param, bounding)
 
     if listargs:
         return alts
     else:
         return alts[0]
+
+def reevaluate(model: DexiModel,
+               alternative: DexiAlternative,
+               changes: Dict[str, DexiValue],
+               method: str = "set",
+               root: Optional[DexiAttribute] = None,
+               prune: List[str] = [],
+               bounding: bool = False,
+               in_place: bool = False,
+               eval_param: Optional[DexiEvalParameters] = None
+               ) -> DexiAlternative:
+    """Incrementally re-evaluates an already evaluated alternative after changing some input values.
+
+    Only the changed attributes and attributes that depend on them (their ancestors and attributes
+    linked to any of these) are evaluated again. All other values are taken from ``alternative``.
+    Provided that ``alternative`` has been evaluated by :py:func:`dexipy.eval.evaluate` using the same
+    ``method``, ``root``, ``prune``, ``bounding`` and ``eval_param``, the result is equal to
+    evaluating the changed alternative from scratch.
+
+    Args:
+        model (DexiModel): A DexiModel. Required.
+        alternative (DexiAlternative): An evaluated alternative.
+        changes (Dict[str, DexiValue]): A dictionary of new values of basic attributes, keyed by attribute IDs.
+        method (str, optional): Evaluation method. Defaults to "set".
+        root (Optional[DexiAttribute], optional): The topmost (root) attribute of the evaluation.
+            Defaults to None, which selects ``model.root``.
+        prune (List[str], optional): List of attribute IDs at which the evaluation is "pruned".
+            Defaults to [].
+        bounding (bool, optional): Whether or not the evaluation keeps calculated values within
+            bounds prescribed by the corresponding scales. Defaults to False.
+        in_place (bool, optional): If True, ``alternative`` is modified in place,
+            otherwise a copy is made and returned. Defaults to False.
+        eval_param (Optional[DexiEvalParameters], optional): Optional evaluation parameters.
+            Defaults to None.
+
+    Raises:
+        ValueError: When the model root is undefined or ``changes`` refer to attributes
+            that are not basic in this evaluation.
+
+    Returns:
+        DexiAlternative: The re-evaluated alternative.
+    """
+    if eval_param is None:
+        eval_param = EvalMethods.get_method(method)
+    if root is None:
+        root = model.root
+    if root is None:
+        raise ValueError("Undefined model root")
+    plan = model.eval_plan(root, prune)
+    invalid = [id for id in changes if id not in plan.basic_ids]
+    if invalid:
+        raise ValueError(f"Not basic attributes in this evaluation: {invalid}")
+
+    alt = alternative if in_place else copy(alternative)
+    for id, kind, att, scl, link, inp_ids in plan.affected_steps(changes.keys()):
+        if kind == DexiEvalPlan.BASIC:
+            value = scale_value(changes[id] if id in changes else get_alt_value(alt, id), scl)
+        elif kind == DexiEvalPlan.AGGREGATE:
+            value = evaluate_aggregate(att, scl, alt, eval_param, inp_ids)
+        elif kind == DexiEvalPlan.LINK:
+            value = get_alt_value(alt, link)
+        else:
+            value = None
+        alt[id] = evaluation_result(value, scl, eval_param, bounding)
+    return alt
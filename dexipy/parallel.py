@@ -0,0 +1,123 @@
+"""
+The module ``dexipy.parallel`` implements the evaluation of large lists of decision alternatives
+using multiple processes.
+
+Alternatives are split into chunks, which are evaluated by :py:func:`dexipy.eval.evaluate` in
+a :py:class:`concurrent.futures.ProcessPoolExecutor`. The model is sent to each worker process
+only once, when the process starts, so that only alternatives are transferred afterwards.
+Results are yielded in the order of alternatives, while a limited number of chunks is being
+evaluated ahead, so that long (or generated) sequences of alternatives are processed
+without keeping all of them in memory.
+
+Worker processes are started anew for each call, so parallel evaluation pays off only
+for lists of at least several thousand alternatives.
+"""
+
+import os
+import itertools
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, List, Optional
+from dexipy.types import DexiAlternative, DexiAlternatives
+from dexipy.dexi import DexiModel, DexiAttribute
+import dexipy.eval as eval
+
+_worker_model: Optional[DexiModel] = None
+_worker_args: tuple = ()
+
+def _init_worker(model: DexiModel, method: str, root_id: Optional[str], prune: List[str], bounding: bool) -> None:
+    global _worker_model, _worker_args
+    _worker_model = model
+    root = None if root_id is None else model.attrib(root_id)
+    _worker_args = (method, root, prune, False, bounding, True)
+
+def _evaluate_chunk(chunk: DexiAlternatives) -> DexiAlternatives:
+    return eval.evaluate(_worker_model, chunk, *_worker_args) # type: ignore
+
+def chunks(alternatives: Iterable[DexiAlternative], chunk_size: int) -> Iterator[DexiAlternatives]:
+    """Splits ``alternatives`` into lists of at most ``chunk_size`` alternatives.
+
+    Args:
+        alternatives (Iterable[DexiAlternative]): A sequence of alternatives.
+        chunk_size (int): Maximum chunk length.
+
+    Returns:
+        Iterator[DexiAlternatives]: Consecutive chunks of ``alternatives``.
+    """
+    iterator = iter(alternatives)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if len(chunk) == 0:
+            return
+        yield chunk
+
+def evaluate_parallel(model: DexiModel,
+                      alternatives: Optional[Iterable[DexiAlternative]] = None,
+                      method: str = "set",
+                      root: Optional[DexiAttribute] = None,
+                      prune: List[str] = [],
+                      bounding: bool = False,
+                      chunk_size: int = 1000,
+                      workers: Optional[int] = None
+                      ) -> Iterator[DexiAlternative]:
+    """Evaluates alternatives in parallel, using a pool of worker processes.
+
+    Results are equal to those of :py:func:`dexipy.eval.evaluate` using the same arguments.
+    Custom :py:class:`dexipy.eval.DexiEvalParameters` are not supported, since they
+    need not be transferable to other processes; workers use the default parameters of ``method``.
+
+    Args:
+        model (DexiModel): A DexiModel. Required.
+        alternatives (Optional[Iterable[DexiAlternative]], optional): A list or another iterable of
+            alternatives, which are not modified. Defaults to None, which selects ``model.alternatives``.
+        method (str, optional): Evaluation method. Defaults to "set".
+        root (Optional[DexiAttribute], optional): The topmost (root) attribute of the evaluation.
+            Defaults to None, which selects ``model.root``.
+        prune (List[str], optional): List of attribute IDs at which the evaluation is "pruned".
+            Defaults to [].
+        bounding (bool, optional): Whether or not the evaluation keeps calculated values within
+            bounds prescribed by the corresponding scales. Defaults to False.
+        chunk_size (int, optional): The number of alternatives evaluated by a worker at once. Defaults to 1000.
+        workers (Optional[int], optional): The number of worker processes. Defaults to None,
+            which selects ``os.cpu_count()``. With a single worker, alternatives are
+            evaluated in the calling process.
+
+    Raises:
+        ValueError: When ``chunk_size`` or ``workers`` is less than 1, or the model root is undefined.
+
+    Returns:
+        Iterator[DexiAlternative]: Evaluated alternatives, in the order of ``alternatives``.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"Chunk size must be at least 1, got {chunk_size}")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"Number of workers must be at least 1, got {workers}")
+    if root is None:
+        root = model.root
+    if root is None:
+        raise ValueError("Undefined model root")
+    eval.EvalMethods.get_method(method)
+    if alternatives is None:
+        alternatives = model.alternatives
+    return _evaluate_chunks(model, chunks(alternatives, chunk_size), method, root, prune, bounding, workers)
+
+def _evaluate_chunks(model: DexiModel, chunk_iter: Iterator[DexiAlternatives], method: str, root: DexiAttribute,
+                     prune: List[str], bounding: bool, workers: int) -> Iterator[DexiAlternative]:
+    if workers == 1:
+        for chunk in chunk_iter:
+            yield from eval.evaluate(model, chunk, method, root, prune, bounding = bounding) # type: ignore
+        return
+    executor = ProcessPoolExecutor(max_workers = workers, initializer = _init_worker,
+                                   initargs = (model, method, None if root is model.root else root.id, list(prune), bounding))
+    try:
+        pending = deque()
+        for chunk in chunk_iter:
+            pending.append(executor.submit(_evaluate_chunk, chunk))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        executor.shutdown(cancel_futures = True)
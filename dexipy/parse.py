@@ -8,7 +8,7 @@ For more information, please refer to
 :py:func:`dexipy.dexi.read_dexi` and :py:func:`dexipy.dexi.read_dexi_from_string` .
 """
 
-from typing import Any, List, Dict, Sequence, Optional
+from typing import Any, List, Dict, Iterator, Sequence, Optional, Tuple
 import xml.etree.ElementTree as ET
 import dexipy.utils as utl
 from dexipy.types import BoundAssoc, DexiOrder, DexiQuality, DexiValue
@@ -153,7 +153,8 @@ def parse_dexi_alternative_values(att_xml: ET.Element) -> List[DexiValue]:
             values.append(dexi_value(el.text))
     return values
 
-def parse_dexi_attributes(xml: ET.Element, def_name: str = "", alt_values: bool = True) -> DexiAttribute:
+def make_dexi_attribute(xml: ET.Element, inputs: List[DexiAttribute], alternatives: List[DexiValue],
+                        def_name: str = "") -> DexiAttribute:
     name = xml.findtext("NAME", default = def_name)
     description = xml.findtext("DESCRIPTION", default = "")
 
@@ -162,12 +163,7 @@ def parse_dexi_attributes(xml: ET.Element, def_name: str = "", alt_values: bool
     tab_funct_def = parse_dexi_tabular_funct_def(xml)
     disc_funct_def = parse_dexi_discretize_funct_def(xml)
 
-    inp_xmls = xml.findall("ATTRIBUTE")
-    inp_list: List[DexiAttribute] =  []
-    for inp_xml in inp_xmls:
-        inp = parse_dexi_attributes(inp_xml)
-        inp_list.append(inp)
-    att = DexiAttribute(name, description, inputs = inp_list, scale = scale)
+    att = DexiAttribute(name, description, inputs = inputs, scale = scale)
 
     # parents
     for inp in att.inputs:
@@ -186,13 +182,22 @@ def parse_dexi_attributes(xml: ET.Element, def_name: str = "", alt_values: bool
     att.funct = funct
 
     # _alternatives
-    if alt_values:
-        att._alternatives = parse_dexi_alternative_values(xml)
-    else:
-        att._alternatives = parse_dexi_alternative_names(xml)
+    att._alternatives = alternatives
 
     return att
 
+def parse_dexi_attributes(xml: ET.Element, def_name: str = "", alt_values: bool = True) -> DexiAttribute:
+    inp_xmls = xml.findall("ATTRIBUTE")
+    inp_list: List[DexiAttribute] =  []
+    for inp_xml in inp_xmls:
+        inp = parse_dexi_attributes(inp_xml)
+        inp_list.append(inp)
+    if alt_values:
+        alternatives = parse_dexi_alternative_values(xml)
+    else:
+        alternatives = parse_dexi_alternative_names(xml) # type: ignore
+    return make_dexi_attribute(xml, inp_list, alternatives, def_name)
+
 def parse_dexi(xml: ET.Element) -> DexiModel:
     name = xml.findtext("NAME", default = "")
     if name == "":
@@ -202,12 +207,143 @@ def parse_dexi(xml: ET.Element) -> DexiModel:
     root = parse_dexi_attributes(xml, def_name = "root", alt_values = False)
     return DexiModel(name, description, root, linking)
 
-def read_dexi(filename: str) -> DexiModel:
-    tree = ET.parse(filename)
-    root = tree.getroot()
-    if root.tag != "DEXi":
-        raise ValueError(f'File "{filename}" does not contain a DEXi model')
-    return parse_dexi(root)
+ALTERNATIVE_TAGS = ("OPTION", "ALTERNATIVE")
+
+def parse_dexi_alternative_element(el: ET.Element, alt_values: bool = True) -> DexiValue:
+    if el.tag == "OPTION":
+        if alt_values:
+            return dexi_option_value(el.text)
+        return "" if el.text is None else el.text
+    if alt_values:
+        return dexi_value(el.text)
+    txt = el.findtext("NAME", default = "")
+    return "" if txt is None else txt
+
+def iterparse_dexi(source: Any, alternatives: bool = True) -> DexiModel:
+    """Reads a DEXi model incrementally, discarding XML elements as soon as they have been processed.
+
+    Args:
+        source (Any): File name or file object.
+        alternatives (bool, optional): Whether to read alternatives. When False, only the model structure
+            is read and ``model.alternatives`` is empty. Defaults to True.
+
+    Raises:
+        ValueError: When ``source`` does not contain a DEXi model.
+
+    Returns:
+        DexiModel: DEXi model.
+    """
+    elems: List[ET.Element] = []
+    inputs: List[List[DexiAttribute]] = []
+    alts: List[List[DexiValue]] = []
+    for event, el in ET.iterparse(source, events = ("start", "end")):
+        if event == "start":
+            if not elems and el.tag != "DEXi":
+                raise ValueError(f'File "{source}" does not contain a DEXi model')
+            if el.tag == "ATTRIBUTE" or not elems:
+                inputs.append([])
+                alts.append([])
+            elems.append(el)
+            continue
+        elems.pop()
+        if not elems:
+            break
+        parent = elems[-1]
+        if el.tag in ALTERNATIVE_TAGS and (parent.tag == "ATTRIBUTE" or len(elems) == 1):
+            if alternatives:
+                alts[-1].append(parse_dexi_alternative_element(el, alt_values = len(elems) > 1))
+            parent.remove(el)
+        elif el.tag == "ATTRIBUTE":
+            att = make_dexi_attribute(el, inputs.pop(), alts.pop())
+            inputs[-1].append(att)
+            parent.remove(el)
+    name = el.findtext("NAME", default = "")
+    if name == "":
+        name = "DEXi Model"
+    description = el.findtext("DESCRIPTION", default = "")
+    linking = dexi_bool(el.findtext("./SETTINGS/LINKING", default = ""))
+    root = make_dexi_attribute(el, inputs.pop(), alts.pop(), def_name = "root")
+    return DexiModel(name, description, root, linking)
+
+def _read_alternative_values(filename: str, model: DexiModel, start: int, stop: Optional[int]) -> Tuple[List[List[DexiValue]], int]:
+    # One pass over the file that keeps values of alternatives start..stop-1 of each attribute (all values
+    # from start when stop is None) and counts the alternatives.
+    ids = model.att_ids
+    values: List[List[DexiValue]] = [[] for _ in ids]
+    counts = [0] * len(ids)
+    elems: List[ET.Element] = []
+    atts: List[int] = []
+    natt = 0
+    for event, el in ET.iterparse(filename, events = ("start", "end")):
+        if event == "start":
+            if el.tag == "ATTRIBUTE" or not elems:
+                if natt >= len(ids):
+                    raise ValueError(f'Model "{model.name}" does not match the file "{filename}"')
+                atts.append(natt)
+                natt += 1
+            elems.append(el)
+            continue
+        elems.pop()
+        if not elems:
+            break
+        parent = elems[-1]
+        if el.tag in ALTERNATIVE_TAGS and (parent.tag == "ATTRIBUTE" or len(elems) == 1):
+            idx = atts[-1]
+            if start <= counts[idx] and (stop is None or counts[idx] < stop):
+                values[idx].append(parse_dexi_alternative_element(el, alt_values = len(elems) > 1))
+            counts[idx] += 1
+            parent.remove(el)
+        elif el.tag == "ATTRIBUTE":
+            atts.pop()
+            parent.remove(el)
+    if natt != len(ids):
+        raise ValueError(f'Model "{model.name}" does not match the file "{filename}"')
+    return values, max(counts)
+
+def iter_dexi_alternatives(filename: str, model: Optional[DexiModel] = None, chunk_size: Optional[int] = 1000) -> Iterator[Dict[str, DexiValue]]:
+    """Reads alternatives from a ``.dxi`` file one by one.
+
+    Since DEXi files store alternative values attribute by attribute, no alternative is complete
+    before the whole file has been read. The file is therefore read once for each chunk of ``chunk_size``
+    alternatives, keeping only the values of that chunk and discarding XML elements as soon as
+    they have been processed. Thus, memory use depends on ``chunk_size`` rather than on the number
+    of alternatives, while reading time grows with the number of chunks times the file size.
+    When ``chunk_size`` is None, the file is read once and all values are kept at once.
+
+    Args:
+        filename (str): File name.
+        model (Optional[DexiModel], optional): The model contained in ``filename``, used to determine
+            attribute IDs. Defaults to None, which reads the model structure from ``filename``.
+        chunk_size (Optional[int], optional): Number of alternatives read in one pass over the file.
+            Defaults to 1000.
+
+    Raises:
+        ValueError: When ``chunk_size`` is not positive or ``model`` does not match the file.
+
+    Yields:
+        Dict[str, DexiValue]: Alternatives, equal to the elements of ``model.alternatives`` of the
+        model read using ``read_dexi(filename)``.
+    """
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError(f"Chunk size must be positive, got {chunk_size}")
+    if model is None:
+        model = iterparse_dexi(filename, alternatives = False)
+    ids = model.att_ids
+    make_unique = utl.unique_namer()
+    start = 0
+    total = 1
+    while start < total:
+        stop = None if chunk_size is None else start + chunk_size
+        values, total = _read_alternative_values(filename, model, start, stop)
+        stop = total if stop is None else min(stop, total)
+        for row in range(stop - start):
+            alt: Dict[str, DexiValue] = {"name": make_unique(values[0][row] if row < len(values[0]) else "")} # type: ignore
+            alt.update((id, column[row] if row < len(column) else None) for id, column in zip(ids[1:], values[1:]))
+            yield alt
+        start = stop
+
+def read_dexi(filename: str, alternatives: bool = True) -> DexiModel:
+    return iterparse_dexi(filename, alternatives)
 
 def read_dexi_from_string(xml: str) -> DexiModel:
     root = ET.fromstring(xml)
@@ -0,0 +1,210 @@
+"""
+The module ``dexipy.registry`` implements a registry of related DEXi models, such as
+yearly versions of the same model, that differ mostly in their alternatives.
+
+Models are registered under arbitrary hashable keys (for instance, years). When a registered model
+has the same attributes, scales and functions as an already registered model, it is represented by
+a shallow copy of the latter that has its own name, description and alternatives, but shares everything
+else, including evaluation plans and the caches of decision tables. Otherwise, the model keeps its own
+attributes, but scales and functions that are equal to those of already registered models are replaced
+by the registered instances. Functions are shared only between attributes with equal IDs, scales,
+input IDs and input scales, since a shared function's ``attribute`` remains the attribute of
+the model that registered it first. Thus, the memory used by a registry grows mainly with the number of
+alternatives, and switching between registered models amounts to a dictionary lookup.
+
+For the same reason, the shared root attribute's ``parent`` remains the model that registered the structure
+first, so :py:meth:`dexipy.dexi.DexiAttribute.model` of any attribute of a shallow copy returns that model
+rather than the copy. Code that works with registered models should therefore pass the model itself
+(or its registry key) along with its attributes, instead of navigating from an attribute to its model.
+
+Registered models are frozen (see :py:meth:`dexipy.dexi.DexiModel.freeze`), so their evaluation caches,
+if any, are enabled by the registry (see :py:class:`dexipy.registry.DexiModelRegistry`).
+"""
+
+import hashlib
+import pickle
+from copy import copy, deepcopy
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple
+from dexipy.dexi import DexiModel, DexiScale, DexiFunction, DexiTabularFunction, DexiDiscretizeFunction
+import dexipy.parse as parse
+import dexipy.snapshot as snapshot
+
+def function_digest(funct: Optional[DexiFunction]) -> Optional[bytes]:
+    """Calculates a digest of the values of a function.
+
+    Args:
+        funct (Optional[DexiFunction]): A function.
+
+    Returns:
+        Optional[bytes]: SHA-256 digest of the function's dimensions and values,
+        or None for undefined functions and functions of other classes than
+        :py:class:`dexipy.dexi.DexiTabularFunction` and :py:class:`dexipy.dexi.DexiDiscretizeFunction`.
+    """
+    digest = hashlib.sha256()
+    if isinstance(funct, DexiTabularFunction):
+        digest.update(b"tabular" + repr(tuple(funct.dim)).encode())
+        digest.update(funct.codes.astype("<i8").tobytes())
+        digest.update(pickle.dumps(funct._extra))
+    elif isinstance(funct, DexiDiscretizeFunction):
+        digest.update(b"discretize" + pickle.dumps((funct.bounds, funct.assoc, funct.values)))
+    else:
+        return None
+    return digest.digest()
+
+def scale_signature(scl: Optional[DexiScale]) -> Optional[Tuple[Any, ...]]:
+    """Determines the signature of a scale, which is equal for equal scales.
+
+    Args:
+        scl (Optional[DexiScale]): A scale.
+
+    Returns:
+        Optional[Tuple[Any, ...]]: The signature, or None for undefined scales.
+    """
+    return None if scl is None else (type(scl).__name__, scl.scale_str(), pickle.dumps(scl))
+
+def model_signature(model: DexiModel) -> Tuple[Any, ...]:
+    """Determines the signature of a model, which is equal for models that differ only
+    in their names, descriptions and alternatives.
+
+    Args:
+        model (DexiModel): A DEXi model.
+
+    Returns:
+        Tuple[Any, ...]: The signature.
+    """
+    signature: List[Any] = [model.linking]
+    for att in model.attributes:
+        scl = att.scale
+        signature.append((att.id, att.name, att.description, len(att.inputs),
+                          None if att.link is None else att.link.id,
+                          scale_signature(scl),
+                          function_digest(att.funct) if att.funct is not None else None))
+    return tuple(signature)
+
+class DexiModelRegistry:
+    """A registry of related DEXi models that share equal parts of their structure.
+
+    Models are accessed by key, using ``registry[key]``, and listed in the order of registration.
+
+    Args:
+        eval_cache_size (Optional[int], optional): When given, registered models get a
+            :py:class:`dexipy.cache.DexiEvalCache` of this size before they are frozen
+            (see :py:meth:`dexipy.dexi.DexiModel.enable_eval_cache`). Models that share their structure
+            share the cache, too. Defaults to None, which disables caching of evaluation results.
+        subtrees (bool, optional): Whether the evaluation caches store values of subtrees, too.
+            Defaults to False.
+    """
+
+    def __init__(self, eval_cache_size: Optional[int] = None, subtrees: bool = False):
+        self.eval_cache_size = eval_cache_size
+        self.subtrees = subtrees
+        self._models: Dict[Hashable, DexiModel] = {}
+        self._signatures: Dict[Tuple[Any, ...], DexiModel] = {}
+        self._scales: Dict[str, List[DexiScale]] = {}
+        self._functions: Dict[Tuple[Any, ...], DexiFunction] = {}
+
+    def _share_scale(self, scl: Optional[DexiScale]) -> Optional[DexiScale]:
+        if scl is None:
+            return None
+        candidates = self._scales.setdefault(scl.scale_str(), [])
+        for candidate in candidates:
+            if type(candidate) is type(scl) and candidate.equal(scl):
+                return candidate
+        candidates.append(scl)
+        return scl
+
+    def add(self, key: Hashable, model: DexiModel) -> DexiModel:
+        """Registers ``model`` under ``key``, sharing its parts with already registered models.
+
+        Args:
+            key (Hashable): Registry key, for instance a year.
+            model (DexiModel): A DEXi model. Its scales and functions may be replaced by equal
+                instances from already registered models. A frozen model is copied first.
+
+        Raises:
+            ValueError: When ``key`` is already registered.
+
+        Returns:
+            DexiModel: The registered model, which is either ``model`` or a shallow copy
+            of another registered model. Attributes of a shallow copy belong to the other model,
+            as far as :py:meth:`dexipy.dexi.DexiAttribute.model` is concerned.
+        """
+        if key in self._models:
+            raise ValueError(f"Model {key} is already registered")
+        signature = model_signature(model)
+        base = self._signatures.get(signature)
+        if base is not None:
+            shared = copy(base)
+            shared._eval_plans = base._eval_plans
+            shared.eval_cache = base.eval_cache
+            shared.name = model.name
+            shared.description = model.description
+            shared.alternatives = model.alternatives
+            model = shared.freeze()
+        else:
+            if model.frozen:
+                model = deepcopy(model)
+            for att in model.attributes:
+                att.scale = self._share_scale(att.scale)
+                digest = function_digest(att.funct)
+                if digest is None:
+                    continue
+                # shared functions keep referring to the attribute that registered them first,
+                # so everything they read from it (IDs and scales) must be equal
+                context = (digest, att.id, scale_signature(att.scale),
+                           tuple((inp.id, scale_signature(inp.scale)) for inp in att.inputs))
+                funct = self._functions.get(context)
+                if funct is None:
+                    self._functions[context] = att.funct # type: ignore
+                else:
+                    att.funct = funct
+            if self.eval_cache_size is not None:
+                model.enable_eval_cache(self.eval_cache_size, self.subtrees)
+            model.freeze()
+            self._signatures[signature] = model
+        self._models[key] = model
+        return model
+
+    def load(self, key: Hashable, filename: str, snapshots: bool = False) -> DexiModel:
+        """Reads a model from a ``.dxi`` file and registers it under ``key``.
+
+        Args:
+            key (Hashable): Registry key.
+            filename (str): File name.
+            snapshots (bool, optional): Whether to load the model from an up-to-date snapshot when available
+                and to write a snapshot otherwise (see :py:func:`dexipy.snapshot.read_dexi`).
+                Snapshots are pickles, so this should be enabled only for trusted directories.
+                Defaults to False.
+
+        Returns:
+            DexiModel: The registered model.
+        """
+        model = snapshot.read_dexi(filename, write = True) if snapshots else parse.read_dexi(filename)
+        return self.add(key, model)
+
+    def shares_structure(self, key1: Hashable, key2: Hashable) -> bool:
+        """Checks whether two registered models share all attributes, scales and functions.
+
+        Args:
+            key1 (Hashable): Registry key.
+            key2 (Hashable): Registry key.
+
+        Returns:
+            bool: Whether both models have the same root attribute.
+        """
+        return self._models[key1].root is self._models[key2].root
+
+    def keys(self) -> List[Hashable]:
+        return list(self._models.keys())
+
+    def __getitem__(self, key: Hashable) -> DexiModel:
+        return self._models[key]
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._models
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._models)
+
+    def __len__(self) -> int:
+        return len(self._models)
@@ -0,0 +1,260 @@
+"""
+The module ``dexipy.snapshot`` implements binary snapshots of DEXi models.
+
+A snapshot contains a fully set-up :py:class:`dexipy.dexi.DexiModel` (attributes, scales, links,
+decision tables and alternatives), which can be loaded without parsing XML and re-creating
+decision tables. Snapshots are normally stored next to the corresponding ``.dxi`` files, using the
+``.dxs`` extension, and contain the SHA-256 digest of the source file, so that outdated snapshots
+can be detected and ignored.
+
+A snapshot file consists of a fixed-size header, followed by a pickled model:
+
+* ``MAGIC`` (8 bytes);
+* header format version (unsigned 16-bit integer, little endian);
+* layout digest of the pickled classes (32 bytes, see :py:func:`dexipy.snapshot.layout_digest`);
+* SHA-256 digest of the source ``.dxi`` file (32 bytes; zeros if unknown);
+* model data.
+
+The layout digest is derived from the definitions of all classes that make up a pickled model,
+so that snapshots made by any other version of these classes are rejected without having to
+maintain a version number by hand.
+
+Snapshots are read using :py:mod:`pickle`, so they should only be loaded from trusted sources:
+anyone who can write a snapshot next to a ``.dxi`` file can run code in the reading process.
+Therefore, :py:class:`dexipy.cache.DexiModelCache` and :py:meth:`dexipy.registry.DexiModelRegistry.load`
+use snapshots only when asked to. When they do, they also write snapshots of models they had to parse,
+so that later processes start without parsing. Alternatively, snapshots can be created from
+the command line, for example as a build step::
+
+    python -m dexipy.snapshot model/*.dxi
+"""
+
+import functools
+import hashlib
+import importlib
+import inspect
+import os
+import pickle
+import struct
+import sys
+from types import CodeType
+from typing import Any, List, Optional, Tuple
+from dexipy.dexi import DexiModel
+import dexipy.parse as parse
+
+MAGIC = b"DEXiPySS"
+"""Magic bytes at the beginning of snapshot files."""
+
+VERSION = 5
+"""Snapshot header format version. Snapshots of other versions are rejected.
+Changes of pickled classes are detected by :py:func:`dexipy.snapshot.layout_digest`."""
+
+LAYOUT_MODULES = ("dexipy.dexi", "dexipy.types")
+"""Modules whose classes make up pickled models."""
+
+EXTENSION = ".dxs"
+"""Default file name extension of snapshot files."""
+
+_HEADER = struct.Struct("<8sH32s32s")
+_NO_DIGEST = bytes(32)
+
+def _update_code(digest: Any, code: CodeType) -> None:
+    digest.update(code.co_code)
+    digest.update(repr((code.co_names, code.co_varnames)).encode())
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            _update_code(digest, const)
+        elif isinstance(const, (str, bytes, int, float, bool, type(None))):
+            digest.update(repr(const).encode())
+
+@functools.lru_cache(maxsize = None)
+def layout_digest() -> bytes:
+    """Calculates the digest of the layout of classes that make up pickled models.
+
+    The digest covers names, class attributes and the code of all methods and properties of classes
+    defined in ``LAYOUT_MODULES``, so that it changes whenever the attributes these classes
+    store in their instances may have changed. It also depends on the Python version.
+
+    Returns:
+        bytes: SHA-256 digest.
+    """
+    digest = hashlib.sha256(repr(sys.version_info[:2]).encode())
+    for name in LAYOUT_MODULES:
+        module = importlib.import_module(name)
+        classes = [cls for _, cls in inspect.getmembers(module, inspect.isclass) if cls.__module__ == module.__name__]
+        for cls in classes:
+            digest.update(f"{cls.__module__}.{cls.__qualname__}{[base.__name__ for base in cls.__bases__]}".encode())
+            for member_name, member in sorted(vars(cls).items()):
+                digest.update(member_name.encode())
+                if isinstance(member, (staticmethod, classmethod)):
+                    member = member.__func__
+                functs = [member.fget, member.fset] if isinstance(member, property) else [member]
+                for funct in functs:
+                    code = getattr(funct, "__code__", None)
+                    if code is not None:
+                        _update_code(digest, code)
+                if isinstance(member, (str, int, float, bool, tuple, type(None))):
+                    digest.update(repr(member).encode())
+    return digest.digest()
+
+def source_digest(filename: str) -> bytes:
+    """Calculates the SHA-256 digest of a file.
+
+    Args:
+        filename (str): File name.
+
+    Returns:
+        bytes: Digest of the file contents.
+    """
+    with open(filename, "rb") as file:
+        return hashlib.sha256(file.read()).digest()
+
+def snapshot_name(filename: str) -> str:
+    """Returns the default snapshot file name for a ``.dxi`` file.
+
+    Args:
+        filename (str): Name of a ``.dxi`` file.
+
+    Returns:
+        str: ``filename`` with the extension replaced by ``EXTENSION``.
+    """
+    return os.path.splitext(filename)[0] + EXTENSION
+
+def dumps(model: DexiModel, digest: Optional[bytes] = None) -> bytes:
+    """Serializes ``model`` to a snapshot.
+
+    Args:
+        model (DexiModel): A DEXi model.
+        digest (Optional[bytes], optional): SHA-256 digest of the source file. Defaults to None.
+
+    Returns:
+        bytes: Snapshot data.
+    """
+    header = _HEADER.pack(MAGIC, VERSION, layout_digest(), _NO_DIGEST if digest is None else digest)
+    return header + pickle.dumps(model, protocol = pickle.HIGHEST_PROTOCOL)
+
+def read_header(data: bytes) -> Tuple[int, bytes]:
+    """Reads and checks a snapshot header.
+
+    Args:
+        data (bytes): Snapshot data, or at least its first ``_HEADER.size`` bytes.
+
+    Raises:
+        ValueError: When ``data`` does not start with a valid header, the snapshot version is not supported,
+            or the snapshot was made by different versions of pickled classes.
+
+    Returns:
+        Tuple[int, bytes]: Snapshot format version and the source file digest.
+    """
+    if len(data) < _HEADER.size:
+        raise ValueError("Not a DEXiPy snapshot")
+    magic, version, layout, digest = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Not a DEXiPy snapshot")
+    if version != VERSION:
+        raise ValueError(f"Unsupported snapshot version {version}, expected {VERSION}")
+    if layout != layout_digest():
+        raise ValueError("Snapshot was made by a different version of DEXiPy classes")
+    return version, digest
+
+def loads(data: bytes) -> DexiModel:
+    """De-serializes a model from snapshot data.
+
+    Args:
+        data (bytes): Snapshot data, as created by :py:func:`dexipy.snapshot.dumps`.
+
+    Raises:
+        ValueError: When ``data`` is not a valid snapshot.
+
+    Returns:
+        DexiModel: The model.
+    """
+    read_header(data)
+    model = pickle.loads(data[_HEADER.size:])
+    if not isinstance(model, DexiModel):
+        raise ValueError("Snapshot does not contain a DEXi model")
+    return model
+
+def _write_file(filename: str, data: bytes) -> None:
+    # write to a temporary file first, so that readers never see a partially written snapshot
+    temp = filename + ".tmp"
+    with open(temp, "wb") as file:
+        file.write(data)
+    os.replace(temp, filename)
+
+def save_snapshot(model: DexiModel, filename: str, source: Optional[str] = None) -> None:
+    """Saves ``model`` to a snapshot file.
+
+    Args:
+        model (DexiModel): A DEXi model.
+        filename (str): Snapshot file name.
+        source (Optional[str], optional): Name of the ``.dxi`` file from which the model was read.
+            When given, the snapshot is bound to the current contents of that file. Defaults to None.
+    """
+    digest = None if source is None else source_digest(source)
+    _write_file(filename, dumps(model, digest))
+
+def load_snapshot(filename: str) -> DexiModel:
+    """Loads a model from a snapshot file.
+
+    Args:
+        filename (str): Snapshot file name.
+
+    Raises:
+        ValueError: When the file is not a valid snapshot.
+
+    Returns:
+        DexiModel: The model.
+    """
+    with open(filename, "rb") as file:
+        return loads(file.read())
+
+def read_dexi(filename: str, snapshot: Optional[str] = None, write: bool = False) -> DexiModel:
+    """Reads a DEXi model from a ``.dxi`` file, preferring an up-to-date snapshot of the file.
+
+    The snapshot is used only if it has been made from the current contents of ``filename``.
+    Otherwise, ``filename`` is parsed and, if ``write`` is True, a new snapshot is saved.
+    Failures of reading (including any error raised while unpickling a stale or corrupt snapshot)
+    or writing the snapshot are ignored.
+
+    Args:
+        filename (str): Name of a ``.dxi`` file.
+        snapshot (Optional[str], optional): Snapshot file name.
+            Defaults to None, which selects :py:func:`dexipy.snapshot.snapshot_name` of ``filename``.
+        write (bool, optional): Whether to save a snapshot when there is no up-to-date snapshot.
+            Defaults to False.
+
+    Returns:
+        DexiModel: DEXi model.
+    """
+    if snapshot is None:
+        snapshot = snapshot_name(filename)
+    digest = source_digest(filename)
+    try:
+        with open(snapshot, "rb") as file:
+            data = file.read()
+        if read_header(data)[1] == digest:
+            return loads(data)
+    except Exception:
+        pass
+    model = parse.read_dexi(filename)
+    if write:
+        try:
+            _write_file(snapshot, dumps(model, digest))
+        except OSError:
+            pass
+    return model
+
+def main(args: List[str]) -> int:
+    if len(args) == 0:
+        print("Usage: python -m dexipy.snapshot <file.dxi> ...", file = sys.stderr)
+        return 2
+    for filename in args:
+        model = parse.read_dexi(filename)
+        snapshot = snapshot_name(filename)
+        save_snapshot(model, snapshot, source = filename)
+        print(f"{filename} -> {snapshot}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
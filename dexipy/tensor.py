@@ -0,0 +1,189 @@
+"""
+The module ``dexipy.tensor`` implements NumPy-based aggregation of value distributions
+by tabular functions, used by the "prob", "fuzzy" and "fuzzynorm" evaluation methods.
+
+A decision table of some :py:class:`dexipy.dexi.DexiTabularFunction` is represented by a *rule tensor*
+of shape ``funct.dim + (n_out,)``, which contains the (normalized) value distribution of each decision rule.
+Aggregating input distributions then amounts to:
+
+* "prob": forming the outer product of input distributions (a joint distribution of function arguments)
+  and contracting it against the rule tensor;
+* "fuzzy", "fuzzynorm": forming the outer minimum of input distributions and
+  composing it with the rule tensor using the max-min composition.
+
+All functions operate on batches of alternatives, represented along the leading array axis.
+Large batches are processed in chunks, so that temporary arrays do not exceed
+:py:data:`dexipy.tensor.CHUNK_ELEMENTS` elements, regardless of the number of alternatives.
+The results are equal to those of :py:func:`dexipy.eval.evaluate_as_distribution` with
+the default ``and_op`` and ``or_op`` operators of the corresponding methods.
+"""
+
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
+import dexipy.utils as utl
+import dexipy.values as vls
+from dexipy.types import CallableNorm, DexiValue
+from dexipy.dexi import DexiTabularFunction
+
+PROB = "prob"
+"""Engine contracting joint probabilities of arguments with the rule tensor (``and_op = prod``, ``or_op = sum``)."""
+
+FUZZY = "fuzzy"
+"""Engine composing fuzzy memberships of arguments with the rule tensor (``and_op = min``, ``or_op = max``)."""
+
+CHUNK_ELEMENTS = 1 << 22
+"""Maximum number of elements of temporary arrays created while evaluating a chunk of alternatives."""
+
+def engine(and_op, or_op) -> Optional[str]:
+    """Determines the tensor engine that implements the given pair of aggregation operators.
+
+    Args:
+        and_op (CallableOperator): Conjunctive aggregation function.
+        or_op (CallableOperator): Disjunctive aggregation function.
+
+    Returns:
+        Optional[str]: ``PROB`` or ``FUZZY``, or None if the operators are not
+        the built-in defaults of the "prob" or "fuzzy"/"fuzzynorm" methods.
+    """
+    if and_op is utl.prod and or_op is sum:
+        return PROB
+    if and_op is min and or_op is max:
+        return FUZZY
+    return None
+
+def rule_tensor(funct: DexiTabularFunction, norm: CallableNorm) -> Tuple[np.ndarray, np.ndarray]:
+    """Converts the decision table of ``funct`` to a rule tensor.
+
+    The result is cached on ``funct`` (see :py:meth:`dexipy.dexi.DexiTabularFunction.derived`).
+
+    Args:
+        funct (DexiTabularFunction): A tabular function.
+        norm (CallableNorm): Normalization function applied to value distributions of decision rules.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: A float array of shape ``funct.dim + (n_out,)``, containing
+        normalized value distributions of decision rules, padded with zeros,
+        and an integer array of shape ``funct.dim``, containing the length of each rule's value
+        distribution. Length 0 denotes undefined rules.
+    """
+    def compute(funct: DexiTabularFunction) -> Tuple[np.ndarray, np.ndarray]:
+        distrs: List[List[float]] = []
+        for value in funct.value_vector():
+            as_set = vls.dexi_value_as_set(value)
+            if value is None or utl.objlen(as_set) == 0:
+                distrs.append([])
+            else:
+                distrs.append(norm(vls.dexi_value_as_distr(value)))
+        lengths = np.array([len(distr) for distr in distrs], dtype = np.int64)
+        values = distribution_matrix(distrs)
+        return values.reshape(tuple(funct.dim) + (values.shape[1],)), lengths.reshape(funct.dim)
+
+    return funct.derived(("rule_tensor", norm), compute)
+
+def distribution_matrix(distrs: Sequence[Sequence[float]], width: int = 0) -> np.ndarray:
+    """Converts a sequence of value distributions to a matrix, padding distributions with zeros.
+
+    Args:
+        distrs (Sequence[Sequence[float]]): Value distributions.
+        width (int, optional): Minimal number of matrix columns. Defaults to 0.
+
+    Returns:
+        np.ndarray: A float matrix of shape ``(len(distrs), max(width, max_len))``.
+    """
+    width = max([width] + [len(distr) for distr in distrs])
+    result = np.zeros((len(distrs), width), dtype = float)
+    for i, distr in enumerate(distrs):
+        result[i, :len(distr)] = distr
+    return result
+
+def membership_tensor(inputs: Sequence[np.ndarray], method: str) -> np.ndarray:
+    """Combines input distributions into memberships of all combinations of function arguments.
+
+    Args:
+        inputs (Sequence[np.ndarray]): Matrices of shape ``(n_alternatives, n_i)``, one for each
+            function argument, containing value distributions of the argument.
+        method (str): ``PROB`` (outer product) or ``FUZZY`` (outer minimum).
+
+    Returns:
+        np.ndarray: Array of shape ``(n_alternatives, n_1, n_2, ...)``.
+    """
+    combine = np.multiply if method == PROB else np.minimum
+    result = inputs[0]
+    for inp in inputs[1:]:
+        result = combine(result[..., np.newaxis], inp.reshape((inp.shape[0],) + (1,) * (result.ndim - 1) + (inp.shape[1],)))
+    return result
+
+def chunk_length(nrules: int, nout: int, method: str) -> int:
+    """Determines the number of alternatives evaluated at once by :py:func:`dexipy.tensor.evaluate_distributions`.
+
+    Args:
+        nrules (int): Number of decision rules (combinations of function arguments).
+        nout (int): Length of rules' value distributions.
+        method (str): ``PROB`` or ``FUZZY``.
+
+    Returns:
+        int: Chunk length, at least 1. Temporary arrays have ``nrules`` elements per alternative
+        for ``PROB`` and ``nrules * nout`` elements per alternative for ``FUZZY``.
+    """
+    per_alternative = nrules if method == PROB else nrules * max(nout, 1)
+    return max(1, CHUNK_ELEMENTS // max(per_alternative, 1))
+
+def evaluate_distributions(funct: DexiTabularFunction,
+                           inputs: Sequence[np.ndarray],
+                           method: str,
+                           norm: CallableNorm,
+                           size: int = 0,
+                           chunk_size: Optional[int] = None) -> List[DexiValue]:
+    """Evaluates ``funct`` for a batch of alternatives, given value distributions of function arguments.
+
+    Args:
+        funct (DexiTabularFunction): A tabular function.
+        inputs (Sequence[np.ndarray]): Matrices of shape ``(n_alternatives, n_i)``, one for each
+            function argument, containing value distributions of the argument
+            (see :py:func:`dexipy.tensor.distribution_matrix`).
+        method (str): ``PROB`` or ``FUZZY``.
+        norm (CallableNorm): Normalization function applied to value distributions of decision rules.
+        size (int, optional): Minimal length of resulting distributions,
+            normally the output scale size. Defaults to 0.
+        chunk_size (Optional[int], optional): Number of alternatives evaluated at once. Defaults to None,
+            which selects :py:func:`dexipy.tensor.chunk_length`.
+
+    Returns:
+        List[DexiValue]: A list of ``n_alternatives`` value distributions. An element is None when the
+        alternative's arguments select, with non-zero membership, some undefined decision rule.
+    """
+    values, lengths = rule_tensor(funct, norm)
+    nalt = inputs[0].shape[0]
+    dim = lengths.shape
+    widths = tuple(max(d, inp.shape[1]) for d, inp in zip(dim, inputs))
+    if widths != dim:
+        pad = [(0, w - d) for w, d in zip(widths, dim)]
+        values = np.pad(values, pad + [(0, 0)])
+        lengths = np.pad(lengths, pad)
+    inputs = [np.pad(inp, ((0, 0), (0, w - inp.shape[1]))) for inp, w in zip(inputs, widths)]
+    lengths = lengths.reshape(-1)
+    rules = values.reshape(lengths.size, -1)
+    if chunk_size is None:
+        chunk_size = chunk_length(lengths.size, rules.shape[1], method)
+
+    result: List[DexiValue] = []
+    for start in range(0, nalt, chunk_size):
+        chunk = [inp[start:start + chunk_size] for inp in inputs]
+        result.extend(_evaluate_chunk(chunk, rules, lengths, method, size))
+    return result
+
+def _evaluate_chunk(inputs: Sequence[np.ndarray], rules: np.ndarray, lengths: np.ndarray,
+                    method: str, size: int) -> List[DexiValue]:
+    nalt = inputs[0].shape[0]
+    membership = membership_tensor(inputs, method).reshape(nalt, -1)
+    active = membership != 0
+    undefined = np.any(active & (lengths == 0), axis = 1)
+    nout = np.maximum(np.max(np.where(active, lengths, 0), axis = 1, initial = 0), size)
+
+    if method == PROB:
+        result = np.einsum("ar,ro->ao", membership, rules)
+    else:
+        result = np.maximum(np.max(np.minimum(membership[:, :, np.newaxis], rules[np.newaxis]), axis = 1), 0.0)
+    if result.shape[1] < size:
+        result = np.pad(result, ((0, 0), (0, size - result.shape[1])))
+    return [None if undefined[i] else result[i, :nout[i]].tolist() for i in range(nalt)]
@@ -0,0 +1,158 @@
+import unittest
+import itertools
+from copy import deepcopy
+import math
+from dexipy.analysis import sensitivity_values, sensitivity, outcome_counts, goal_seek
+from dexipy.dexi import read_dexi_from_string, DexiDiscreteScale, DexiContinuousScale
+from dexipy.tests.testdata import car_xml, linked_xml, continuous_new_xml
+
+class Test_test_analysis(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.car_dxi = read_dexi_from_string(car_xml)
+        cls.linked_dxi = read_dexi_from_string(linked_xml)
+        return super().setUpClass()
+
+    def test_sensitivity_values(self):
+        scl = DexiDiscreteScale(["a", "b", "c", "d"])
+        self.assertEqual(sensitivity_values(1, scl), [0, 2, 3])
+        self.assertEqual(sensitivity_values(1, scl, 1), [0, 2])
+        self.assertEqual(sensitivity_values(3, scl, 2), [1, 2])
+        self.assertEqual(sensitivity_values({1, 2}, scl, 1), [0, 1, 2, 3])
+        self.assertEqual(sensitivity_values(None, scl), [0, 1, 2, 3])
+        self.assertEqual(sensitivity_values(1.0, DexiContinuousScale()), [])
+        self.assertEqual(sensitivity_values(1, None), [])
+
+    def expected(self, model, alt, target, steps = None, method = "set"):
+        evaluated = model.evaluate(alt, method = method)
+        result = {}
+        for id in model.eval_plan().basic_ids:
+            values = sensitivity_values(evaluated[id], model.attrib(id).scale, steps)
+            result[id] = {}
+            for val in values:
+                changed = deepcopy(alt)
+                changed[id] = val
+                result[id][val] = model.evaluate(changed, method = method)[target]
+        return result
+
+    def test_sensitivity_Car(self):
+        model = self.car_dxi
+        for alt in model.alternatives:
+            for target in ["CAR", "PRICE", "TECH.CHAR."]:
+                for method in ["set", "prob"]:
+                    self.assertEqual(sensitivity(model, alt, target, method = method),
+                                     self.expected(model, alt, target, method = method))
+            self.assertEqual(model.sensitivity(alt, "CAR", 1), self.expected(model, alt, "CAR", 1))
+        evaluated = model.evaluate(model.alternatives[0])
+        self.assertEqual(model.sensitivity(evaluated, model.attrib("CAR"), evaluated = True),
+                         model.sensitivity(model.alternatives[0], "CAR"))
+        self.assertEqual(model.sensitivity(model.alternatives[0], "PRICE")["SAFETY"], {0: 2, 1: 2})
+        with self.assertRaises(ValueError):
+            model.sensitivity(model.alternatives[0], "XYZ")
+
+    def test_sensitivity_Linked(self):
+        model = self.linked_dxi
+        for alt in model.alternatives:
+            self.assertEqual(model.sensitivity(alt, model.root.inputs[0]),
+                             self.expected(model, alt, model.root.inputs[0].id))
+
+    def enumerated_counts(self, model, target, prune = []):
+        plan = model.eval_plan(prune = prune)
+        affecting = [id for id in plan.basic_ids if target in [step[0] for step in plan.affected_steps([id])]]
+        scales = [range(model.attrib(id).scale.count()) for id in affecting]
+        result = [0] * (model.attrib(target).scale.count() + 1)
+        for values in itertools.product(*scales):
+            value = model.evaluate(dict(zip(affecting, values)), prune = prune)[target]
+            result[value if isinstance(value, int) else -1] += 1
+        return result
+
+    def test_outcome_counts_Car(self):
+        model = self.car_dxi
+        counts = outcome_counts(model)
+        self.assertEqual(list(counts.keys()), model.eval_plan().order[:-1])
+        for id in ["CAR", "PRICE", "TECH.CHAR.", "COMFORT"]:
+            self.assertEqual(counts[id], self.enumerated_counts(model, id))
+        self.assertEqual(counts["BUY.PRICE"], [1, 1, 1, 0])
+        self.assertEqual(sum(counts["CAR"]), 3 ** 5 * 4)
+        pruned = model.outcome_counts(prune = ["PRICE"])
+        self.assertEqual(pruned["CAR"], self.enumerated_counts(model, "CAR", ["PRICE"]))
+        shares = model.outcome_counts(normalize = True)
+        self.assertAlmostEqual(sum(shares["CAR"]), 1.0)
+        self.assertAlmostEqual(shares["CAR"][0], counts["CAR"][0] / sum(counts["CAR"]))
+
+    def test_outcome_counts_Linked(self):
+        model = self.linked_dxi
+        target = model.root.inputs[0].id
+        self.assertEqual(outcome_counts(model)[target], self.enumerated_counts(model, target))
+        weights = {"A_2": [0.2, 0.3, 0.5], "B_2": [0.1, 0.1, 0.8]}
+        expected = [0.0] * 4
+        for a, b in itertools.product(range(3), range(3)):
+            expected[model.evaluate({"A_2": a, "B_2": b})[target]] += weights["A_2"][a] * weights["B_2"][b]
+        result = outcome_counts(model, weights = weights)[target]
+        for res, exp in zip(result, expected):
+            self.assertAlmostEqual(res, exp)
+
+    def test_outcome_counts_errors(self):
+        with self.assertRaises(ValueError):
+            outcome_counts(read_dexi_from_string(continuous_new_xml))
+
+    def enumerated_goals(self, model, alt, target, goals, costs = {}):
+        basic = [att.id for att in model.basic if att.link is None and att.affects(model.attrib(target))]
+        current = model.evaluate(alt)
+        result = []
+        for combination in itertools.product(*(range(model.attrib(id).scale.count()) for id in basic)):
+            changes = {id: val for id, val in zip(basic, combination) if val != current[id]}
+            cost = sum(costs.get(id, 1.0) * abs(val - current[id]) for id, val in changes.items())
+            if not math.isinf(cost) and model.evaluate({**alt, **changes})[target] in goals:
+                result.append((cost, changes))
+        # solutions that include all changes of a less costly one are dominated
+        minimal = []
+        for cost, changes in sorted(result, key = lambda sol: sol[0]):
+            if not any(prev.items() <= changes.items() for _, prev in minimal):
+                minimal.append((cost, changes))
+        return minimal
+
+    def test_goal_seek_Car(self):
+        model = self.car_dxi
+        alt = model.alternatives[1]
+        self.assertEqual(goal_seek(model, alt, "CAR", 2), [(0.0, {})])
+        solutions = goal_seek(model, alt, "CAR", 3, limit = 5)
+        expected = self.enumerated_goals(model, alt, "CAR", {3})
+        self.assertEqual([sol[0] for sol in solutions], [sol[0] for sol in expected[:5]])
+        for sol in solutions:
+            self.assertIn(sol, expected)
+        costs = {"BUY.PRICE": math.inf, "SAFETY": 0.5}
+        solutions = model.goal_seek(alt, "TECH.CHAR.", 0, at_least = True, costs = costs, limit = 3)
+        expected = self.enumerated_goals(model, alt, "TECH.CHAR.", {0, 1, 2, 3}, costs)
+        self.assertEqual([sol[0] for sol in solutions], [sol[0] for sol in expected[:3]])
+        self.assertEqual(goal_seek(model, alt, "PRICE", {0}, costs = {"BUY.PRICE": math.inf, "MAINT.PRICE": math.inf}), [])
+        # with a set of values, at_least admits everything from its smallest element upwards
+        solutions = goal_seek(model, alt, "CAR", {2, 0}, at_least = True, limit = 10)
+        expected = self.enumerated_goals(model, alt, "CAR", {0, 1, 2, 3})
+        self.assertEqual([sol[0] for sol in solutions], [sol[0] for sol in expected[:10]])
+        self.assertEqual(goal_seek(model, alt, "CAR", {3, 1}, at_least = True, limit = 10),
+                         goal_seek(model, alt, "CAR", 1, at_least = True, limit = 10))
+        self.assertEqual(goal_seek(model, alt, "CAR", set(), at_least = True), [])
+        # no solution makes all changes of another one, even when some changes are free
+        solutions = goal_seek(model, alt, "CAR", 3, costs = {"SAFETY": 0.0, "#PERS": 0.0}, limit = 10)
+        self.assertGreater(len(solutions), 1)
+        for i, (_, first) in enumerate(solutions):
+            for _, second in solutions[i + 1:]:
+                self.assertFalse(first.items() <= second.items() or second.items() <= first.items())
+        with self.assertRaises(ValueError):
+            goal_seek(model, alt, "UNKNOWN", 0)
+
+    def test_goal_seek_Linked(self):
+        model = self.linked_dxi
+        target = model.root.inputs[0].id
+        alt = model.alternatives[0]
+        for val in range(model.root.inputs[0].scale.count()):
+            solutions = goal_seek(model, alt, target, val, limit = 4)
+            expected = self.enumerated_goals(model, alt, target, {val})
+            self.assertEqual([sol[0] for sol in solutions], [sol[0] for sol in expected[:4]])
+            for sol in solutions:
+                self.assertIn(sol, expected)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+import unittest
+import numpy as np
+from copy import deepcopy
+from dexipy.batch import UNDEFINED, crisp_table, evaluation_table, aggregate_columns, evaluate_crisp
+from dexipy.batch import set_table, aggregate_sets, evaluate_sets
+from dexipy.dexi import read_dexi_from_string
+from dexipy.tests.testdata import car_xml, linked_xml, continuous_new_xml
+
+class Test_test_batch(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.car_dxi = read_dexi_from_string(car_xml)
+        cls.linked_dxi = read_dexi_from_string(linked_xml)
+        cls.continuous_new_dxi = read_dexi_from_string(continuous_new_xml)
+        return super().setUpClass()
+
+    def test_crisp_table_Car(self):
+        fnc = self.car_dxi.attrib("CAR").funct
+        table = crisp_table(fnc)
+        self.assertEqual(table.shape, (3, 4))
+        for args, val in fnc.values.items():
+            self.assertEqual(table[args], val)
+
+    def test_evaluation_table_Car(self):
+        fnc = deepcopy(self.car_dxi.attrib("CAR").funct)
+        table = evaluation_table(fnc, 4)
+        self.assertEqual(table.shape, (4, 5))
+        self.assertIs(evaluation_table(fnc, 4), table)
+        self.assertFalse(table.flags.writeable)
+        self.assertEqual(table[-1, -1], UNDEFINED)
+        fnc.values[(0, 0)] = 3
+        changed = evaluation_table(fnc, 4)
+        self.assertIsNot(changed, table)
+        self.assertEqual(changed[0, 0], 3)
+
+    def test_set_table_Car(self):
+        fnc = deepcopy(self.car_dxi.attrib("CAR").funct)
+        fnc.values[(0, 0)] = {0, 1}
+        fnc.values[(0, 1)] = None
+        fnc.values[(0, 2)] = 7
+        table = set_table(fnc, 4)
+        self.assertIs(set_table(fnc, 4), table)
+        self.assertEqual(table[:1].tolist(), [[3, 0, 0, 1]])
+        self.assertEqual(table[2, 3], 1 << 3)
+
+    def test_aggregate_sets(self):
+        table = np.array([[1, 2], [2, 4]], dtype = np.uint64)
+        masks = [np.array([1, 3, 3, 0, 4], dtype = np.uint64), np.array([2, 1, 3, 1, 1], dtype = np.uint64)]
+        self.assertEqual(aggregate_sets(table, masks).tolist(), [2, 3, 7, 0, 0])
+        table[1, 1] = 0
+        self.assertEqual(aggregate_sets(table, masks).tolist(), [2, 3, 0, 0, 0])
+
+    def test_evaluate_sets_Car(self):
+        model = deepcopy(self.car_dxi)
+        model.attrib("CAR").funct.values[(0, 0)] = {0, 1}
+        basic = model.eval_plan().basic_ids
+        alts = [model.alternative(f"a{i}", values = {id: value for id in basic})
+                for i, value in enumerate([0, 1, 2, {0, 1}, {1, 2}, "*", None])]
+        alts.append(model.alternative("mixed", values = {id: [{0, 2}, "*", 1, 0][i % 4] for i, id in enumerate(basic)}))
+        expected = model.evaluate(alts, method = "set")
+        result = evaluate_sets(model, {id: [alt[id] for alt in alts] for id in basic})
+        self.assertEqual(list(result.keys()), [step[0] for step in model.eval_plan().steps])
+        for id, packed in result.items():
+            self.assertEqual(packed.values(), [alt[id] for alt in expected])
+
+    def test_aggregate_columns(self):
+        table = np.array([[0, 1], [1, 2]])
+        result = aggregate_columns(table, [np.array([0, 1, 1, -1, 2]), np.array([1, 0, 1, 0, 0])])
+        self.assertEqual(result.tolist(), [1, 1, 2, UNDEFINED, UNDEFINED])
+
+    def test_evaluate_crisp_Car(self):
+        model = self.car_dxi
+        plan = model.eval_plan()
+        data = [[alt[id] for id in plan.basic_ids] for alt in model.alternatives]
+        result = evaluate_crisp(model, data)
+        self.assertEqual(list(result.keys()), plan.order[:-1])
+        for i, alt in enumerate(model.evaluate()):
+            for id in model.non_root_ids:
+                self.assertEqual(result[id][i], alt[id])
+
+    def test_evaluate_crisp_Car_values(self):
+        model = self.car_dxi
+        data = {"BUY.PRICE": [{0, 1}, "high", 1, None], "MAINT.PRICE": [2, 2, "*", 2],
+                "#PERS": [2, 2, 2, 2], "#DOORS": [2, 2, 2, 2], "LUGGAGE": [2, [0.0, 0.0, 1.0], 2, 2], "SAFETY": [2, 2, 2, 2]}
+        result = evaluate_crisp(model, data)
+        self.assertEqual(result["BUY.PRICE"].tolist(), [UNDEFINED, 0, 1, UNDEFINED])
+        self.assertEqual(result["MAINT.PRICE"].tolist(), [2, 2, UNDEFINED, 2])
+        self.assertEqual(result["LUGGAGE"].tolist(), [2, 2, 2, 2])
+        self.assertEqual(result["CAR"][1], model.evaluate({id: col[1] for id, col in data.items()})["CAR"])
+
+    def test_evaluate_crisp_Car_all(self):
+        model = self.car_dxi
+        plan = model.eval_plan()
+        sizes = [model.attrib(id).scale.count() for id in plan.basic_ids]
+        data = np.array(np.meshgrid(*[range(s) for s in sizes], indexing = "ij")).reshape(len(sizes), -1).T
+        result = evaluate_crisp(model, data)
+        self.assertEqual(len(result["CAR"]), len(data))
+        for i in range(0, len(data), 17):
+            alt = dict(zip(plan.basic_ids, data[i].tolist()))
+            self.assertEqual(result["CAR"][i], model.evaluate(alt)["CAR"])
+
+    def test_evaluate_crisp_Car_frame(self):
+        model = self.car_dxi
+        data = {"BUY.PRICE": [0, 2], "MAINT.PRICE": [2, 2], "#PERS": [2, 2], "#DOORS": [3, 3],
+                "LUGGAGE": [2, 2], "SAFETY": [2, UNDEFINED]}
+        df = evaluate_crisp(model, data, as_frame = True)
+        self.assertEqual(df["PRICE"].tolist(), [0, 2])
+        self.assertEqual(df["TECH.CHAR."].tolist(), [3, UNDEFINED])
+        self.assertEqual(df["CAR"].tolist(), [0, UNDEFINED])
+        with self.assertRaises(ValueError):
+            evaluate_crisp(model, {"BUY.PRICE": [0]})
+        with self.assertRaises(ValueError):
+            evaluate_crisp(model, [[0, 1]])
+
+    def test_evaluate_crisp_Car_pruned(self):
+        model = self.car_dxi
+        result = model.evaluate_crisp({"PRICE": [2], "TECH.CHAR.": [3]}, prune = ["PRICE", "TECH.CHAR."])
+        self.assertEqual(list(result.keys()), ["PRICE", "TECH.CHAR.", "CAR"])
+        self.assertEqual(result["CAR"].tolist(), [3])
+
+    def test_evaluate_crisp_Linked(self):
+        model = self.linked_dxi
+        plan = model.eval_plan()
+        self.assertEqual(plan.basic_ids, ["A_2", "B_2"])
+        data = [[alt[id] for id in plan.basic_ids] for alt in model.alternatives]
+        result = evaluate_crisp(model, data)
+        for i, alt in enumerate(model.evaluate()):
+            for id in model.non_root_ids:
+                self.assertEqual(result[id][i], alt[id])
+
+    def test_evaluate_crisp_ContinuousNew(self):
+        model = self.continuous_new_dxi
+        result = evaluate_crisp(model, {"N1": [-2.0, 2.0, np.nan], "N2": [-2.0, 0.0, 2.0]})
+        self.assertEqual(list(result.keys()), ["X1", "X2", "OneLevel"])
+        self.assertEqual(result["X1"].tolist(), [0, 1, UNDEFINED])
+        self.assertEqual(result["X2"].tolist(), [0, 1, 2])
+        self.assertEqual(result["OneLevel"].tolist(), [0, 2, UNDEFINED])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,220 @@
+import unittest
+import os
+import tempfile
+import pickle
+import threading
+from unittest import mock
+from copy import deepcopy
+import dexipy.cache as cache_module
+from dexipy.cache import DexiModelCache, DexiEvalCache, value_key, copy_record
+from dexipy.dexi import read_dexi_cached, read_dexi_from_string
+from dexipy.tests.testdata import car_xml, car2_xml, linked_xml
+
+class Test_test_cache(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.dir.name, "Car.dxi")
+        self.write(self.filename, car_xml)
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def write(self, filename, xml, mtime_ns = None):
+        with open(filename, "w", encoding = "utf-8") as file:
+            file.write(xml)
+        if mtime_ns is not None:
+            os.utime(filename, ns = (mtime_ns, mtime_ns))
+
+    def test_read_dexi_cached(self):
+        cache = DexiModelCache(maxsize = 2)
+        model = cache.read_dexi(self.filename)
+        self.assertEqual(model.name, "CAR_MODEL")
+        self.assertIs(cache.read_dexi(self.filename), model)
+        self.assertIs(cache.read_dexi(os.path.relpath(self.filename)), model)
+        self.assertEqual(cache.info(), {"hits": 2, "misses": 1, "size": 1, "maxsize": 2})
+
+        # modified file is read again
+        mtime = os.stat(self.filename).st_mtime_ns
+        self.write(self.filename, linked_xml, mtime + 1_000_000_000)
+        changed = cache.read_dexi(self.filename)
+        self.assertIsNot(changed, model)
+        self.assertEqual(changed.attrib("A").name, "A")
+        self.assertIs(cache.read_dexi(self.filename), changed)
+
+        cache.invalidate(self.filename)
+        self.assertEqual(len(cache), 0)
+        with self.assertRaises(OSError):
+            cache.read_dexi(os.path.join(self.dir.name, "missing.dxi"))
+
+    def test_read_dexi_snapshots(self):
+        snapshot_file = cache_module.snapshot.snapshot_name(self.filename)
+        model = DexiModelCache().read_dexi(self.filename)
+        self.assertFalse(os.path.exists(snapshot_file))
+        model = DexiModelCache(snapshots = True).read_dexi(self.filename)
+        self.assertTrue(os.path.exists(snapshot_file))
+        with mock.patch.object(cache_module.parse, "read_dexi", side_effect = AssertionError):
+            self.assertEqual(DexiModelCache(snapshots = True).read_dexi(self.filename).evaluate(), model.evaluate())
+            with self.assertRaises(AssertionError):
+                DexiModelCache().read_dexi(self.filename)
+
+    def test_read_dexi_concurrent(self):
+        cache = DexiModelCache()
+        other = os.path.join(self.dir.name, "Linked.dxi")
+        self.write(other, linked_xml)
+        cached = cache.read_dexi(other)
+        started, release = threading.Event(), threading.Event()
+        reads = []
+        read_dexi = cache_module.parse.read_dexi
+
+        def slow_read(path):
+            reads.append(path)
+            started.set()
+            release.wait(10)
+            return read_dexi(path)
+
+        results = []
+        with mock.patch.object(cache_module.parse, "read_dexi", slow_read):
+            threads = [threading.Thread(target = lambda: results.append(cache.read_dexi(self.filename))) for _ in range(2)]
+            threads[0].start()
+            self.assertTrue(started.wait(10))
+            threads[1].start()
+            # other files are served while the file is being read
+            self.assertIs(cache.read_dexi(other), cached)
+            release.set()
+            for thread in threads:
+                thread.join(10)
+        self.assertEqual(reads, [os.path.abspath(self.filename)])
+        self.assertEqual(len(results), 2)
+        self.assertIs(results[0], results[1])
+        self.assertIs(cache.read_dexi(self.filename), results[0])
+
+    def test_lru(self):
+        cache = DexiModelCache(maxsize = 2)
+        names = [os.path.join(self.dir.name, f"Car{i}.dxi") for i in range(3)]
+        for name in names:
+            self.write(name, car_xml)
+        models = [cache.read_dexi(name) for name in names]
+        self.assertEqual(len(cache), 2)
+        self.assertIs(cache.read_dexi(names[2]), models[2])
+        self.assertIsNot(cache.read_dexi(names[0]), models[0])
+        self.assertIs(cache.read_dexi(names[2]), models[2])
+        cache.maxsize = 1
+        self.assertEqual(len(cache), 1)
+        self.assertIs(cache.read_dexi(names[2]), models[2])
+        with self.assertRaises(ValueError):
+            cache.maxsize = 0
+        cache.clear()
+        self.assertEqual(cache.info(), {"hits": 0, "misses": 0, "size": 0, "maxsize": 1})
+
+    def test_frozen(self):
+        model = read_dexi_cached(self.filename)
+        self.assertIs(read_dexi_cached(self.filename), model)
+        funct = model.attrib("CAR").funct
+        self.assertTrue(funct.read_only)
+        with self.assertRaises(ValueError):
+            funct.set_value([0, 0], 1)
+        with self.assertRaises(ValueError):
+            funct.values[(0, 0)] = 1
+        self.assertEqual(funct.value([0, 0]), 0)
+        self.assertEqual(model.evaluate(model.alternatives)[0]["CAR"], 3)
+        for obj in [model, model.root, model.attrib("PRICE").scale]:
+            self.assertTrue(obj.frozen)
+            with self.assertRaises(ValueError):
+                obj.description = "changed"
+        with self.assertRaises(ValueError):
+            model.enable_eval_cache()
+        with self.assertRaises(ValueError):
+            model.make_ids()
+
+        copied = deepcopy(model)
+        self.assertFalse(copied.frozen or copied.root.frozen)
+        copied.enable_eval_cache()
+        funct = copied.attrib("CAR").funct
+        self.assertFalse(funct.read_only)
+        funct.set_value([0, 0], 1)
+        self.assertEqual(funct.value([0, 0]), 1)
+        self.assertEqual(model.attrib("CAR").funct.value([0, 0]), 0)
+
+    def test_value_key(self):
+        self.assertEqual(value_key({1, 2}), value_key((2, 1, 1)))
+        self.assertNotEqual(value_key({1, 2}), value_key([1, 2]))
+        self.assertEqual(value_key({0: 0.5, 2: 1.0}), value_key({2: 1.0, 0: 0.5}))
+        self.assertEqual(value_key(None), None)
+        self.assertEqual(value_key("*"), "*")
+        self.assertEqual(len({value_key(True), value_key(1), value_key(1.0)}), 3)
+        self.assertNotEqual(value_key({1}), value_key({1.0}))
+        self.assertNotEqual(value_key([1, 0]), value_key([1.0, 0.0]))
+
+    def test_eval_cache_number_types(self):
+        def outcome(model, alt):
+            try:
+                return model.evaluate(alt)
+            except ValueError:
+                return ValueError
+
+        for subtrees in [False, True]:
+            model = read_dexi_from_string(car_xml)
+            alts = [{"name": str(value), **{att.id: value for att in model.basic}} for value in [1, True, 1.0]]
+            expected = [outcome(model, alt) for alt in alts]
+            model.enable_eval_cache(subtrees = subtrees)
+            for order in [alts, alts[::-1]]:
+                model.eval_cache.clear()
+                for alt in order:
+                    self.assertEqual(outcome(model, alt), expected[alts.index(alt)])
+
+    def test_eval_cache(self):
+        model = read_dexi_from_string(car_xml)
+        expected = model.evaluate()
+        cache = model.enable_eval_cache(maxsize = 2)
+        self.assertIs(model.eval_cache, cache)
+        alts = model.alternatives + deepcopy(model.alternatives)
+        self.assertEqual(model.evaluate(alts), expected + expected)
+        self.assertEqual(cache.info(), {"hits": 2, "misses": 2, "evictions": 0, "subtree_hits": 0,
+                                        "size": 2, "subtree_size": 0, "maxsize": 2})
+        result = model.evaluate(model.alternatives[0])
+        self.assertEqual(result, expected[0])
+        result["CAR"] = None
+        self.assertEqual(model.evaluate(model.alternatives[0]), expected[0])
+        self.assertEqual(model.evaluate(model.alternatives[0], method = "prob"), expected[0])
+        self.assertEqual(cache.evictions, 1)
+        self.assertEqual(cache.hits, 4)
+        self.assertEqual(len(pickle.loads(pickle.dumps(model)).alternatives), 2)
+        self.assertIsNone(pickle.loads(pickle.dumps(model)).eval_cache)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        with self.assertRaises(ValueError):
+            DexiEvalCache(maxsize = 0)
+
+    def test_eval_cache_subtrees(self):
+        model = read_dexi_from_string(car2_xml)
+        plain = read_dexi_from_string(car2_xml)
+        cache = model.enable_eval_cache(subtrees = True)
+        alt = deepcopy(model.alternatives[0])
+        self.assertEqual(model.evaluate(alt), plain.evaluate(alt))
+        self.assertEqual(cache.subtree_hits, 0)
+        changed = deepcopy(alt)
+        changed["SAFETY"] = {0, 1}
+        self.assertEqual(model.evaluate(changed), plain.evaluate(changed))
+        self.assertEqual(cache.info()["misses"], 2)
+        self.assertGreater(cache.subtree_hits, 0)
+        self.assertEqual(model.evaluate(model.alternatives, method = "fuzzy"), plain.evaluate(plain.alternatives, method = "fuzzy"))
+
+    def test_eval_cache_copies(self):
+        model = read_dexi_from_string(car_xml)
+        for subtrees in [False, True]:
+            model.enable_eval_cache(subtrees = subtrees)
+            for method in ["set", "prob"]:
+                alt = deepcopy(model.alternatives[0])
+                alt["SAFETY"] = {0, 1, 2}
+                alt["BUY.PRICE"] = {0, 1, 2}
+                expected = model.evaluate(alt, method = method)
+                first = model.evaluate(alt, method = method)
+                self.assertIsInstance(first["CAR"], (set, list))
+                first["CAR"].clear()
+                first["SAFETY"].clear()
+                self.assertEqual(model.evaluate(alt, method = method), expected)
+        self.assertEqual(copy_record({"a": {1}, "b": [0.5], "c": 1}), {"a": {1}, "b": [0.5], "c": 1})
+
+if __name__ == '__main__':
+    unittest.main()
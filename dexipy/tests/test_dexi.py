@@ -1,11 +1,13 @@
 import unittest
 import math
+import pickle
+from copy import deepcopy
 from dexipy.utils import BoundAssoc
 from dexipy.types import DexiOrder, DexiQuality
 from dexipy.dexi import DexiScale, DexiContinuousScale, DexiDiscreteScale
 from dexipy.dexi import DexiTabularFunction, DexiDiscretizeFunction
 from dexipy.dexi import DexiAttribute, DexiModel
-from dexipy.dexi import att_names, scale_value, bounded_scale_value, value_text
+from dexipy.dexi import att_names, scale_value, bounded_scale_value, value_text, range_text
 from dexipy.dexi import alternative
 from dexipy.dexi import read_dexi_from_string
 from dexipy.tests.testdata import car_xml, car2_xml, linked_xml, continuous_old_xml, continuous_new_xml, continuous_new_no_alt_xml, dozen_xml
@@ -213,6 +215,85 @@ class Test_test_dexi(unittest.TestCase):
         with self.assertRaises(KeyError):
             f.value([2, 2])
 
+    def test_DexiTabularFunction_codes(self):
+        f = DexiTabularFunction(dim = [2, 3], values = [1, 2, 3, 4, {5,6}])
+        self.assertEqual(f.strides, (3, 1))
+        self.assertEqual(f.codes.shape, (2, 3))
+        self.assertEqual(f.codes.tolist(), [[1, 2, 3], [4, -2, -1]])
+        self.assertEqual(f.offset([1, 2]), 5)
+        with self.assertRaises(KeyError):
+            f.offset([0])
+        with self.assertRaises(KeyError):
+            f.offset([0, -1])
+
+        # values write through to codes
+        f.values[(0, 0)] = {0, 1}
+        self.assertEqual(f.value([0, 0]), {0, 1})
+        self.assertEqual(f.values[(0, 0)], {0, 1})
+        f.set_value([1, 2], 1000)
+        self.assertEqual(f.value([1, 2]), 1000)
+        self.assertEqual(f.values[(1, 2)], 1000)
+        self.assertEqual(f.codes[1, 2], 1000)
+        with self.assertRaises(KeyError):
+            f.values[(2, 0)] = 1
+        with self.assertRaises(TypeError):
+            del f.values[(0, 0)]
+
+        # one-shot iterators of arguments
+        f.set_value(iter((0, 1)), 0)
+        self.assertEqual(f.values[(0, 1)], 0)
+        self.assertNotIn((), f.values)
+
+        # repeated writes do not accumulate side-table values
+        for i in range(1000):
+            f.set_value([1, 1], {0, i % 3})
+        self.assertLessEqual(len(f._extra), 12)
+        self.assertEqual(f.value([0, 0]), {0, 1})
+        self.assertEqual(f.value([1, 1]), {0, 999 % 3})
+        self.assertEqual(f.value([1, 2]), 1000)
+
+        # values assignment
+        f.values = {(0, 1): 2}
+        self.assertEqual(f.value_vector(), [None, 2, None, None, None, None])
+
+        # copies are independent
+        for g in [deepcopy(f), pickle.loads(pickle.dumps(f))]:
+            g.values[(0, 0)] = 1
+            self.assertEqual(g.codes[0, 0], 1)
+            self.assertEqual(g.value([0, 0]), 1)
+            self.assertEqual(f.value([0, 0]), None)
+            self.assertEqual(g.values[(0, 1)], 2)
+
+    def test_DexiTabularFunction_directions(self):
+        f = DexiTabularFunction(dim = [2, 3], values = [0, 2, 1, 0, 1, 2])
+        self.assertTrue(f.is_crisp())
+        self.assertIsNone(f.directions())
+        self.assertFalse(f.is_monotone())
+        f.set_value([0, 1], 1)
+        self.assertEqual(f.directions(), (+1, +1))
+        f.values = {(0, 0): 2, (0, 1): 1, (0, 2): 0, (1, 0): 2, (1, 1): 1, (1, 2): 0}
+        self.assertEqual(f.directions(), (+1, -1))
+        f.set_value([0, 0], {1, 2})
+        self.assertFalse(f.is_crisp())
+        self.assertIsNone(f.directions())
+
+    def test_DexiTabularFunction_rule_table(self):
+        f = DexiTabularFunction(dim = [2, 3], values = [0, {0, 1}, None, 2, {0, 2}, {1, 0}])
+        table = f.rule_table()
+        self.assertEqual(list(table.keys()), ["arg1", "arg2", "value"])
+        self.assertEqual(table["arg1"][0].tolist(), [0, 0, 0, 1, 1, 1])
+        self.assertEqual(table["arg2"][0].tolist(), [0, 1, 2, 0, 1, 2])
+        self.assertEqual(table["arg2"][1], ["0", "1", "2"])
+        self.assertEqual(table["value"][0].tolist(), [0, 3, -1, 2, 4, 3])
+        self.assertEqual(table["value"][1], ["0", "1", "2", "0:1", "0, 2"])
+
+        att = self.car_dxi.attrib("CAR")
+        frame = att.funct.rule_table(as_frame = True)
+        self.assertEqual(list(frame.columns), ["PRICE", "TECH.CHAR.", "CAR"])
+        self.assertEqual(len(frame), att.funct.nvals())
+        self.assertEqual(frame.iloc[6].tolist(), ["medium", "good", "good"])
+        self.assertEqual(frame["CAR"].cat.codes.tolist(), [att.funct.value(args) for args in att.funct.values])
+
     def test_DexiDiscretizeFunction_no_attribute(self):
 
         # auto values
@@ -420,6 +501,39 @@ class Test_test_dexi(unittest.TestCase):
         self.assertEqual(att_names(found), ["CAR", "PRICE", None, "PRICE", m.att_ids[-1], None])
         self.assertEqual(m.deindex_alternative({1: 1, 2: 2, "TC": 3}), {"CAR": 1, "PRICE": 2, "TC": 3})
 
+    def test_DexiModel_indexes(self):
+        m = deepcopy(self.car2_dxi)
+        self.assertEqual(m.children_indices("CAR"), [2, 5])
+        self.assertEqual(m.children_indices(m.root), [1, 11])
+        self.assertEqual(m.children_indices(m.attrib("BUY.PRICE")), [])
+        self.assertEqual(m.children_indices("PRICELESS"), [])
+        self.assertEqual(m.att_indices("PRICELESS"), [])
+        m.make_ids(max_len = 3)
+        self.assertEqual(m.att_index("PRI"), 2)
+        self.assertIsNone(m.att_index("PRICE"))
+        self.assertEqual(m.att_index("PRICE", use_id = False), 2)
+        self.assertEqual(m.children_indices("CAR"), [2, 5])
+        m.att_ids[2] = "COST"
+        m.propagate_ids()
+        self.assertTrue(m.attrib("COST") is m.attributes[2])
+        self.assertIsNone(m.att_index("PRI"))
+
+    def test_DexiModel_subtree(self):
+        m = self.car2_dxi
+        self.assertEqual(m.subtree_range(m.root), (0, m.natt))
+        self.assertEqual(m.subtree_range("CAR"), (1, 11))
+        self.assertEqual(m.subtree_range("PRICE"), (2, 5))
+        self.assertEqual(m.subtree_range("SAFETY"), (10, 11))
+        self.assertIsNone(m.subtree_range("PRICELESS"))
+        self.assertEqual(att_names(m.subtree("PRICE")), ["PRICE", "BUY.PRICE", "MAINT.PRICE"])
+        self.assertEqual(att_names(m.subtree("TECH.CHAR.", include_root = False)), ["COMFORT", "#PERS", "#DOORS", "LUGGAGE", "SAFETY"])
+        self.assertEqual(m.subtree("PRICELESS"), [])
+        for att in m.attributes:
+            self.assertEqual(m.subtree(att), m.collect_attributes(att))
+        copied = pickle.loads(pickle.dumps(m))
+        self.assertEqual(copied.subtree_range("PRICE_1"), (12, 15))
+        self.assertEqual(copied.att_index("PRICE_1"), 12)
+
     def test_DexiModel_Linked(self):
         m = self.linked_dxi
         self.assertEqual(m.name, "DEXi Model")
@@ -592,6 +706,16 @@ class Test_test_dexi(unittest.TestCase):
         self.assertEqual(value_text(1/3, scl, decimals = 3), "0.333")
         self.assertEqual(value_text(2/3, scl, decimals = 3), "0.667")
 
+    def test_range_text(self):
+        scl = DexiDiscreteScale(values = ["low", "med", "high"])
+        self.assertEqual(range_text(None, scl), None)
+        self.assertEqual(range_text(1, scl), "med")
+        self.assertEqual(range_text({1}, scl), "med")
+        self.assertEqual(range_text({0, 1, 2}, scl), "low:high")
+        self.assertEqual(range_text((2, 0), scl), "low, high")
+        self.assertEqual(range_text({0, "x"}, scl), value_text({0, "x"}, scl))
+        self.assertEqual(range_text([0.5, 0.5], scl), value_text([0.5, 0.5], scl))
+
     def test_value_text_discrete(self):
         scl = DexiDiscreteScale(values = ["low", "med", "high"])
         self.assertEqual(value_text(None, scl), None)
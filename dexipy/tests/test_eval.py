@@ -1,7 +1,9 @@
 import unittest
-from copy import deepcopy
-from dexipy.eval import evaluation_order, eval_parameters, EvalMethods
-from dexipy.eval import evaluate_as_set, evaluate_as_distribution, evaluate
+import pickle
+from copy import copy, deepcopy
+from dexipy.eval import evaluation_order, eval_parameters, EvalMethods, DexiEvalPlan
+from dexipy.eval import evaluate_as_set, evaluate_tabular_as_set, evaluate_as_distribution, evaluate, DexiResult
+import dexipy.utils as utl
 from dexipy.dexi import read_dexi_from_string
 from dexipy.tests.testdata import car_xml, car2_xml, linked_xml, continuous_old_xml, continuous_new_xml, continuous_new_no_alt_xml, dozen_xml
 
@@ -52,6 +54,65 @@ class Test_test_eval(unittest.TestCase):
         ord = evaluation_order(self.linked_dxi.root, prune = ["MAX"])
         self.assertEqual(ord, ['A_2', 'A', 'B_2', 'B', 'MIN', 'MAX', 'MID', 'LinkedBoundsTest', 'root'])
 
+    def test_DexiEvalPlan_Car(self):
+        model = self.car_dxi
+        plan = model.eval_plan()
+        self.assertIs(plan, model.eval_plan())
+        self.assertEqual(plan.order, evaluation_order(model.root))
+        self.assertEqual(plan.pruned_ids, [])
+        idx = plan.order.index("PRICE")
+        self.assertEqual(plan.kinds[idx], DexiEvalPlan.AGGREGATE)
+        self.assertEqual(plan.inp_ids[idx], ("BUY.PRICE", "MAINT.PRICE"))
+        self.assertEqual(plan.inp_pos[idx], (0, 1))
+        self.assertEqual(plan.sizes[idx], 3)
+        self.assertIs(plan.functs[idx], model.attrib("PRICE").funct)
+        self.assertEqual(plan.kinds[plan.order.index("CAR_MODEL")], DexiEvalPlan.SKIP)
+        self.assertEqual(len(plan.steps), len(plan.order) - 1)
+
+        pruned = model.eval_plan(prune = ["PRICE"])
+        self.assertIsNot(pruned, plan)
+        self.assertEqual(pruned.pruned_ids, ["BUY.PRICE", "MAINT.PRICE"])
+        self.assertEqual(pruned.kinds[pruned.order.index("PRICE")], DexiEvalPlan.BASIC)
+
+    def test_DexiEvalPlan_Linked(self):
+        model = self.linked_dxi
+        plan = model.eval_plan()
+        self.assertEqual(plan.kinds[plan.order.index("A_1")], DexiEvalPlan.LINK)
+        self.assertEqual(plan.links[plan.order.index("A_1")], "A_2")
+        self.assertEqual(sorted(plan.consumers["A_2"]), ["A", "A_1", "MID"])
+        self.assertEqual([step[0] for step in plan.affected_steps(["A_2"])], ["A_2", "A", "MIN", "A_1", "MAX", "MID", "LinkedBoundsTest"])
+
+    def test_reevaluate_Car(self):
+        model = self.car_dxi
+        plan = model.eval_plan()
+        self.assertEqual([step[0] for step in plan.affected_steps(["MAINT.PRICE"])], ["MAINT.PRICE", "PRICE", "CAR"])
+        self.assertIs(plan.affected_steps({"MAINT.PRICE"}), plan.affected_steps(["MAINT.PRICE"]))
+        for method in ["set", "prob"]:
+            evaluated = model.evaluate(model.alternatives[0], method = method)
+            for att in model.basic:
+                for val in range(att.scale.count()):
+                    changed = deepcopy(model.alternatives[0])
+                    changed[att.id] = val
+                    expected = model.evaluate(changed, method = method)
+                    self.assertEqual(model.reevaluate(evaluated, {att.id: val}, method = method), expected)
+            self.assertEqual(model.evaluate(model.alternatives[0], method = method), evaluated)
+        with self.assertRaises(ValueError):
+            model.reevaluate(evaluated, {"PRICE": 1})
+        pruned = model.evaluate(model.alternatives[1], prune = ["PRICE"])
+        self.assertEqual(model.reevaluate(pruned, {"PRICE": 0}, prune = ["PRICE"])["CAR"], 0)
+
+    def test_reevaluate_Linked(self):
+        model = self.linked_dxi
+        evaluated = model.evaluate(model.alternatives)
+        for idx, alt in enumerate(model.alternatives):
+            changed = deepcopy(alt)
+            for id in model.eval_plan().basic_ids:
+                for val in range(3):
+                    changed[id] = val
+                    result = model.reevaluate(evaluated[idx], {id: val}, in_place = True)
+                    self.assertIs(result, evaluated[idx])
+                    self.assertEqual(result, model.evaluate(changed))
+
     def test_EvalMethods_Linked(self):
         self.assertEqual(len(EvalMethods._eval_methods.keys()), 4)
         self.assertEqual(list(EvalMethods._eval_methods.keys()), ["set", "prob", "fuzzy", "fuzzynorm"])
@@ -93,6 +154,29 @@ class Test_test_eval(unittest.TestCase):
         eval = evaluate_as_set(fnc, inps)
         self.assertEqual(eval, {0, 1, 3})
 
+    def test_evaluate_tabular_as_set_Car(self):
+        def powerset(size):
+            return [{i for i in range(size) if mask & (1 << i)} for mask in range(1, 1 << size)]
+
+        for att in self.car_dxi.attributes:
+            fnc = att.funct
+            if fnc is None:
+                continue
+            self.assertTrue(fnc.is_monotone())
+            for inps in utl.cartesian_product(*(powerset(d) for d in fnc.dim)):
+                expected = set()
+                for args in utl.cartesian_product(*inps):
+                    expected.add(fnc.evaluate(args))
+                self.assertEqual(evaluate_tabular_as_set(fnc, inps), expected)
+
+        fnc = deepcopy(self.car_dxi.attrib("CAR").funct)
+        self.assertIsNone(evaluate_tabular_as_set(fnc, [{0}, {4}]))
+        fnc.values[(0,0)] = {0, 1}
+        self.assertIsNone(evaluate_tabular_as_set(fnc, [{0}, {0}]))
+        fnc.values[(0,0)] = 3
+        self.assertFalse(fnc.is_monotone())
+        self.assertEqual(evaluate_tabular_as_set(fnc, [{0, 1}, {0, 1}]), {0, 1, 3})
+
     def test_evaluate_as_distribution_prob_Car_CAR(self):
         att = self.car_dxi.attrib("CAR")
         fnc = att.funct
@@ -350,5 +434,39 @@ class Test_test_eval(unittest.TestCase):
         eval = evaluate(model, alts)
         self.assertTrue(unchanged(alts0, eval, model.non_root_ids))
 
+    def test_DexiResult(self):
+        base = {"name": "a", "X": 1, "Y": {0, 1}}
+        result = DexiResult(base)
+        result["X"] = 2
+        result["Z"] = 3
+        self.assertEqual(base, {"name": "a", "X": 1, "Y": {0, 1}})
+        self.assertEqual(result, {"name": "a", "X": 2, "Y": {0, 1}, "Z": 3})
+        self.assertEqual(list(result.keys()), ["name", "X", "Y", "Z"])
+        self.assertEqual(len(result), 4)
+        self.assertEqual(dict.__len__(result), 2)
+        self.assertIn("Y", result)
+        self.assertEqual(result.get("W", 0), 0)
+        self.assertEqual({**result}, dict(result))
+        duplicate = copy(result)
+        self.assertIsInstance(duplicate, DexiResult)
+        duplicate["X"] = 5
+        self.assertEqual(result["X"], 2)
+        self.assertEqual(result.pop("name"), "a")
+        self.assertEqual(list(result), ["X", "Y", "Z"])
+        self.assertEqual(base["name"], "a")
+        self.assertIs(type(deepcopy(result)), dict)
+        self.assertEqual(pickle.loads(pickle.dumps(duplicate)), duplicate)
+
+    def test_DexiResult_evaluation(self):
+        model = read_dexi_from_string(car_xml)
+        alts = deepcopy(model.alternatives)
+        results = evaluate(model, alts)
+        self.assertEqual(alts, model.alternatives)
+        self.assertTrue(all(isinstance(result, DexiResult) for result in results))
+        self.assertEqual(results, [evaluate(model, deepcopy(alt), in_place = True) for alt in alts])
+        self.assertNotIn("BUY.PRICE", dict.keys(results[0]))
+        self.assertIn("CAR", dict.keys(results[0]))
+        self.assertEqual(evaluate(model, results), results)
+
 if __name__ == '__main__':
     unittest.main()
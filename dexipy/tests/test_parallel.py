@@ -0,0 +1,39 @@
+import unittest
+from copy import deepcopy
+from dexipy.parallel import evaluate_parallel, chunks
+from dexipy.dexi import read_dexi_from_string
+from dexipy.tests.testdata import car_xml, linked_xml
+
+class Test_test_parallel(unittest.TestCase):
+
+    def test_chunks(self):
+        self.assertEqual(list(chunks(range(5), 2)), [[0, 1], [2, 3], [4]])
+        self.assertEqual(list(chunks([], 2)), [])
+
+    def test_evaluate_parallel_Car(self):
+        model = read_dexi_from_string(car_xml)
+        alts = [deepcopy(alt) for i in range(10) for alt in model.alternatives]
+        for i, alt in enumerate(alts):
+            alt["name"] = str(i)
+            alt["SAFETY"] = i % 3
+        original = deepcopy(alts)
+        for method in ["set", "prob"]:
+            expected = model.evaluate(alts, method = method)
+            self.assertEqual(list(evaluate_parallel(model, alts, method, chunk_size = 3, workers = 2)), expected)
+            self.assertEqual(list(model.evaluate_parallel(iter(alts), method, chunk_size = 4, workers = 1)), expected)
+        self.assertEqual(alts, original)
+        price = model.attrib("PRICE")
+        self.assertEqual(list(model.evaluate_parallel(root = price, workers = 2)), model.evaluate(root = price))
+        with self.assertRaises(ValueError):
+            evaluate_parallel(model, alts, chunk_size = 0)
+        with self.assertRaises(ValueError):
+            evaluate_parallel(model, alts, workers = 0)
+        with self.assertRaises(ValueError):
+            evaluate_parallel(model, alts, method = "xyz")
+
+    def test_evaluate_parallel_Linked(self):
+        model = read_dexi_from_string(linked_xml)
+        self.assertEqual(list(model.evaluate_parallel(workers = 2, chunk_size = 1)), model.evaluate())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,12 @@
 import unittest
+import io
+import os
+import tempfile
+import xml.etree.ElementTree as ET
+from unittest import mock
 from dexipy.parse import dexi_bool, dexi_vector, dexi_value, dexi_option_value
+from dexipy.parse import parse_dexi, iterparse_dexi, iter_dexi_alternatives
+from dexipy.tests.testdata import car_xml, car2_xml, linked_xml, continuous_old_xml, continuous_new_xml, continuous_new_no_alt_xml, dozen_xml
 
 
 class test_test_parse(unittest.TestCase):
@@ -80,5 +87,44 @@ class test_test_parse(unittest.TestCase):
         self.assertEqual(dexi_option_value("12"), {1, 2})
         self.assertEqual(dexi_option_value("13334"), {1, 3, 4})
 
+    def test_iterparse_dexi(self):
+        for xml in [car_xml, car2_xml, linked_xml, continuous_old_xml, continuous_new_xml, continuous_new_no_alt_xml, dozen_xml]:
+            expected = parse_dexi(ET.fromstring(xml))
+            model = iterparse_dexi(io.StringIO(xml))
+            self.assertEqual(str(model), str(expected))
+            self.assertEqual(model.linking, expected.linking)
+            self.assertEqual(model.alternatives, expected.alternatives)
+            structure = iterparse_dexi(io.StringIO(xml), alternatives = False)
+            self.assertEqual(str(structure), str(expected))
+            self.assertEqual(structure.alternatives, [])
+        with self.assertRaises(ValueError):
+            iterparse_dexi(io.StringIO("<NOTDEXI></NOTDEXI>"))
+
+    def test_iter_dexi_alternatives(self):
+        with tempfile.TemporaryDirectory() as dir:
+            filename = os.path.join(dir, "model.dxi")
+            for xml in [car_xml, linked_xml, continuous_new_xml, continuous_new_no_alt_xml]:
+                with open(filename, "w", encoding = "utf-8") as file:
+                    file.write(xml)
+                expected = parse_dexi(ET.fromstring(xml))
+                for chunk_size in [1, 2, 1000, None]:
+                    self.assertEqual(list(iter_dexi_alternatives(filename, chunk_size = chunk_size)), expected.alternatives)
+                structure = iterparse_dexi(filename, alternatives = False)
+                for chunk_size, passes in [(None, 1), (1000, 1), (1, max(1, len(expected.alternatives)))]:
+                    with mock.patch.object(ET, "iterparse", wraps = ET.iterparse) as iterparse:
+                        alts = iter_dexi_alternatives(filename, structure, chunk_size)
+                        if expected.alternatives:
+                            # the first alternative is available after a single pass
+                            self.assertEqual(next(alts), expected.alternatives[0])
+                            self.assertEqual(iterparse.call_count, 1)
+                            self.assertEqual(list(alts), expected.alternatives[1:])
+                        else:
+                            self.assertEqual(list(alts), [])
+                        self.assertEqual(iterparse.call_count, passes)
+            with self.assertRaises(ValueError):
+                list(iter_dexi_alternatives(filename, parse_dexi(ET.fromstring(car_xml))))
+            with self.assertRaises(ValueError):
+                list(iter_dexi_alternatives(filename, chunk_size = 0))
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+from dexipy.registry import DexiModelRegistry, function_digest, model_signature
+from dexipy.dexi import read_dexi_from_string
+from dexipy.tests.testdata import car_xml, car2_xml
+
+class Test_test_registry(unittest.TestCase):
+
+    def test_function_digest(self):
+        car1 = read_dexi_from_string(car_xml)
+        car2 = read_dexi_from_string(car_xml)
+        self.assertEqual(function_digest(car1.attrib("CAR").funct), function_digest(car2.attrib("CAR").funct))
+        self.assertNotEqual(function_digest(car1.attrib("CAR").funct), function_digest(car1.attrib("PRICE").funct))
+        car2.attrib("CAR").funct.values[(0, 0)] = {0, 1}
+        self.assertNotEqual(function_digest(car1.attrib("CAR").funct), function_digest(car2.attrib("CAR").funct))
+        self.assertIsNone(function_digest(None))
+        self.assertNotEqual(model_signature(car1), model_signature(car2))
+
+    def test_registry_shared(self):
+        registry = DexiModelRegistry()
+        car1 = registry.add(2022, read_dexi_from_string(car_xml))
+        other = read_dexi_from_string(car_xml)
+        other.alternatives = other.alternatives[1:]
+        car2 = registry.add(2023, other)
+        self.assertEqual(registry.keys(), [2022, 2023])
+        self.assertIs(registry[2023], car2)
+        self.assertTrue(registry.shares_structure(2022, 2023))
+        self.assertIsNot(car1, car2)
+        self.assertIs(car1.attrib("CAR"), car2.attrib("CAR"))
+        # shared attributes keep referring to the model that registered them first
+        self.assertIs(car2.attrib("PRICE").model(), car1)
+        self.assertEqual(len(car1.alternatives), 2)
+        self.assertEqual(len(car2.alternatives), 1)
+        self.assertEqual(car2.evaluate(), car1.evaluate(car1.alternatives[1:]))
+        self.assertTrue(car1.attrib("CAR").funct.read_only)
+        with self.assertRaises(ValueError):
+            registry.add(2022, read_dexi_from_string(car_xml))
+
+    def test_registry_eval_cache(self):
+        registry = DexiModelRegistry(eval_cache_size = 16)
+        car1 = registry.add(2022, read_dexi_from_string(car_xml))
+        car2 = registry.add(2023, read_dexi_from_string(car_xml))
+        self.assertTrue(car1.frozen and car2.frozen)
+        self.assertIs(car1.eval_cache, car2.eval_cache)
+        car1.evaluate()
+        car2.evaluate()
+        self.assertEqual(car2.eval_cache.info()["hits"], 2)
+        with self.assertRaises(ValueError):
+            car2.enable_eval_cache()
+        car3 = registry.add(2024, car1)
+        self.assertIsNot(car3, car1)
+        self.assertTrue(car3.frozen)
+
+    def test_registry_partially_shared(self):
+        registry = DexiModelRegistry()
+        car1 = registry.add("a", read_dexi_from_string(car_xml))
+        changed = read_dexi_from_string(car_xml)
+        changed.attrib("CAR").funct.values[(0, 0)] = 1
+        car2 = registry.add("b", changed)
+        self.assertIs(car2, changed)
+        self.assertFalse(registry.shares_structure("a", "b"))
+        self.assertIsNot(car1.attrib("CAR").funct, car2.attrib("CAR").funct)
+        self.assertIs(car1.attrib("PRICE").funct, car2.attrib("PRICE").funct)
+        self.assertIs(car1.attrib("PRICE").scale, car2.attrib("PRICE").scale)
+        self.assertEqual(car2.attrib("CAR").funct.value((0, 0)), 1)
+        self.assertEqual(car2.evaluate(), read_dexi_from_string(car_xml).evaluate())
+
+        car3 = registry.add("c", read_dexi_from_string(car2_xml))
+        self.assertIs(car3.attrib("BUY.PRICE").scale, car1.attrib("BUY.PRICE").scale)
+        self.assertIn("c", registry)
+        self.assertEqual(len(registry), 3)
+
+    def test_registry_different_scales(self):
+        registry = DexiModelRegistry()
+        car1 = registry.add("a", read_dexi_from_string(car_xml))
+        renamed = car_xml.replace("<NAME>high</NAME>", "<NAME>expensive</NAME>", 1)
+        car2 = registry.add("b", read_dexi_from_string(renamed))
+        self.assertEqual(car2.attrib("PRICE").scale.values[0], "expensive")
+        self.assertEqual(car1.attrib("PRICE").funct.value_vector(), car2.attrib("PRICE").funct.value_vector())
+        self.assertIsNot(car1.attrib("PRICE").funct, car2.attrib("PRICE").funct)
+        self.assertIsNot(car1.attrib("CAR").funct, car2.attrib("CAR").funct)
+        self.assertIs(car1.attrib("TECH.CHAR.").funct, car2.attrib("TECH.CHAR.").funct)
+        self.assertEqual(car2.attrib("PRICE").funct.rule_table()["PRICE"][1][0], "expensive")
+        for model in [car1, car2]:
+            for att in model.attributes:
+                if att.funct is not None:
+                    self.assertIs(att.funct.attribute.scale, att.scale)
+                    self.assertEqual([inp.scale for inp in att.funct.attribute.inputs], [inp.scale for inp in att.inputs])
+
+if __name__ == '__main__':
+    unittest.main()
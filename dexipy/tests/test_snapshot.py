@@ -0,0 +1,96 @@
+import unittest
+import os
+import tempfile
+from unittest import mock
+import dexipy.snapshot as snapshot
+from dexipy.dexi import read_dexi_from_string
+from dexipy.tests.testdata import car_xml, linked_xml
+
+class Test_test_snapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.dir.name, "Car.dxi")
+        self.write(car_xml)
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def write(self, xml):
+        with open(self.filename, "w", encoding = "utf-8") as file:
+            file.write(xml)
+
+    def test_dumps_loads(self):
+        for xml in [car_xml, linked_xml]:
+            model = read_dexi_from_string(xml)
+            model.eval_plan()
+            data = snapshot.dumps(model)
+            self.assertEqual(data[:8], snapshot.MAGIC)
+            loaded = snapshot.loads(data)
+            self.assertEqual(str(loaded), str(model))
+            self.assertEqual(loaded.alternatives, model.alternatives)
+            self.assertEqual(loaded.evaluate(loaded.alternatives), model.evaluate(model.alternatives))
+            for att, loaded_att in zip(model.attributes, loaded.attributes):
+                if att.link is not None:
+                    self.assertIs(loaded_att.link, loaded.attrib(att.link.id))
+                if att.funct is not None:
+                    self.assertEqual(loaded_att.funct.value_vector(), att.funct.value_vector())
+                    self.assertIs(loaded_att.funct.attribute, loaded_att)
+
+    def test_invalid(self):
+        data = snapshot.dumps(read_dexi_from_string(car_xml))
+        with self.assertRaises(ValueError):
+            snapshot.loads(b"DEXi")
+        with self.assertRaises(ValueError):
+            snapshot.loads(b"X" + data[1:])
+        with self.assertRaises(ValueError):
+            snapshot.loads(data[:8] + b"\xff\xff" + data[10:])
+
+    def test_read_dexi(self):
+        dxs = snapshot.snapshot_name(self.filename)
+        self.assertEqual(dxs, os.path.join(self.dir.name, "Car.dxs"))
+        model = snapshot.read_dexi(self.filename)
+        self.assertFalse(os.path.exists(dxs))
+        model = snapshot.read_dexi(self.filename, write = True)
+        self.assertTrue(os.path.exists(dxs))
+
+        # up-to-date snapshot is preferred
+        marked = snapshot.load_snapshot(dxs)
+        marked.name = "FROM_SNAPSHOT"
+        snapshot.save_snapshot(marked, dxs, source = self.filename)
+        self.assertEqual(snapshot.read_dexi(self.filename).name, "FROM_SNAPSHOT")
+
+        # outdated or broken snapshots are ignored
+        self.write(car_xml.replace("CAR_MODEL", "CHANGED_MODEL"))
+        self.assertEqual(snapshot.read_dexi(self.filename).name, "CHANGED_MODEL")
+        with open(dxs, "wb") as file:
+            file.write(b"broken")
+        self.assertEqual(snapshot.read_dexi(self.filename, write = True).name, "CHANGED_MODEL")
+        self.assertEqual(snapshot.load_snapshot(dxs).name, "CHANGED_MODEL")
+
+    def test_stale_snapshot(self):
+        dxs = snapshot.snapshot_name(self.filename)
+        digest = snapshot.source_digest(self.filename)
+        model = read_dexi_from_string(car_xml)
+        model.name = "FROM_SNAPSHOT"
+
+        # snapshots of other class layouts are rejected and ignored
+        with mock.patch.object(snapshot, "layout_digest", lambda: bytes(32)):
+            stale = snapshot.dumps(model, digest)
+        with self.assertRaises(ValueError):
+            snapshot.loads(stale)
+        with open(dxs, "wb") as file:
+            file.write(stale)
+        self.assertEqual(snapshot.read_dexi(self.filename).name, "CAR_MODEL")
+
+        # so are snapshots whose data cannot be unpickled for any reason
+        header = snapshot.dumps(model, digest)[:snapshot._HEADER.size]
+        for data in [b"\x80\x04cmissing_module\nMissing\n)\x81.", b"\x80\x04cdexipy.dexi\nMissing\n)\x81.", b"\x80\x04cbuiltins\nlen\n)R."]:
+            with open(dxs, "wb") as file:
+                file.write(header + data)
+            self.assertEqual(snapshot.read_dexi(self.filename).name, "CAR_MODEL")
+        snapshot.save_snapshot(model, dxs, source = self.filename)
+        self.assertEqual(snapshot.read_dexi(self.filename).name, "FROM_SNAPSHOT")
+
+if __name__ == '__main__':
+    unittest.main()
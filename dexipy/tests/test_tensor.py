@@ -0,0 +1,89 @@
+import unittest
+import random
+from copy import deepcopy
+import numpy as np
+import dexipy.utils as utl
+import dexipy.tensor as tensor
+from dexipy.eval import eval_parameters, evaluate_as_distribution, evaluate
+from dexipy.dexi import read_dexi_from_string
+from dexipy.tests.testdata import car_xml, linked_xml
+
+def python_parameters(method):
+    # equivalent to default parameters, but not recognized by tensor.engine()
+    if method == "prob":
+        return eval_parameters(method, and_op = lambda x: utl.prod(x), or_op = lambda x: sum(x))
+    return eval_parameters(method, and_op = lambda x: min(x), or_op = lambda x: max(x))
+
+class Test_test_tensor(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.car_dxi = read_dexi_from_string(car_xml)
+        cls.linked_dxi = read_dexi_from_string(linked_xml)
+        return super().setUpClass()
+
+    def test_engine(self):
+        self.assertEqual(tensor.engine(utl.prod, sum), tensor.PROB)
+        self.assertEqual(tensor.engine(min, max), tensor.FUZZY)
+        for method in ["prob", "fuzzy", "fuzzynorm"]:
+            param = eval_parameters(method)
+            self.assertIsNotNone(tensor.engine(param.and_op, param.or_op))
+            param = python_parameters(method)
+            self.assertIsNone(tensor.engine(param.and_op, param.or_op))
+
+    def test_rule_tensor_Car(self):
+        fnc = self.car_dxi.attrib("CAR").funct
+        values, lengths = tensor.rule_tensor(fnc, utl.norm_sum)
+        self.assertEqual(values.shape, (3, 4, 4))
+        self.assertEqual(values[1, 2].tolist(), [0.0, 0.0, 1.0, 0.0])
+        self.assertEqual(lengths[1, 2], 3)
+        self.assertIs(tensor.rule_tensor(fnc, utl.norm_sum)[0], values)
+
+        fnc = deepcopy(fnc)
+        fnc.values[(0, 0)] = {0, 1}
+        fnc.values[(0, 1)] = None
+        values, lengths = tensor.rule_tensor(fnc, utl.norm_sum)
+        self.assertEqual(values[0, 0].tolist(), [0.5, 0.5, 0.0, 0.0])
+        self.assertEqual(lengths[0, 1], 0)
+
+    def test_membership_tensor(self):
+        inputs = [np.array([[0.5, 0.5], [1.0, 0.0]]), np.array([[0.2, 0.3, 0.5], [0.0, 0.4, 0.6]])]
+        prob = tensor.membership_tensor(inputs, tensor.PROB)
+        self.assertEqual(prob.shape, (2, 2, 3))
+        self.assertEqual(prob[0].tolist(), [[0.1, 0.15, 0.25], [0.1, 0.15, 0.25]])
+        fuzzy = tensor.membership_tensor(inputs, tensor.FUZZY)
+        self.assertEqual(fuzzy[1].tolist(), [[0.0, 0.4, 0.6], [0.0, 0.0, 0.0]])
+
+    def test_evaluate_distributions_Car(self):
+        fnc = deepcopy(self.car_dxi.attrib("CAR").funct)
+        fnc.values[(0, 0)] = {0, 1}
+        fnc.values[(2, 0)] = None
+        random.seed(0)
+        inputs = [[[random.choice([0.0, random.random()]) for _ in range(d)] for d in fnc.dim] for _ in range(200)]
+        inputs += [[[1.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 1.0]], [[0.0, 1.0], [0.0, 0.0, 0.0, 0.0, 0.0]], [[0.0, 0.0, 1.0], [1.0]]]
+        for method in ["prob", "fuzzy", "fuzzynorm"]:
+            param = eval_parameters(method)
+            expected = [evaluate_as_distribution(fnc, inp, python_parameters(method)) for inp in inputs]
+            matrices = [tensor.distribution_matrix([inp[i] for inp in inputs]) for i in range(2)]
+            engine = tensor.engine(param.and_op, param.or_op)
+            self.assertEqual(tensor.evaluate_distributions(fnc, matrices, engine, param.norm, 4), expected)
+            self.assertEqual([evaluate_as_distribution(fnc, inp, param) for inp in inputs], expected)
+            for chunk_size in [1, 7, 1000]:
+                self.assertEqual(tensor.evaluate_distributions(fnc, matrices, engine, param.norm, 4, chunk_size), expected)
+
+    def test_chunk_length(self):
+        self.assertEqual(tensor.chunk_length(1000, 5, tensor.PROB), tensor.CHUNK_ELEMENTS // 1000)
+        self.assertEqual(tensor.chunk_length(1000, 5, tensor.FUZZY), tensor.CHUNK_ELEMENTS // 5000)
+        self.assertEqual(tensor.chunk_length(tensor.CHUNK_ELEMENTS * 2, 5, tensor.PROB), 1)
+
+    def test_evaluate_batch(self):
+        for model in [self.car_dxi, self.linked_dxi]:
+            alts = deepcopy(model.alternatives)
+            alts[0][model.basic[0].id] = [0.1, 0.0, 0.9]
+            alts[1][model.basic[-1].id] = "*"
+            for method in ["prob", "fuzzy", "fuzzynorm"]:
+                expected = evaluate(model, alts, eval_param = python_parameters(method))
+                self.assertEqual(evaluate(model, alts, method = method), expected)
+
+if __name__ == '__main__':
+    unittest.main()
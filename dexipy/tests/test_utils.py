@@ -3,7 +3,7 @@ from dexipy.types import BoundAssoc
 from dexipy.utils import rule_values, values_to_str
 from dexipy.utils import set_to_distr, distr_to_set
 from dexipy.utils import norm_sum, norm_max
-from dexipy.utils import cartesian_product, unique_names
+from dexipy.utils import cartesian_product, unique_names, unique_namer
 from dexipy.utils import name_to_id, names_to_ids
 from dexipy.utils import is_in_range
 from dexipy.utils import pad_list
@@ -95,6 +95,12 @@ class test_test_utils(unittest.TestCase):
         self.assertEqual(unique_names(names, start = 1), ['name', 'state', 'name_2', 'city', 'name_3', 'zip', 'zip_2', 'name_2_2'])
         self.assertEqual(unique_names(names, reserved = ["name", "zip"]), ['name_1', 'state', 'name_2', 'city', 'name_3', 'zip_1', 'zip_2', 'name_2_1'])
 
+    def test_unique_namer(self):
+        names = ["name", "state", "name", "city", "name", "zip", "zip", "name_2"]
+        make_unique = unique_namer(reserved = ["name", "zip"])
+        self.assertEqual([make_unique(name) for name in names], unique_names(names, reserved = ["name", "zip"]))
+        self.assertEqual(make_unique("zip"), "zip_3")
+
     def test_name_to_id(self):
         self.assertEqual(name_to_id("abc123"), "abc123")
         self.assertEqual(name_to_id("a b c 12 3"), "a_b_c_12_3")
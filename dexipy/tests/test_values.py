@@ -3,6 +3,9 @@ import unittest
 from dexipy.values import DexiValues, DexiValueType
 from dexipy.values import dexi_value_type, check_dexi_value, check_dexi_scale_value
 from dexipy.values import dexi_value_as_set, dexi_value_as_distr, reduce_dexi_value, reduce_set
+from dexipy.values import pack_dexi_values, DexiPackedValues, PACKED_UNDEFINED
+from dexipy.dexi import DexiDiscreteScale, DexiContinuousScale
+import numpy as np
 
 class test_test_values(unittest.TestCase):
 
@@ -154,5 +157,35 @@ class test_test_values(unittest.TestCase):
         self.assertEqual(v.value_type(), DexiValueType.int)
         self.assertEqual(v.reduce(), 1)
 
+    def test_pack_dexi_values(self):
+        scl = DexiDiscreteScale(["low", "med", "high"])
+        values = [1, {0, 2}, "*", None, [0.0, 0.5, 0.5], "high", {"low"}, (1, 1), {0: 0.0, 1: 1.0}, 5, "undef", {3}]
+        packed = pack_dexi_values(values, scl)
+        self.assertEqual(len(packed), len(values))
+        self.assertEqual(packed.size, 3)
+        self.assertEqual(packed.codes.tolist(), [1, -1, -1, -1, -1, 2, 0, 1, 1, -1, -1, -1])
+        self.assertEqual(packed.masks.tolist(), [2, 5, 7, 0, 6, 4, 1, 2, 2, 0, 0, 0])
+        self.assertEqual(packed.values(), [1, {0, 2}, {0, 1, 2}, None, {1, 2}, 2, 0, 1, 1, None, None, None])
+        self.assertEqual(packed.crisp().tolist(), [val != PACKED_UNDEFINED for val in packed.codes])
+        self.assertEqual(packed.member(2).tolist(), [False, True, True, False, True, True, False, False, False, False, False, False])
+        self.assertEqual(packed.counts().tolist(), [1, 2, 3, 0, 2, 1, 1, 1, 1, 0, 0, 0])
+        self.assertEqual(packed.defined().tolist(), [mask != 0 for mask in packed.masks])
+        masks = np.array([0, 1, 2 ** 63, 2 ** 64 - 1, 0b1011 << 40], dtype = np.uint64)
+        wide = DexiPackedValues.from_masks(masks, 64)
+        self.assertEqual(wide.counts().tolist(), [0, 1, 1, 64, 3])
+        self.assertEqual(wide.codes.tolist(), [-1, 0, 63, -1, -1])
+        self.assertEqual(wide.values()[3], set(range(64)))
+        self.assertEqual(pack_dexi_values([], scl).counts().tolist(), [])
+
+        packed = pack_dexi_values(np.array([0, 2, 7, -1]), scl)
+        self.assertEqual(packed.codes.tolist(), [0, 2, -1, -1])
+        self.assertEqual(packed.masks.tolist(), [1, 4, 0, 0])
+        self.assertEqual(packed.values(), [0, 2, None, None])
+
+        with self.assertRaises(ValueError):
+            pack_dexi_values([1.0], DexiContinuousScale())
+        with self.assertRaises(ValueError):
+            pack_dexi_values([1], DexiDiscreteScale([str(i) for i in range(65)]))
+
 if __name__ == '__main__':
     unittest.main()
@@ -2,7 +2,7 @@
 Module ``dexipy.utils`` contains a collection of helper functions used in DEXiPy.
 """
 
-from typing import Any, Union, Tuple, Set, List, Dict, Optional, Iterable
+from typing import Any, Callable, Union, Tuple, Set, List, Dict, Optional, Iterable
 from sys import float_info
 import itertools
 from dexipy.types import BoundAssoc
@@ -371,24 +371,45 @@ def unique_names(names: List[str], reserved: List[str] = [], start: int = 0) ->
        >>> unique_names(["name", "state", "name", "city", "name", "zip", "zip"], reserved = ["name"])
        ['name_1', 'state', 'name_2', 'city', 'name_3', 'zip', 'zip_1']
     """
-    state = {}
-    names = reserved + names
-    result = []
-    for i, n in enumerate(names):
-        if n not in result:
-            result.append(n)
-            state[n] = start
-        else:
-            if not n in state:
-                state[n] = start
-            while True:
-                state[n] += 1
-                newname = n + "_" + str(state[n])
-                if newname not in result:
-                    result.append(newname)
-                    break
-    del result[:len(reserved)]
-    return result
+    make_unique = unique_namer(reserved, start)
+    return [make_unique(name) for name in names]
+
+def unique_namer(reserved: List[str] = [], start: int = 0) -> Callable[[str], str]:
+    """Creates a function that converts strings to unique ID strings, one at a time.
+
+    Converting a sequence of strings one by one gives the same result as
+    :py:func:`dexipy.utils.unique_names` does for the whole list, which makes it possible
+    to process sequences that are not held in memory at once.
+
+    Args:
+        reserved (List[str], optional): Reserved strings that should not be used as IDs.
+            Defaults to [].
+        start (int, optional): Starting index of ``_<int>`` suffixes. Defaults to 0.
+
+    Returns:
+        Callable[[str], str]: A function that returns a unique ID for its string argument,
+        considering all strings previously converted by the same function.
+    """
+    state: Dict[str, int] = {}
+    used: Set[str] = set()
+
+    def make_unique(name: str) -> str:
+        if name not in used:
+            used.add(name)
+            state[name] = start
+            return name
+        if not name in state:
+            state[name] = start
+        while True:
+            state[name] += 1
+            newname = name + "_" + str(state[name])
+            if newname not in used:
+                used.add(newname)
+                return newname
+
+    for name in reserved:
+        make_unique(name)
+    return make_unique
 
 def name_to_id(name: str, replace: str = "_") -> str:
     """Replaces all non-alphanumeric characters in ``name`` with ``replace``.
@@ -3,7 +3,9 @@ Module ``dexipy.values`` contains helper classes and functions for handling DEXi
 """
 
 from __future__ import annotations
-from typing import Any, Set, List, Optional
+from typing import Any, Set, List, Optional, Sequence
+from sys import float_info
+import numpy as np
 from dexipy.types import DexiValue, DexiValueType
 import dexipy.utils as utl
 import dexipy.dexi as dxi
@@ -253,6 +255,194 @@ def reduce_dexi_value(value: DexiValue) -> DexiValue:
             return reduce_dexi_value(as_distr)
     return value
 
+PACKED_UNDEFINED = -1
+"""Code of values that are not single value indices in :py:class:`dexipy.values.DexiPackedValues`."""
+
+PACKED_LIMIT = 64
+"""Maximum scale size supported by :py:class:`dexipy.values.DexiPackedValues`."""
+
+class DexiPackedValues:
+    """Packed representation of a column of DEXi values, interpreted on a discrete scale.
+
+    Each value is represented in two parallel forms:
+
+    * ``codes``: an integer array of value indices; values that are not single value indices,
+      including sets and distributions with more than one element, are represented by
+      :py:data:`dexipy.values.PACKED_UNDEFINED`; crisp batch evaluation
+      (:py:func:`dexipy.batch.evaluate_crisp`) uses this form,
+    * ``masks``: an unsigned 64-bit array of value sets, where bit ``i`` is set when value ``i``
+      is a member of the set (see :py:func:`dexipy.values.dexi_value_as_set`); undefined values
+      are represented by 0; set-based batch evaluation (:py:func:`dexipy.batch.evaluate_sets`) uses this form.
+
+    Distributions are thus packed as the sets of their non-zero members; their membership values
+    are not retained.
+
+    Objects are created by :py:func:`dexipy.values.pack_dexi_values` or
+    :py:meth:`dexipy.values.DexiPackedValues.from_masks`.
+
+    Args:
+        codes (np.ndarray): Value indices.
+        masks (np.ndarray): Value set bitmasks.
+        size (int): Scale size.
+    """
+
+    def __init__(self, codes: np.ndarray, masks: np.ndarray, size: int):
+        self.codes = codes
+        self.masks = masks
+        self.size = size
+
+    @classmethod
+    def from_masks(cls, masks: np.ndarray, size: int) -> DexiPackedValues:
+        """Creates packed values from value set bitmasks, determining their codes.
+
+        Args:
+            masks (np.ndarray): Value set bitmasks.
+            size (int): Scale size.
+
+        Returns:
+            DexiPackedValues: Packed values.
+        """
+        masks = np.ascontiguousarray(masks, dtype = np.uint64)
+        single = (masks != 0) & (masks & (masks - np.uint64(1)) == 0)
+        codes = np.full(len(masks), PACKED_UNDEFINED, dtype = np.int64)
+        codes[single] = np.log2(masks[single].astype(float)).astype(np.int64)
+        return cls(codes, masks, size)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def defined(self) -> np.ndarray:
+        """Returns a boolean array indicating defined values."""
+        return self.masks != 0
+
+    def crisp(self) -> np.ndarray:
+        """Returns a boolean array indicating single value indices."""
+        return self.codes != PACKED_UNDEFINED
+
+    def member(self, value: int) -> np.ndarray:
+        """Returns a boolean array indicating values whose sets contain ``value``."""
+        return (self.masks >> np.uint64(value)) & np.uint64(1) != 0
+
+    def counts(self) -> np.ndarray:
+        """Returns the number of elements of each value set."""
+        octets = np.ascontiguousarray(self.masks, dtype = np.uint64).view(np.uint8).reshape(-1, 8)
+        return np.unpackbits(octets, axis = 1).sum(axis = 1, dtype = np.int64)
+
+    def values(self) -> List[DexiValue]:
+        """Converts packed values back to DEXi values.
+
+        Returns:
+            List[DexiValue]: Value indices, sets of value indices, and None for undefined values.
+        """
+        result: List[DexiValue] = []
+        for code, mask in zip(self.codes.tolist(), self.masks.tolist()):
+            if code != PACKED_UNDEFINED:
+                result.append(code)
+            elif mask == 0:
+                result.append(None)
+            else:
+                result.append({val for val in range(mask.bit_length()) if mask >> val & 1})
+        return result
+
+def pack_dexi_values(values: Sequence[Any], scale: Any) -> DexiPackedValues:
+    """Packs a column of DEXi values, interpreted on a discrete ``scale``.
+
+    Values are interpreted as in :py:func:`dexipy.dexi.scale_value`: ``"*"`` denotes the full range
+    of the scale, ``""`` and ``"undef..."`` strings denote undefined values and value names are
+    replaced by value indices. Values containing indices outside the scale range and other
+    uninterpretable values are considered undefined. One-dimensional integer arrays are packed
+    without inspecting individual values.
+
+    Args:
+        values (Sequence[Any]): A sequence of DEXi values.
+        scale (Any): A discrete :py:class:`dexipy.dexi.DexiScale`.
+
+    Raises:
+        ValueError: When ``scale`` is not discrete or has more than :py:data:`dexipy.values.PACKED_LIMIT` values.
+
+    Returns:
+        DexiPackedValues: Packed values.
+
+    Examples:
+       >>> scl = DexiDiscreteScale(["low", "med", "high"])
+       >>> packed = pack_dexi_values([1, {0, 2}, "*", None, [0.0, 0.5, 0.5]], scl)
+       >>> packed.codes
+       array([ 1, -1, -1, -1, -1])
+       >>> packed.masks
+       array([2, 5, 7, 0, 6], dtype=uint64)
+    """
+    scale = dxi.scale_of(scale)
+    if scale is None or not scale.is_discrete():
+        raise ValueError("Packed values require a discrete scale")
+    size = scale.count()
+    if size > PACKED_LIMIT:
+        raise ValueError(f"Packed values support scales of at most {PACKED_LIMIT} values")
+
+    if isinstance(values, np.ndarray) and values.ndim == 1 and values.dtype.kind in "iu":
+        codes = values.astype(np.int64)
+        codes = np.where((codes >= 0) & (codes < size), codes, PACKED_UNDEFINED)
+        valid = codes != PACKED_UNDEFINED
+        masks = np.where(valid, np.left_shift(np.uint64(1), np.maximum(codes, 0).astype(np.uint64)), np.uint64(0))
+        return DexiPackedValues(codes, masks.astype(np.uint64), size)
+
+    count = len(values)
+    codes = np.full(count, PACKED_UNDEFINED, dtype = np.int64)
+    masks = np.zeros(count, dtype = np.uint64)
+    for i, value in enumerate(values):
+        val_type = type(value)
+        if val_type is str:
+            if value == "*":
+                value = set(range(size))
+            else:
+                value = scale.value_index_or_none(value)
+            val_type = type(value)
+        elif isinstance(value, (int, np.integer)) and val_type is not bool:
+            value = int(value)
+            val_type = int
+        if val_type is int:
+            if 0 <= value < size:
+                codes[i] = value
+                masks[i] = 1 << value
+            continue
+        if val_type in (set, tuple):
+            elements = [val if type(val) is int else scale.value_index_or_none(val) if type(val) is str else None for val in value]
+            mask = 0
+            for val in elements:
+                if val is None or not 0 <= val < size:
+                    mask = 0
+                    break
+                mask |= 1 << val
+            if mask != 0:
+                masks[i] = mask
+                if mask & (mask - 1) == 0:
+                    codes[i] = mask.bit_length() - 1
+            continue
+        if val_type is dict:
+            if not all(type(key) is int or type(key) is str for key in value):
+                continue
+            value = {key if type(key) is int else scale.value_index_or_none(key): val for key, val in value.items()}
+            if None in value or len(value) == 0 or min(value) < 0:
+                continue
+            value = utl.dict_to_list(value)
+            val_type = list
+        if val_type is list:
+            if not all(isinstance(val, (int, float)) for val in value):
+                continue
+            if any(val != 0 for val in value[size:]):
+                continue
+            row = np.zeros(size)
+            row[:len(value[:size])] = value[:size]
+            mask = 0
+            for val in np.flatnonzero(row > float_info.epsilon).tolist():
+                mask |= 1 << val
+            if mask == 0:
+                continue
+            masks[i] = mask
+            as_set = utl.distr_to_strict_set(value)
+            if as_set is not None and len(as_set) == 1:
+                codes[i] = min(as_set)
+    return DexiPackedValues(codes, masks, size)
+
 class DexiValues:
     """A wrapper class around a ``DexiValue`` data element.
     An object of this class contains a DEXi value :py:attr:`dexipy.values.DexiValues.value`,
@@ -12,7 +12,6 @@ st.title("BPI Visualizations")
 st.markdown('---')
 
 year = st.selectbox('Please select year:', options=[2022, 2023, 2024], index=2)
-dexi_bpi.__model = dexi_bpi.select_year(year)
 
 domains = ['Political Pluralism', 'State Capacity', 'Fighting Crime', 'Socio-economic Development', 'Regional and International Relations', 'Environmental Sustainability', 'Political Pluralism']
 selected_domain = st.selectbox(label='Please select domain', options=domains, index=0)
@@ -22,7 +21,7 @@ with st.expander('Domain Description'):
 
 st.markdown('The values presented below are ordered such that zero represents the lowest possible value, one the second lowest possible value, etc. In addition, we present the scale values colored in an approprite color -- red being the worst value and green being the best possible value. In case you would like to see the data in a tabelar form, please use the expander below')
 
-df_vals, cat_vals = dexi_bpi.get_alternatives_domain(selected_domain)
+df_vals, cat_vals = dexi_bpi.cached_alternatives_domain(year, selected_domain)
 
 num_vals = len(cat_vals)
 columns = st.columns(num_vals)
@@ -46,10 +45,16 @@ with st.expander('Data Table'):
     st.table(df_vals)
 
 with st.expander('Table of Decision Rules'):
-    st.table(dexi_bpi.get_decision_table(selected_domain))
+    st.table(dexi_bpi.cached_decision_table(year, selected_domain))
+
+with st.expander('Trend Across Years'):
+    df_trend = dexi_bpi.cached_trend(selected_domain)
+    fig2 = px.line(df_trend, x='Year', y='Code', color='Country', markers=True, hover_data=['Label', 'Source'])
+    fig2.update_xaxes(tickvals=dexi_bpi.years)
+    st.plotly_chart(fig2)
 
 st.markdown('---')
 st.markdown('Here you can find valus of the subdomains and indicators for each country.')
 
 with st.expander('Data Table'):
-    st.table(dexi_bpi.get_data_table(selected_domain))
\ No newline at end of file
+    st.table(dexi_bpi.cached_data_table(year, selected_domain))
\ No newline at end of file
@@ -13,14 +13,13 @@ st.title("BPI Download Section")
 st.markdown('This page aims to open the model and results to the broader audience for inspection and further research. Please find below the datasets and the DEX project.')
 
 year = st.selectbox('Please select year:', options=[2022, 2023, 2024], index=2)
-dexi_bpi.__model = dexi_bpi.select_year(year)
 
 @st.cache_resource
 def convert_df(df):
     # IMPORTANT: Cache the conversion to prevent computation on every rerun
     return df.to_csv().encode('utf-8')
 
-df, _ = dexi_bpi.get_alternatives_domain('BPI')
+df, _ = dexi_bpi.cached_alternatives_domain(year, 'BPI')
 csv = convert_df(df)
 
 st.download_button(
@@ -31,7 +30,7 @@ st.download_button(
 )
 
 
-df_all = dexi_bpi.get_data_table('root')
+df_all = dexi_bpi.cached_data_table(year, 'root')
 csv = convert_df(df_all)
 
 st.download_button(
@@ -41,13 +40,23 @@ st.download_button(
     mime='text/csv',
 )
 
+df_panel = dexi_bpi.cached_panel_frame()
+csv = convert_df(df_panel)
+
+st.download_button(
+    label="Download the Data for All Years",
+    data=csv,
+    file_name='all_years_data.csv',
+    mime='text/csv',
+)
+
 st.markdown('---')
 st.markdown('In case you would like to download a table of decision rules, please select an attribute from the dropdown menu, and press the download button.')
 
 domains = ['BPI', 'Positive Peace Domains', 'Negative Peace Domains', 'Political Pluralism', 'State Capacity', 'Fighting Crime', 'Socio-economic Development', 'Regional and International Relations', 'Environmental Sustainability', 'Political Pluralism']
 selected_domain = st.selectbox(label='Please select domain', options=domains, index=3)
 
-df_rules = dexi_bpi.get_decision_table(selected_domain)
+df_rules = dexi_bpi.cached_decision_table(year, selected_domain)
 csv = convert_df(df_rules)
 
 st.download_button(
@@ -58,11 +67,10 @@ st.download_button(
 )
 
 st.markdown('In case you would like to go deeper in the DEX model and get rules for the subdomains and indicators, please use the dropdown menu below.')
-atts = dexi_bpi.__flatten(dexi_bpi.__get_children_for_domain(selected_domain))
-atts = dexi_bpi.return_aggregate_attributes(atts)
+atts = dexi_bpi.cached_aggregate_attributes(year, selected_domain)
 selected_att = st.selectbox(label='Please select attribute', options=atts, index=0)
 
-df_rules = dexi_bpi.get_decision_table(selected_att)
+df_rules = dexi_bpi.cached_decision_table(year, selected_att)
 csv = convert_df(df_rules)
 
 st.download_button(